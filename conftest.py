@@ -0,0 +1,79 @@
+import os.path
+from typing import Iterator, List
+
+from _pytest.config import Config
+from _pytest.config.argparsing import Parser
+from _pytest.fixtures import FixtureRequest
+from _pytest.nodes import Item
+import pytest
+
+from runner.benchmark import Benchmark, BaselineStore, DEFAULT_THRESHOLD
+from runner.benchmark import matches_any, MIN_BASELINE
+
+BENCH_FILE = 'bench.py'
+
+
+def pytest_addoption(parser: Parser) -> None:
+    group = parser.getgroup('benchmark')
+    group.addoption(
+        '--benchmark', action='store_true',
+        help=f'run only the {BENCH_FILE} performance suites',
+    )
+    group.addoption(
+        '--benchmark-save', action='store_true',
+        help='store the timings of benchmarks that have no baseline yet',
+    )
+    group.addoption(
+        '--benchmark-update', metavar='NODEID', action='append', default=[],
+        help='replace the baselines of benchmarks whose node id is NODEID '
+             'or matches it as a glob, e.g. "day08/*"; may be repeated and '
+             'implies --benchmark-save',
+    )
+    group.addoption(
+        '--benchmark-threshold', type=float, default=DEFAULT_THRESHOLD,
+        help='fail benchmarks slower than this multiple of their baseline, '
+             f'or of {MIN_BASELINE * 1e6:.0f}us for faster baselines '
+             f'(default: {DEFAULT_THRESHOLD})',
+    )
+
+
+def pytest_collection_modifyitems(config: Config, items: List[Item]) -> None:
+    run_benchmarks = config.getoption('--benchmark')
+    selected = []
+    deselected = []
+    for item in items:
+        is_benchmark = os.path.basename(str(item.fspath)) == BENCH_FILE
+        if is_benchmark:
+            item.add_marker(pytest.mark.benchmark)
+        if is_benchmark == run_benchmarks:
+            selected.append(item)
+        else:
+            deselected.append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.fixture(scope='session')
+def benchmark_store(request: FixtureRequest) -> Iterator[BaselineStore]:
+    store = BaselineStore.load()
+    yield store
+    update: List[str] = request.config.getoption('--benchmark-update')
+    if request.config.getoption('--benchmark-save') or update:
+        store.save(update=update)
+
+
+@pytest.fixture
+def benchmark(
+    request: FixtureRequest,
+    benchmark_store: BaselineStore,
+) -> Benchmark:
+    return Benchmark(
+        request.node.nodeid,
+        benchmark_store,
+        threshold=request.config.getoption('--benchmark-threshold'),
+        compare=not matches_any(
+            request.node.nodeid,
+            request.config.getoption('--benchmark-update'),
+        ),
+    )
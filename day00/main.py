@@ -1,15 +1,31 @@
 import os.path
+from typing import Tuple
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
 
+def parse_input(raw_input: str) -> Tuple[str, str]:
+    line_1, line_2 = raw_input.splitlines(keepends=True)
+    return line_1, line_2
+
+
+def solve_1(lines: Tuple[str, str]) -> str:
+    return lines[0]
+
+
+def solve_2(lines: Tuple[str, str]) -> str:
+    return lines[1]
+
+
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        answer_1, answer_2 = f.readlines()
+        lines = parse_input(f.read())
 
+    answer_1 = solve_1(lines)
     assert answer_1 == 'hello\n'
     print(answer_1)
 
+    answer_2 = solve_2(lines)
     assert answer_2 == 'there\n'
     print(answer_2)
 
@@ -0,0 +1,31 @@
+import pytest
+
+from runner.benchmark import Benchmark
+
+from . import generate, main
+
+
+@pytest.mark.parametrize('size', [100, 1_000, 3_000, 100_000])
+def test_solution_1(benchmark: Benchmark, size: int) -> None:
+    expenses = main.parse_input(generate.generate(size))
+    benchmark(lambda: main.solution_1(expenses))
+
+
+@pytest.mark.parametrize('size', [25, 50, 100, 1_000])
+def test_solution_2(benchmark: Benchmark, size: int) -> None:
+    expenses = main.parse_input(generate.generate(size))
+    benchmark(lambda: main.solution_2(expenses))
+
+
+@pytest.mark.parametrize('n_targets', [1, 100])
+def test_expense_index_pairs(benchmark: Benchmark, n_targets: int) -> None:
+    index = main.ExpenseIndex(main.parse_input(generate.generate(10_000)))
+    targets = list(range(2020, 2020 + n_targets))
+    benchmark(lambda: index.pairs(targets))
+
+
+@pytest.mark.parametrize('n_targets', [1, 100])
+def test_expense_index_triples(benchmark: Benchmark, n_targets: int) -> None:
+    index = main.ExpenseIndex(main.parse_input(generate.generate(1_000)))
+    targets = list(range(2020, 2020 + n_targets))
+    benchmark(lambda: index.triples(targets))
@@ -0,0 +1,39 @@
+from itertools import combinations
+import random
+from typing import List
+
+TARGET = 2020
+
+
+def _planted(rng: random.Random) -> List[int]:
+    while True:
+        low = rng.randint(1, TARGET // 2 - 1)
+        x, y = rng.sample(range(1, TARGET // 3), 2)
+        planted = [low, TARGET - low, x, y, TARGET - x - y]
+        pairs = [c for c in combinations(planted, 2) if sum(c) == TARGET]
+        triples = [c for c in combinations(planted, 3) if sum(c) == TARGET]
+        if len(pairs) == 1 and len(triples) == 1:
+            return planted
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    An expense report of size lines with exactly one pair and exactly one
+    triple summing to 2020. Filler entries are all above 1010 so they can
+    never be part of a matching pair or triple with each other.
+    """
+    if size < 5:
+        raise ValueError(f"size must be at least 5: got {size}")
+    rng = random.Random(seed)
+    planted = _planted(rng)
+    forbidden = (
+        {TARGET - p for p in planted} |
+        {TARGET - p - q for p, q in combinations(planted, 2)}
+    )
+    expenses = list(planted)
+    while len(expenses) < size:
+        filler = rng.randint(TARGET // 2 + 1, max(10 * size, 10 * TARGET))
+        if filler not in forbidden:
+            expenses.append(filler)
+    rng.shuffle(expenses)
+    return ''.join(f'{expense}\n' for expense in expenses)
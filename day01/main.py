@@ -1,43 +1,258 @@
-from itertools import combinations
+from collections import Counter, defaultdict
+from itertools import combinations, islice
+from math import prod
 import os.path
-from typing import List
+from typing import DefaultDict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from runner.stream import iter_lines, Source
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
+TARGET = 2020
 
-def solution_1(expenses: List[int]) -> int:
-    products = [
-        ex1 * ex2
-        for ex1, ex2 in combinations(expenses, 2)
-        if ex1 + ex2 == 2020
-    ]
 
-    assert len(products) == 1
-    answer = products[0]
-    return answer
+def _pair_sums(
+    values: Sequence[int],
+    target: int,
+) -> Iterator[Tuple[int, int]]:
+    "Hash lookups, O(n)"
+    counts = Counter(values)
+    for value in sorted(counts):
+        complement = target - value
+        if complement < value:
+            break
+        if complement in counts and (
+            complement != value or counts[value] > 1
+        ):
+            yield value, complement
+
+
+def _triple_sums(
+    values: Sequence[int],
+    target: int,
+) -> Iterator[Tuple[int, int, int]]:
+    "Sort and close in with two pointers, O(n^2)"
+    ordered = sorted(values)
+    n = len(ordered)
+    for i in range(n - 2):
+        if i > 0 and ordered[i] == ordered[i - 1]:
+            continue
+        lo, hi = i + 1, n - 1
+        while lo < hi:
+            total = ordered[i] + ordered[lo] + ordered[hi]
+            if total < target:
+                lo += 1
+            elif total > target:
+                hi -= 1
+            else:
+                yield ordered[i], ordered[lo], ordered[hi]
+                lo += 1
+                while lo < hi and ordered[lo] == ordered[lo - 1]:
+                    lo += 1
+                hi -= 1
+
+
+def _meet_in_the_middle(
+    values: Sequence[int],
+    target: int,
+    k: int,
+) -> Iterator[Tuple[int, ...]]:
+    """
+    Sums of the lowest half of the indices of every k-combination are
+    tabled, then looked up from the sums of the upper half, O(n^ceil(k/2)).
+    Splitting on index order finds each combination exactly once.
+    """
+    ordered = sorted(values)
+    n_low = k // 2
+    lows: DefaultDict[int, List[Tuple[int, ...]]] = defaultdict(list)
+    for low in combinations(range(len(ordered)), n_low):
+        lows[sum(ordered[i] for i in low)].append(low)
+    seen: Set[Tuple[int, ...]] = set()
+    for high in combinations(range(len(ordered)), k - n_low):
+        high_sum = sum(ordered[i] for i in high)
+        for low in lows.get(target - high_sum, []):
+            if low[-1] >= high[0]:
+                continue
+            match = tuple(ordered[i] for i in low + high)
+            if match not in seen:
+                seen.add(match)
+                yield match
+
+
+def iter_k_sums(
+    values: Sequence[int],
+    target: int,
+    k: int,
+) -> Iterator[Tuple[int, ...]]:
+    """
+    Every distinct ascending k-tuple of values summing to target, where a
+    value may be used as many times as it occurs.
+    """
+    if k < 0:
+        raise ValueError(f"k must not be negative, got {k}")
+    if k > len(values):
+        return
+    if k == 0:
+        if target == 0:
+            yield ()
+    elif k == 1:
+        if target in values:
+            yield (target,)
+    elif k == 2:
+        yield from _pair_sums(values, target)
+    elif k == 3:
+        yield from _triple_sums(values, target)
+    else:
+        yield from _meet_in_the_middle(values, target, k)
+
+
+def k_sum(
+    values: Sequence[int],
+    target: int,
+    k: int,
+    first: bool = False,
+) -> List[Tuple[int, ...]]:
+    "All matching tuples, or just the first one found when first is set"
+    matches = iter_k_sums(values, target, k)
+    return list(islice(matches, 1) if first else matches)
+
+
+class ExpenseIndex:
+    """
+    Expenses sorted once into an array of distinct values and a table of how
+    often each occurs, answering pair and triple queries for whole batches
+    of targets with vectorized searchsorted. Matches follow k_sum: distinct
+    ascending tuples using each value at most as often as it occurs.
+    """
+    # bounds the targets x values intermediates of one vectorized step
+    MAX_BLOCK = 1 << 22
+
+    def __init__(self, expenses: Iterable[int]) -> None:
+        values, counts = np.unique(
+            np.fromiter(expenses, dtype=np.int64), return_counts=True
+        )
+        self.values: npt.NDArray[np.int64] = values
+        self.counts: npt.NDArray[np.int64] = counts.astype(np.int64)
+
+    def __len__(self) -> int:
+        return int(self.counts.sum())
+
+    def _lookup(
+        self,
+        wanted: npt.NDArray[np.int64],
+    ) -> Tuple[npt.NDArray[np.bool_], npt.NDArray[np.int64]]:
+        "Whether each wanted value is present, and its count if so"
+        positions = np.searchsorted(self.values, wanted)
+        positions = np.minimum(positions, len(self.values) - 1)
+        found = self.values[positions] == wanted
+        return found, np.where(found, self.counts[positions], 0)
+
+    def _target_blocks(
+        self,
+        targets: Sequence[int],
+        width: int,
+    ) -> Iterator[Tuple[int, npt.NDArray[np.int64]]]:
+        block = max(1, self.MAX_BLOCK // max(width, 1))
+        target_array = np.asarray(targets, dtype=np.int64)
+        for start in range(0, len(target_array), block):
+            yield start, target_array[start:start + block, np.newaxis]
+
+    def pairs(self, targets: Sequence[int]) -> List[List[Tuple[int, int]]]:
+        "The matching pairs of every target, in the order of targets"
+        matches: List[List[Tuple[int, int]]] = [[] for _ in targets]
+        if len(self.values) == 0:
+            return matches
+        values = self.values[np.newaxis, :]
+        for start, block in self._target_blocks(targets, len(self.values)):
+            complements = block - values
+            found, complement_counts = self._lookup(complements)
+            ok = found & (complements >= values) & (
+                (complements != values) | (complement_counts >= 2)
+            )
+            for row, col in zip(*np.nonzero(ok)):
+                matches[start + row].append(
+                    (int(self.values[col]), int(complements[row, col]))
+                )
+        return matches
+
+    def triples(
+        self,
+        targets: Sequence[int],
+    ) -> List[List[Tuple[int, int, int]]]:
+        """
+        The matching triples of every target. Each distinct smallest value
+        takes one vectorized step over all targets and the values above it.
+        """
+        matches: List[List[Tuple[int, int, int]]] = [[] for _ in targets]
+        if len(self.values) == 0 or len(targets) == 0:
+            return matches
+        max_target = max(targets)
+        for i, first in enumerate(self.values):
+            if 3 * first > max_target:
+                break
+            seconds = self.values[np.newaxis, i:]
+            second_counts = self.counts[np.newaxis, i:]
+            for start, block in self._target_blocks(
+                targets, seconds.shape[1]
+            ):
+                thirds = block - first - seconds
+                found, _ = self._lookup(thirds)
+                ok = (
+                    found & (thirds >= seconds) &
+                    (
+                        1 + (seconds == first) + (thirds == first) <=
+                        self.counts[i]
+                    ) &
+                    (
+                        (seconds == first) |
+                        (1 + (thirds == seconds) <= second_counts)
+                    )
+                )
+                for row, col in zip(*np.nonzero(ok)):
+                    matches[start + row].append((
+                        int(first),
+                        int(seconds[0, col]),
+                        int(thirds[row, col]),
+                    ))
+        return matches
+
+
+def solution_1(expenses: List[int]) -> int:
+    matches = k_sum(expenses, TARGET, 2)
+    assert len(matches) == 1
+    return prod(matches[0])
 
 
 def solution_2(expenses: List[int]) -> int:
-    products = [
-        ex1 * ex2 * ex3
-        for ex1, ex2, ex3 in combinations(expenses, 3)
-        if ex1 + ex2 + ex3 == 2020
-    ]
+    matches = k_sum(expenses, TARGET, 3)
+    assert len(matches) == 1
+    return prod(matches[0])
+
+
+def parse_input(raw_input: Source) -> List[int]:
+    return [int(line) for line in iter_lines(raw_input)]
+
+
+def solve_1(expenses: List[int]) -> int:
+    return solution_1(expenses)
+
 
-    assert len(products) == 1
-    answer = products[0]
-    return answer
+def solve_2(expenses: List[int]) -> int:
+    return solution_2(expenses)
 
 
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        expenses = [int(line) for line in f.readlines()]
+        expenses = parse_input(f)
 
-    answer_1 = solution_1(expenses)
+    answer_1 = solve_1(expenses)
     assert answer_1 == 485739
     print(answer_1)
 
-    answer_2 = solution_2(expenses)
+    answer_2 = solve_2(expenses)
     assert answer_2 == 161109702
     print(answer_2)
 
@@ -1,4 +1,10 @@
-from . import main
+from itertools import combinations
+import random
+from typing import List, Tuple
+
+import pytest
+
+from . import generate, main
 
 
 EXPENSES = [
@@ -21,3 +27,70 @@ def test_solution_1() -> None:
 
 def test_solution_2() -> None:
     assert main.solution_2(EXPENSES) == 241861950
+
+
+def test_generate() -> None:
+    expenses = main.parse_input(generate.generate(50, seed=1))
+    assert len(expenses) == 50
+    main.solve_1(expenses)
+    main.solve_2(expenses)
+
+
+def brute_force_k_sum(
+    values: List[int],
+    target: int,
+    k: int,
+) -> List[Tuple[int, ...]]:
+    return sorted({
+        combination
+        for combination in combinations(sorted(values), k)
+        if sum(combination) == target
+    })
+
+
+@pytest.mark.parametrize('k', range(6))
+@pytest.mark.parametrize('seed', range(5))
+def test_k_sum(k: int, seed: int) -> None:
+    rng = random.Random(seed)
+    values = [rng.randint(-10, 20) for _ in range(12)]
+    target = rng.randint(0, 30)
+    assert sorted(main.k_sum(values, target, k)) == brute_force_k_sum(
+        values, target, k
+    )
+
+
+def test_k_sum_first() -> None:
+    assert main.k_sum(EXPENSES, 2020, 2, first=True) == [(299, 1721)]
+    assert main.k_sum(EXPENSES, 1, 3, first=True) == []
+    with pytest.raises(ValueError):
+        main.k_sum(EXPENSES, 2020, -1)
+
+
+def test_k_sum_repeated_values() -> None:
+    assert main.k_sum([1010, 5, 1010], 2020, 2) == [(1010, 1010)]
+    assert main.k_sum([1010, 5], 2020, 2) == []
+    assert main.k_sum([1, 1, 1, 1, 2], 4, 4) == [(1, 1, 1, 1)]
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_expense_index(seed: int) -> None:
+    rng = random.Random(seed)
+    values = [rng.randint(-5, 25) for _ in range(15)]
+    targets = [rng.randint(-5, 40) for _ in range(10)]
+    index = main.ExpenseIndex(values)
+    assert len(index) == len(values)
+    assert [sorted(matches) for matches in index.pairs(targets)] == [
+        sorted(main.k_sum(values, target, 2)) for target in targets
+    ]
+    assert [sorted(matches) for matches in index.triples(targets)] == [
+        sorted(main.k_sum(values, target, 3)) for target in targets
+    ]
+
+
+def test_expense_index_example() -> None:
+    index = main.ExpenseIndex(EXPENSES)
+    assert index.pairs([2020, 1, 1958]) == [[(299, 1721)], [], []]
+    assert main.ExpenseIndex([979, 979]).pairs([1958]) == [[(979, 979)]]
+    assert index.triples([2020]) == [[(366, 675, 979)]]
+    assert main.ExpenseIndex([]).pairs([0]) == [[]]
+    assert main.ExpenseIndex([]).triples([0]) == [[]]
@@ -0,0 +1,16 @@
+import random
+from string import ascii_lowercase
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    letters = ascii_lowercase[:rng.randint(3, len(ascii_lowercase))]
+    lines = []
+    for _ in range(size):
+        length = rng.randint(2, 20)
+        password = ''.join(rng.choice(letters) for _ in range(length))
+        lower = rng.randint(1, length - 1)
+        upper = rng.randint(lower + 1, length)
+        character = rng.choice(letters)
+        lines.append(f'{lower}-{upper} {character}: {password}\n')
+    return ''.join(lines)
@@ -1,6 +1,13 @@
 from dataclasses import dataclass
 import os.path
-from typing import NewType, Tuple
+from typing import (
+    BinaryIO, Callable, Dict, Iterator, Mapping, NewType, Tuple,
+)
+
+import numpy as np
+import numpy.typing as npt
+
+from runner.stream import iter_lines, Source
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
@@ -28,18 +35,31 @@ def check_password(password: Password, policy: Policy) -> bool:
     return policy.lower <= password.count(policy.character) <= policy.upper
 
 
-def parse_line(line: str) -> Tuple[Policy, Password]:
-    _range, char_part, raw_password = line.split(' ', 2)
+@dataclass(frozen=True)
+class PolicyRecord:
+    "The raw fields of a line, before a policy gives the numbers meaning"
+    first: int
+    second: int
+    character: str
+    password: Password
 
-    raw_lower, raw_upper = _range.split('-', 1)
-    lower, upper = int(raw_lower), int(raw_upper)
+
+def parse_record(line: str) -> PolicyRecord:
+    _numbers, char_part, raw_password = line.split(' ', 2)
+
+    raw_first, raw_second = _numbers.split('-', 1)
     assert len(char_part) == 2
-    char = char_part[0]
-    policy = Policy(lower=lower, upper=upper, character=char)
+    return PolicyRecord(
+        int(raw_first), int(raw_second), char_part[0], Password(raw_password)
+    )
 
-    password = Password(raw_password)
 
-    return policy, password
+def parse_line(line: str) -> Tuple[Policy, Password]:
+    record = parse_record(line)
+    policy = Policy(
+        lower=record.first, upper=record.second, character=record.character
+    )
+    return policy, record.password
 
 
 @dataclass
@@ -63,41 +83,246 @@ def check_password_v2(password: Password, policy: PolicyV2) -> bool:
 
 
 def parse_line_v2(line: str) -> Tuple[PolicyV2, Password]:
-    _idxs, char_part, raw_password = line.split(' ', 2)
+    record = parse_record(line)
+    policy = PolicyV2(
+        index1=record.first, index2=record.second, character=record.character
+    )
+    return policy, record.password
+
+
+PolicyChecker = Callable[[PolicyRecord], bool]
+
+POLICY_CHECKERS: Dict[str, PolicyChecker] = {}
+
+
+def register_policy(name: str) -> Callable[[PolicyChecker], PolicyChecker]:
+    "Adds a checker to those count_valid evaluates by default"
+    def decorator(checker: PolicyChecker) -> PolicyChecker:
+        if name in POLICY_CHECKERS:
+            raise ValueError(f"policy {name} is already registered")
+        POLICY_CHECKERS[name] = checker
+        return checker
+    return decorator
+
+
+@register_policy('count_range')
+def check_count_range(record: PolicyRecord) -> bool:
+    return check_password(
+        record.password,
+        Policy(record.first, record.second, record.character),
+    )
+
+
+@register_policy('positional_xor')
+def check_positional_xor(record: PolicyRecord) -> bool:
+    return check_password_v2(
+        record.password,
+        PolicyV2(record.first, record.second, record.character),
+    )
+
+
+def count_valid(
+    source: Source,
+    checkers: Mapping[str, PolicyChecker] = POLICY_CHECKERS,
+) -> Dict[str, int]:
+    """
+    How many lines each checker accepts, from one streaming pass that parses
+    every line once into a record shared by all of the checkers.
+    """
+    counts = dict.fromkeys(checkers, 0)
+    for line in iter_lines(source):
+        record = parse_record(line)
+        for name, checker in checkers.items():
+            counts[name] += checker(record)
+    return counts
+
+
+CHUNK_SIZE = 1 << 20
+
+
+def _first_at_or_after(
+    positions: npt.NDArray[np.intp],
+    starts: npt.NDArray[np.intp],
+    ends: npt.NDArray[np.intp],
+    what: str,
+) -> npt.NDArray[np.intp]:
+    indices = np.searchsorted(positions, starts)
+    if np.any(indices >= len(positions)):
+        raise ValueError(f"line without {what}")
+    found = positions[indices]
+    if np.any(found >= ends):
+        raise ValueError(f"line without {what}")
+    return found
 
-    raw_idx1, raw_idx2 = _idxs.split('-', 1)
-    idx1, idx2 = int(raw_idx1), int(raw_idx2)
-    assert len(char_part) == 2
-    char = char_part[0]
-    policy = PolicyV2(index1=idx1, index2=idx2, character=char)
 
-    password = Password(raw_password)
+def _parse_ints(
+    buffer: npt.NDArray[np.uint8],
+    starts: npt.NDArray[np.intp],
+    ends: npt.NDArray[np.intp],
+) -> npt.NDArray[np.int64]:
+    widths = ends - starts
+    if np.any(widths < 1):
+        raise ValueError("missing number")
+    values = np.zeros(len(starts), dtype=np.int64)
+    for offset in range(int(widths.max(initial=0))):
+        in_number = offset < widths
+        digits = buffer[np.where(in_number, starts + offset, 0)].astype(
+            np.int64
+        ) - ord('0')
+        if np.any(in_number & ((digits < 0) | (digits > 9))):
+            raise ValueError("invalid number")
+        values = np.where(in_number, values * 10 + digits, values)
+    return values
 
-    return policy, password
+
+@dataclass(frozen=True)
+class PasswordColumns:
+    """
+    A batch of policy lines as columns: the two numbers and character of
+    each policy, and the passwords packed end to end into one byte buffer,
+    password i being passwords[starts[i]:starts[i] + lengths[i]].
+    """
+    first: npt.NDArray[np.int64]
+    second: npt.NDArray[np.int64]
+    character: npt.NDArray[np.uint8]
+    passwords: npt.NDArray[np.uint8]
+    starts: npt.NDArray[np.intp]
+    lengths: npt.NDArray[np.intp]
+
+    @classmethod
+    def parse(cls, data: bytes) -> "PasswordColumns":
+        buffer = np.frombuffer(data.replace(b'\r', b''), dtype=np.uint8)
+        newlines = np.flatnonzero(buffer == ord('\n'))
+        if len(buffer) and buffer[-1] != ord('\n'):
+            newlines = np.append(newlines, len(buffer))
+        starts = np.concatenate(([0], newlines[:-1] + 1)).astype(np.intp)
+        ends = newlines.astype(np.intp)
+        non_blank = ends > starts
+        starts, ends = starts[non_blank], ends[non_blank]
+
+        dashes = _first_at_or_after(
+            np.flatnonzero(buffer == ord('-')), starts, ends, "'-'"
+        )
+        spaces = _first_at_or_after(
+            np.flatnonzero(buffer == ord(' ')), starts, ends, "' '"
+        )
+        colons = _first_at_or_after(
+            np.flatnonzero(buffer == ord(':')), starts, ends, "':'"
+        )
+        if np.any(
+            (dashes > spaces) | (colons != spaces + 2) |
+            (buffer[np.minimum(colons + 1, len(buffer) - 1)] != ord(' '))
+        ):
+            raise ValueError("lines must look like '1-3 a: abcde'")
+
+        password_starts = colons + 2
+        lengths = ends - password_starts
+        # +1 where each password opens and -1 where it closes, so the
+        # running sum is one over exactly the password bytes
+        boundaries = np.zeros(len(buffer) + 1, dtype=np.int8)
+        boundaries[password_starts] = 1
+        boundaries[ends] -= 1
+        in_password = np.cumsum(boundaries[:-1], dtype=np.int8)
+        return cls(
+            _parse_ints(buffer, starts, dashes),
+            _parse_ints(buffer, dashes + 1, spaces),
+            buffer[spaces + 1],
+            buffer[in_password.astype(np.bool_)],
+            (np.cumsum(lengths) - lengths).astype(np.intp),
+            lengths,
+        )
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+
+def iter_password_columns(
+    f: BinaryIO,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[PasswordColumns]:
+    "Columns for roughly chunk_size bytes of whole lines at a time"
+    rest = b''
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        chunk = rest + chunk
+        cut = chunk.rfind(b'\n') + 1
+        rest = chunk[cut:]
+        if cut:
+            yield PasswordColumns.parse(chunk[:cut])
+    if rest.strip():
+        yield PasswordColumns.parse(rest)
+
+
+def check_passwords(columns: PasswordColumns) -> npt.NDArray[np.bool_]:
+    "check_password over a whole batch"
+    if np.any(columns.first > columns.second):
+        raise ValueError("lower is larger than than upper")
+    matches = columns.passwords == np.repeat(
+        columns.character, columns.lengths
+    )
+    # reduceat can't sum an empty run, so only non-empty passwords take part
+    non_empty = columns.lengths > 0
+    counts = np.zeros(len(columns), dtype=np.int64)
+    if np.any(non_empty):
+        counts[non_empty] = np.add.reduceat(
+            matches, columns.starts[non_empty], dtype=np.int64
+        )
+    return (columns.first <= counts) & (counts <= columns.second)
+
+
+def check_passwords_v2(columns: PasswordColumns) -> npt.NDArray[np.bool_]:
+    "check_password_v2 over a whole batch"
+    def matches(index: npt.NDArray[np.int64]) -> npt.NDArray[np.bool_]:
+        in_password = (1 <= index) & (index <= columns.lengths)
+        if not np.all(in_password):
+            raise IndexError("policy index outside of password")
+        return (
+            columns.passwords[columns.starts + index - 1] == columns.character
+        )
+
+    return matches(columns.first) ^ matches(columns.second)
+
+
+def count_valid_columnar(f: BinaryIO) -> Tuple[int, int]:
+    "Both answers for an input of any size, a chunk of columns at a time"
+    valid, valid_v2 = 0, 0
+    for columns in iter_password_columns(f):
+        valid += int(np.count_nonzero(check_passwords(columns)))
+        valid_v2 += int(np.count_nonzero(check_passwords_v2(columns)))
+    return valid, valid_v2
+
+
+def parse_input(raw_input: Source) -> PasswordColumns:
+    if not isinstance(raw_input, str):
+        raw_input = '\n'.join(iter_lines(raw_input))
+    return PasswordColumns.parse(raw_input.encode())
+
+
+def solve_1(columns: PasswordColumns) -> int:
+    return int(np.count_nonzero(check_passwords(columns)))
+
+
+def solve_2(columns: PasswordColumns) -> int:
+    return int(np.count_nonzero(check_passwords_v2(columns)))
+
+
+def solve_stream(source: Source) -> Tuple[int, int]:
+    "Both answers in one pass over the lines, in constant memory"
+    counts = count_valid(source)
+    return counts['count_range'], counts['positional_xor']
 
 
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        policy_password_pairs = [
-            parse_line(line.strip()) for line in f.readlines()
-        ]
+        columns = parse_input(f)
 
-    answer_1 = sum(
-        1 for policy, password in policy_password_pairs
-        if check_password(password, policy)
-    )
+    answer_1 = solve_1(columns)
     assert answer_1 == 465
     print(answer_1)
 
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        policy_password_pairs_v2 = [
-            parse_line_v2(line.strip()) for line in f.readlines()
-        ]
-
-    answer_2 = sum(
-        1 for policy, password in policy_password_pairs_v2
-        if check_password_v2(password, policy)
-    )
+    answer_2 = solve_2(columns)
     assert answer_2 == 294
     print(answer_2)
 
@@ -1,6 +1,8 @@
+import io
+
 import pytest
 
-from . import main
+from . import generate, main
 
 
 def test_main() -> None:
@@ -89,3 +91,106 @@ def test_check_password_v2(
     match: bool,
 ) -> None:
     assert main.check_password_v2(password, policy) == match
+
+
+def test_generate() -> None:
+    database = main.parse_input(generate.generate(50, seed=1))
+    assert 0 <= main.solve_1(database) <= 50
+    assert 0 <= main.solve_2(database) <= 50
+
+
+def test_solve_stream() -> None:
+    raw_input = generate.generate(200, seed=2)
+    database = main.parse_input(raw_input)
+    assert main.solve_stream(raw_input.splitlines(keepends=True)) == (
+        main.solve_1(database), main.solve_2(database)
+    )
+
+
+def test_password_columns() -> None:
+    columns = main.PasswordColumns.parse(b'1-3 a: abcde\r\n\n12-14 b: cdb\n')
+    assert columns.first.tolist() == [1, 12]
+    assert columns.second.tolist() == [3, 14]
+    assert bytes(columns.character) == b'ab'
+    assert columns.lengths.tolist() == [5, 3]
+    assert columns.starts.tolist() == [0, 5]
+    assert bytes(columns.passwords) == b'abcdecdb'
+
+
+def test_password_columns_empty_password() -> None:
+    columns = main.PasswordColumns.parse(
+        b'1-1 a: \n0-0 b: \n1-2 c: cc\n1-3 d: \n'
+    )
+    assert columns.lengths.tolist() == [0, 0, 2, 0]
+    assert main.check_passwords(columns).tolist() == [
+        False, True, True, False
+    ]
+
+
+@pytest.mark.parametrize(
+    'line', (b'1-3 a abcde', b'1 a: abcde', b'1-x a: abcde', b'-3 a: abc')
+)
+def test_password_columns_malformed(line: bytes) -> None:
+    with pytest.raises(ValueError):
+        main.PasswordColumns.parse(line)
+
+
+def test_check_passwords() -> None:
+    raw_input = generate.generate(500, seed=3)
+    columns = main.parse_input(raw_input)
+    lines = raw_input.splitlines()
+    assert main.check_passwords(columns).tolist() == [
+        main.check_password(password, policy)
+        for policy, password in map(main.parse_line, lines)
+    ]
+    assert main.check_passwords_v2(columns).tolist() == [
+        main.check_password_v2(password, policy)
+        for policy, password in map(main.parse_line_v2, lines)
+    ]
+
+
+def test_check_passwords_invalid_policy() -> None:
+    with pytest.raises(ValueError):
+        main.check_passwords(main.PasswordColumns.parse(b'3-1 a: abc\n'))
+    with pytest.raises(IndexError):
+        main.check_passwords_v2(main.PasswordColumns.parse(b'1-4 a: abc\n'))
+
+
+def test_count_valid_columnar() -> None:
+    raw_input = generate.generate(300, seed=4).encode()
+    columns = list(main.iter_password_columns(io.BytesIO(raw_input), 64))
+    assert len(columns) > 1
+    assert sum(len(chunk) for chunk in columns) == 300
+    parsed = main.parse_input(raw_input.decode())
+    assert main.count_valid_columnar(io.BytesIO(raw_input)) == (
+        main.solve_1(parsed), main.solve_2(parsed)
+    )
+
+
+def test_parse_record() -> None:
+    assert main.parse_record('1-3 a: abcde') == main.PolicyRecord(
+        1, 3, 'a', main.Password('abcde')
+    )
+
+
+def test_count_valid() -> None:
+    raw_input = generate.generate(200, seed=5)
+    parsed = main.parse_input(raw_input)
+    checkers = {
+        **main.POLICY_CHECKERS,
+        'long': lambda record: len(record.password) > 10,
+    }
+    counts = main.count_valid(io.StringIO(raw_input), checkers)
+    assert counts == {
+        'count_range': main.solve_1(parsed),
+        'positional_xor': main.solve_2(parsed),
+        'long': sum(
+            len(line.rsplit(' ', 1)[1]) > 10
+            for line in raw_input.splitlines()
+        ),
+    }
+
+
+def test_register_policy_twice() -> None:
+    with pytest.raises(ValueError):
+        main.register_policy('count_range')(main.check_count_range)
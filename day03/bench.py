@@ -0,0 +1,31 @@
+import pytest
+
+from runner.benchmark import Benchmark
+
+from . import generate, main
+
+
+@pytest.mark.parametrize('size', [1_000, 10_000])
+def test_parse_map(benchmark: Benchmark, size: int) -> None:
+    raw_map = generate.generate(size)
+    benchmark(lambda: main.parse_map(raw_map))
+
+
+@pytest.mark.parametrize('size', [1_000, 10_000])
+def test_trees_encountered(benchmark: Benchmark, size: int) -> None:
+    map_ = main.parse_map(generate.generate(size))
+    benchmark(lambda: main.trees_encountered(map_, 1, 3))
+
+
+@pytest.mark.parametrize('size', [1_000, 10_000])
+def test_prod_trees_encountered(benchmark: Benchmark, size: int) -> None:
+    map_ = main.parse_map(generate.generate(size))
+    slopes = [(1, 1), (1, 3), (1, 5), (1, 7), (2, 1)]
+    benchmark(lambda: main.prod_trees_encountered(map_, slopes))
+
+
+@pytest.mark.parametrize('n_slopes', [5, 100])
+def test_trees_for_slopes(benchmark: Benchmark, n_slopes: int) -> None:
+    map_ = main.parse_map(generate.generate(1_000))
+    slopes = [(1 + i % 3, i) for i in range(n_slopes)]
+    benchmark(lambda: main.trees_for_slopes(map_, slopes))
@@ -0,0 +1,11 @@
+import random
+
+
+def generate(size: int, seed: int = 0, width: int = 31) -> str:
+    "A forest of size rows, each width squares wide"
+    rng = random.Random(seed)
+    return ''.join(
+        ''.join('#' if rng.random() < 0.25 else '.' for _ in range(width)) +
+        '\n'
+        for _ in range(size)
+    )
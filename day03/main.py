@@ -2,10 +2,16 @@ from enum import Enum, auto
 from functools import reduce
 from operator import mul
 import os.path
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
+PARSE_BLOCK_ROWS = 1 << 16
+SLOPE_BLOCK_CELLS = 1 << 16
+
 
 class Terrain(Enum):
     OPEN = auto()
@@ -13,27 +19,80 @@ class Terrain(Enum):
 
 
 class Map:
-    def __init__(self, map_: List[List[Terrain]]):
+    """
+    The trees of each row packed eight cells to a byte, most significant bit
+    first, so a map takes an eighth of a byte per cell.
+    """
+    def __init__(self, packed_rows: npt.NDArray[np.uint8], n_cols: int):
+        if len(packed_rows) == 0:
+            raise ValueError('map_ must have at least 1 row: got 0')
+        if packed_rows.ndim != 2 or packed_rows.shape[1] != -(-n_cols // 8):
+            raise ValueError('all rows must have the same length')
+
+        self._packed = packed_rows
+        self._nrows = len(packed_rows)
+        self._ncols = n_cols
+
+    @classmethod
+    def from_terrain(cls, map_: List[List[Terrain]]) -> "Map":
         if len(map_) == 0:
             raise ValueError('map_ must have at least 1 row: got 0')
         first_row_len = len(map_[0])
         if not all(len(row) == first_row_len for row in map_):
             raise ValueError('all rows must have the same length')
-
-        self._map = map_
-        self._nrows = len(map_)
-        self._ncols = first_row_len
+        trees = np.array(
+            [[terrain is Terrain.TREE for terrain in row] for row in map_],
+            dtype=np.bool_,
+        ).reshape(len(map_), first_row_len)
+        return cls(np.packbits(trees, axis=1), first_row_len)
+
+    def trees_at(
+        self,
+        rows: npt.NDArray[np.intp],
+        cols: npt.NDArray[np.intp],
+    ) -> npt.NDArray[np.uint8]:
+        "1 where there is a tree, gathered for many cells at once"
+        cols = cols % self._ncols
+        packed = self._packed[rows, cols >> 3]
+        return (packed >> (7 - (cols & 7)).astype(np.uint8)) & 1
 
     def __getitem__(self, where: Tuple[int, int]) -> Terrain:
         row, col = where
-        return self._map[row][col % self._ncols]
+        col %= self._ncols
+        is_tree = self._packed[row, col >> 3] >> (7 - (col & 7)) & 1
+        return Terrain.TREE if is_tree else Terrain.OPEN
 
     def __len__(self) -> int:
         return self._nrows
 
+    @property
+    def width(self) -> int:
+        return self._ncols
+
 
 def parse_map(raw_map: str) -> Map:
-    return Map([parse_row(row) for row in raw_map.split()])
+    "Reads the rows straight from the bytes, a block of rows at a time"
+    data = raw_map.strip().replace('\r', '').encode()
+    if not data:
+        raise ValueError('map_ must have at least 1 row: got 0')
+    n_cols = data.find(b'\n') if b'\n' in data else len(data)
+    if len(data) % (n_cols + 1) != n_cols:
+        raise ValueError('all rows must have the same length')
+    n_rows = (len(data) + 1) // (n_cols + 1)
+    cells = np.frombuffer(data + b'\n', dtype=np.uint8).reshape(
+        n_rows, n_cols + 1
+    )
+    if np.any(cells[:, -1] != ord('\n')):
+        raise ValueError('all rows must have the same length')
+    packed = np.empty((n_rows, -(-n_cols // 8)), dtype=np.uint8)
+    for start in range(0, n_rows, PARSE_BLOCK_ROWS):
+        block = cells[start:start + PARSE_BLOCK_ROWS, :-1]
+        trees = block == ord('#')
+        invalid = ~trees & (block != ord('.'))
+        if np.any(invalid):
+            parse_terrain(chr(block[invalid][0]))
+        packed[start:start + PARSE_BLOCK_ROWS] = np.packbits(trees, axis=1)
+    return Map(packed, n_cols)
 
 
 def parse_row(raw_row: str) -> List[Terrain]:
@@ -48,34 +107,81 @@ def parse_terrain(raw_terrain: str) -> Terrain:
     raise ValueError(f"raw_terrain should be '.' or '#': got {raw_terrain}")
 
 
+def _sled_cells(
+    map_: Map,
+    d_row: int,
+    d_col: int,
+) -> Tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    steps = np.arange(len(map_) // d_row, dtype=np.intp)
+    return steps * d_row, steps * d_col
+
+
 def sled_at_angle(map_: Map, d_row: int, d_col: int) -> List[Terrain]:
-    return [map_[k * d_row, k * d_col] for k in range(len(map_) // d_row)]
+    return [
+        Terrain.TREE if is_tree else Terrain.OPEN
+        for is_tree in map_.trees_at(*_sled_cells(map_, d_row, d_col))
+    ]
 
 
 def trees_encountered(map_: Map, d_row: int, d_col: int) -> int:
-    path = sled_at_angle(map_, d_row, d_col)
-    return sum(1 for terrain in path if terrain == Terrain.TREE)
+    return int(map_.trees_at(*_sled_cells(map_, d_row, d_col)).sum())
+
+
+def trees_for_slopes(
+    map_: Map,
+    slopes: Sequence[Tuple[int, int]],
+) -> npt.NDArray[np.int64]:
+    """
+    The trees encountered on every slope. Slopes dropping the same number of
+    rows visit the same rows, so each such group is gathered from the packed
+    map as one rows x slopes block and summed along the rows, rather than
+    walking a path per slope.
+    """
+    slope_array = np.array(slopes, dtype=np.intp).reshape(-1, 2)
+    if np.any(slope_array[:, 0] < 1):
+        raise ValueError('slopes must move down at least one row')
+    counts = np.zeros(len(slope_array), dtype=np.int64)
+    for d_row in np.unique(slope_array[:, 0]).tolist():
+        members = np.flatnonzero(slope_array[:, 0] == d_row)
+        steps = np.arange(len(map_) // d_row, dtype=np.intp)
+        block = max(1, SLOPE_BLOCK_CELLS // max(len(steps), 1))
+        for start in range(0, len(members), block):
+            group = members[start:start + block]
+            cols = slope_array[group, 1:] * steps
+            rows = np.broadcast_to(steps * d_row, cols.shape)
+            trees = map_.trees_at(rows, cols)
+            counts[group] = trees.sum(axis=1, dtype=np.int64)
+    return counts
 
 
 def prod_trees_encountered(map_: Map, slopes: List[Tuple[int, int]]) -> int:
     return reduce(
-        mul,
-        (trees_encountered(map_, d_row, d_col) for d_row, d_col in slopes),
-        1,
+        mul, (int(count) for count in trees_for_slopes(map_, slopes)), 1
     )
 
 
+def parse_input(raw_input: str) -> Map:
+    return parse_map(raw_input)
+
+
+def solve_1(map_: Map) -> int:
+    return trees_encountered(map_, 1, 3)
+
+
+def solve_2(map_: Map) -> int:
+    slopes = [(1, 1), (1, 3), (1, 5), (1, 7), (2, 1)]
+    return prod_trees_encountered(map_, slopes)
+
+
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        raw_map = f.read()
-    map_ = parse_map(raw_map)
+        map_ = parse_input(f.read())
 
-    answer_1 = trees_encountered(map_, 1, 3)
+    answer_1 = solve_1(map_)
     assert answer_1 == 189
     print(answer_1)
 
-    slopes = [(1, 1), (1, 3), (1, 5), (1, 7), (2, 1)]
-    answer_2 = prod_trees_encountered(map_, slopes)
+    answer_2 = solve_2(map_)
     assert answer_2 == 1718180100
     print(answer_2)
 
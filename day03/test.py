@@ -1,4 +1,8 @@
-from . import main
+import random
+
+import pytest
+
+from . import generate, main
 
 RAW_TEST_MAP = """
 ..##.......
@@ -27,3 +31,55 @@ def test_trees_encountered() -> None:
 def test_prod_trees_encountered() -> None:
     slopes = [(1, 1), (1, 3), (1, 5), (1, 7), (2, 1)]
     assert main.prod_trees_encountered(TEST_MAP, slopes) == 336
+
+
+def test_generate() -> None:
+    map_ = main.parse_input(generate.generate(50, seed=1, width=11))
+    assert len(map_) == 50
+    assert 0 <= main.solve_1(map_) <= 50
+
+
+def test_parse_map_packs_rows() -> None:
+    rows = [main.parse_row(raw_row) for raw_row in RAW_TEST_MAP.split()]
+    from_terrain = main.Map.from_terrain(rows)
+    assert TEST_MAP.width == from_terrain.width == 11
+    for row_num, row in enumerate(rows):
+        for col_num, terrain in enumerate(row):
+            assert TEST_MAP[row_num, col_num] == terrain
+            assert from_terrain[row_num, col_num + 11] == terrain
+
+
+@pytest.mark.parametrize(
+    'raw_map', ('', '..#\n.#', '..#\n.x.', '..#\n.#..')
+)
+def test_parse_map_invalid(raw_map: str) -> None:
+    with pytest.raises(ValueError):
+        main.parse_map(raw_map)
+
+
+def test_sled_at_angle() -> None:
+    assert main.sled_at_angle(TEST_MAP, 2, 1) == [
+        main.Terrain.OPEN, main.Terrain.TREE, main.Terrain.OPEN,
+        main.Terrain.TREE, main.Terrain.OPEN,
+    ]
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_trees_for_slopes(seed: int) -> None:
+    rng = random.Random(seed)
+    map_ = main.parse_input(generate.generate(200, seed=seed, width=13))
+    slopes = [(rng.randint(1, 7), rng.randint(0, 40)) for _ in range(50)]
+    slopes.append((201, 3))
+    assert main.trees_for_slopes(map_, slopes).tolist() == [
+        main.trees_encountered(map_, d_row, d_col)
+        for d_row, d_col in slopes
+    ]
+
+
+def test_trees_for_slopes_edges() -> None:
+    assert main.trees_for_slopes(TEST_MAP, []).tolist() == []
+    assert main.trees_for_slopes(TEST_MAP, [(1, 3), (1, 3)]).tolist() == [
+        7, 7
+    ]
+    with pytest.raises(ValueError):
+        main.trees_for_slopes(TEST_MAP, [(0, 1)])
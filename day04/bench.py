@@ -0,0 +1,39 @@
+import pytest
+
+from runner.benchmark import Benchmark
+
+from . import generate, main
+
+
+@pytest.mark.parametrize('size', [1_000, 10_000])
+def test_parse_input(benchmark: Benchmark, size: int) -> None:
+    raw_input = generate.generate(size)
+    benchmark(lambda: main.parse_input(raw_input))
+
+
+@pytest.mark.parametrize('size', [1_000, 10_000])
+def test_solve_1(benchmark: Benchmark, size: int) -> None:
+    parsed = main.parse_input(generate.generate(size))
+    benchmark(lambda: main.solve_1(parsed))
+
+
+@pytest.mark.parametrize('size', [1_000, 10_000])
+def test_solve_2(benchmark: Benchmark, size: int) -> None:
+    parsed = main.parse_input(generate.generate(size))
+    benchmark(lambda: main.solve_2(parsed))
+
+
+@pytest.mark.parametrize('size', [1_000, 10_000])
+def test_solve_stream(benchmark: Benchmark, size: int) -> None:
+    raw_input = generate.generate(size)
+    benchmark(lambda: main.solve_stream(raw_input))
+
+
+@pytest.mark.parametrize('validator', ['hand_written', 'schema'])
+def test_strict_validation(benchmark: Benchmark, validator: str) -> None:
+    passports = main.parse_input(generate.generate(10_000))
+    validate = {
+        'hand_written': main.strict_validate_passport,
+        'schema': main.validate_schema,
+    }[validator]
+    benchmark(lambda: [validate(passport) for passport in passports])
@@ -0,0 +1,60 @@
+import random
+from typing import Dict
+
+EYE_COLORS = ['amb', 'blu', 'brn', 'gry', 'grn', 'hzl', 'oth']
+
+
+def _valid_fields(rng: random.Random) -> Dict[str, str]:
+    if rng.random() < 0.5:
+        height = f'{rng.randint(150, 193)}cm'
+    else:
+        height = f'{rng.randint(59, 76)}in'
+    return {
+        'byr': str(rng.randint(1920, 2002)),
+        'iyr': str(rng.randint(2010, 2020)),
+        'eyr': str(rng.randint(2020, 2030)),
+        'hgt': height,
+        'hcl': '#' + ''.join(rng.choice('0123456789abcdef') for _ in range(6)),
+        'ecl': rng.choice(EYE_COLORS),
+        'pid': ''.join(rng.choice('0123456789') for _ in range(9)),
+        'cid': str(rng.randint(1, 999)),
+    }
+
+
+def _invalid_value(key: str, rng: random.Random) -> str:
+    return rng.choice({
+        'byr': ['1919', '2003', '19x0'],
+        'iyr': ['2009', '2021', ''],
+        'eyr': ['2019', '2031', '2o25'],
+        'hgt': ['149cm', '77in', '170', '60cn'],
+        'hcl': ['#12345g', '123456', '#1234567'],
+        'ecl': ['xry', 'blue', 'br'],
+        'pid': ['12345678', '0123456789', '12345678a'],
+        'cid': ['whatever'],
+    }[key])
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    A batch of size passports. Some are valid, some are missing required
+    fields and some have every field but at least one out of spec value.
+    """
+    rng = random.Random(seed)
+    records = []
+    for _ in range(size):
+        fields = _valid_fields(rng)
+        roll = rng.random()
+        if roll < 0.2:
+            del fields[rng.choice(list(fields))]
+        elif roll < 0.5:
+            key = rng.choice(list(fields))
+            fields[key] = _invalid_value(key, rng)
+        if rng.random() < 0.3:
+            fields.pop('cid', None)
+        items = [f'{key}:{value}' for key, value in fields.items()]
+        rng.shuffle(items)
+        records.append(''.join(
+            item + (rng.choice(' \n') if i < len(items) - 1 else '\n')
+            for i, item in enumerate(items)
+        ))
+    return '\n'.join(records)
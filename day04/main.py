@@ -1,89 +1,296 @@
+from dataclasses import dataclass
 import os.path
 import re
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, Iterator, List, Mapping, Tuple, Union
+
+from runner.stream import iter_lines, iter_records, Source
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
+REQUIRED_FIELDS = frozenset({'byr', 'iyr', 'eyr', 'hgt', 'hcl', 'ecl', 'pid'})
+INT_RE = re.compile(r'[0-9]+')
+HEIGHT_RE = re.compile(r'([0-9]+)(cm|in)')
+HEIGHT_RANGES = {'cm': (150, 193), 'in': (59, 76)}
+HAIR_COLOR_RE = re.compile(r'#[0-9a-f]{6}')
+EYE_COLOR_RE = re.compile(r'amb|blu|brn|gry|grn|hzl|oth')
+PASSPORT_ID_RE = re.compile(r'[0-9]{9}')
+
+Validator = Callable[[str], bool]
+PassportValidator = Callable[[Dict[str, str]], bool]
+
 
 def parse_records(document: str) -> List[Dict[str, str]]:
-    return [
-        parse_record(record)
-        for record in document.split('\n\n')
-    ]
+    return list(iter_passports(document))
 
 
 def parse_record(record: str) -> Dict[str, str]:
-    raw_fields = record.replace(' ', '\n').split()
-
-    def split_field(field: str) -> Tuple[str, str]:
-        key, value = field.split(':', 1)
-        return key, value
-    return dict(split_field(field) for field in raw_fields)
+    passport = {}
+    for field in record.split():
+        key, _, value = field.partition(':')
+        passport[key] = value
+    return passport
 
 
-def validate_passport(passport: Dict[str, str]) -> bool:
-    required_fields = {'byr', 'iyr', 'eyr', 'hgt', 'hcl', 'ecl', 'pid'}
-    return required_fields <= passport.keys()
+def iter_passports(source: Source) -> Iterator[Dict[str, str]]:
+    "Lazily parses one passport per blank line separated record"
+    for lines in iter_records(source):
+        yield parse_record(' '.join(lines))
 
 
-def strict_validate_passport(passport: Dict[str, str]) -> bool:
-    return (
-        validate_passport(passport) and
-        validate_int(passport.get('byr', ''), 1920, 2002) and
-        validate_int(passport.get('iyr', ''), 2010, 2020) and
-        validate_int(passport.get('eyr', ''), 2020, 2030) and
-        validate_height(passport.get('hgt', '')) and
-        validate_hair_color(passport.get('hcl', '')) and
-        validate_eye_color(passport.get('ecl', '')) and
-        validate_passport_id(passport.get('pid', ''))
-    )
+def validate_passport(passport: Dict[str, str]) -> bool:
+    return REQUIRED_FIELDS <= passport.keys()
 
 
 def validate_int(year: str, lower: int, upper: int) -> bool:
-    try:
-        parsed_year = int(year)
-    except ValueError:
-        return False
-    return lower <= parsed_year <= upper
+    return INT_RE.fullmatch(year) is not None and lower <= int(year) <= upper
 
 
 def validate_height(height: str) -> bool:
-    if height.endswith('cm'):
-        lower = 150
-        upper = 193
-    elif height.endswith('in'):
-        lower = 59
-        upper = 76
-    else:
+    match = HEIGHT_RE.fullmatch(height)
+    if match is None:
         return False
-    num_part = height[:-2]
-    return validate_int(num_part, lower, upper)
+    lower, upper = HEIGHT_RANGES[match[2]]
+    return lower <= int(match[1]) <= upper
 
 
 def validate_hair_color(hair_color: str) -> bool:
-    return bool(re.match(r'^#[0-9a-f]{6}$', hair_color))
+    return HAIR_COLOR_RE.fullmatch(hair_color) is not None
 
 
 def validate_eye_color(eye_color: str) -> bool:
-    return bool(re.match(r'^(amb|blu|brn|gry|grn|hzl|oth)$', eye_color))
+    return EYE_COLOR_RE.fullmatch(eye_color) is not None
 
 
 def validate_passport_id(passport_id: str) -> bool:
-    return bool(re.match(r'^\d{9}$', passport_id))
+    return PASSPORT_ID_RE.fullmatch(passport_id) is not None
+
+
+def _int_range(lower: int, upper: int) -> Validator:
+    def validate(value: str) -> bool:
+        return (
+            INT_RE.fullmatch(value) is not None and
+            lower <= int(value) <= upper
+        )
+    return validate
+
+
+STRICT_VALIDATORS: Tuple[Tuple[str, Validator], ...] = (
+    ('byr', _int_range(1920, 2002)),
+    ('iyr', _int_range(2010, 2020)),
+    ('eyr', _int_range(2020, 2030)),
+    ('hgt', validate_height),
+    ('hcl', validate_hair_color),
+    ('ecl', validate_eye_color),
+    ('pid', validate_passport_id),
+)
+
+
+def strict_validate_passport(passport: Dict[str, str]) -> bool:
+    "Checks field by field, stopping at the first missing or invalid one"
+    for key, validate in STRICT_VALIDATORS:
+        value = passport.get(key)
+        if value is None or not validate(value):
+            return False
+    return True
+
+
+@dataclass(frozen=True)
+class IntRange:
+    lower: int
+    upper: int
+
+
+@dataclass(frozen=True)
+class UnitRange:
+    "An integer directly followed by a unit, with a range per unit"
+    ranges: Tuple[Tuple[str, int, int], ...]
+
+
+@dataclass(frozen=True)
+class Pattern:
+    regex: str
+
+
+@dataclass(frozen=True)
+class OneOf:
+    values: Tuple[str, ...]
+
+
+Rule = Union[IntRange, UnitRange, Pattern, OneOf]
+Schema = Mapping[str, Rule]
+
+PASSPORT_SCHEMA: Schema = {
+    'byr': IntRange(1920, 2002),
+    'iyr': IntRange(2010, 2020),
+    'eyr': IntRange(2020, 2030),
+    'hgt': UnitRange((('cm', 150, 193), ('in', 59, 76))),
+    'hcl': Pattern('#[0-9a-f]{6}'),
+    'ecl': OneOf(('amb', 'blu', 'brn', 'gry', 'grn', 'hzl', 'oth')),
+    'pid': Pattern('[0-9]{9}'),
+}
+
+
+def _digits(first: int, last: int) -> str:
+    return str(first) if first == last else f'[{first}-{last}]'
+
+
+def _same_length_patterns(lower: str, upper: str) -> List[str]:
+    "Patterns matching the digit strings from lower to upper, equally long"
+    if lower == upper:
+        return [lower]
+    if lower[0] == upper[0]:
+        return [
+            lower[0] + pattern
+            for pattern in _same_length_patterns(lower[1:], upper[1:])
+        ]
+    rest = len(lower) - 1
+    first, last = int(lower[0]), int(upper[0])
+    head: List[str] = []
+    tail: List[str] = []
+    if lower[1:] != '0' * rest:
+        head = [
+            lower[0] + pattern
+            for pattern in _same_length_patterns(lower[1:], '9' * rest)
+        ]
+        first += 1
+    if upper[1:] != '9' * rest:
+        tail = [
+            upper[0] + pattern
+            for pattern in _same_length_patterns('0' * rest, upper[1:])
+        ]
+        last -= 1
+    middle = [_digits(first, last) + '[0-9]' * rest] if first <= last else []
+    return head + middle + tail
+
+
+def range_pattern(lower: int, upper: int) -> str:
+    """
+    A regex matching exactly the decimal integers from lower to upper. Like
+    int(), it allows leading zeros.
+    """
+    if not 0 <= lower <= upper:
+        raise ValueError(f"Invalid range: {lower}-{upper}")
+    patterns = []
+    for n_digits in range(len(str(lower)), len(str(upper)) + 1):
+        lowest = max(lower, 10 ** (n_digits - 1) if n_digits > 1 else 0)
+        highest = min(upper, 10 ** n_digits - 1)
+        patterns += _same_length_patterns(str(lowest), str(highest))
+    return '0*(?:' + '|'.join(patterns) + ')'
+
+
+def rule_pattern(rule: Rule) -> str:
+    if isinstance(rule, IntRange):
+        return range_pattern(rule.lower, rule.upper)
+    elif isinstance(rule, UnitRange):
+        return '|'.join(
+            f'(?:{range_pattern(lower, upper)}){re.escape(unit)}'
+            for unit, lower, upper in rule.ranges
+        )
+    elif isinstance(rule, Pattern):
+        return rule.regex
+    elif isinstance(rule, OneOf):
+        return '|'.join(re.escape(value) for value in rule.values)
+    raise ValueError(f"Unrecognized rule: {rule}")
+
+
+def parse_rule(raw_rule: str) -> Tuple[str, Rule]:
+    """
+    One line of a schema, a field name, a rule kind and its arguments:
+        byr range 1920-2002
+        hgt units 150-193cm 59-76in
+        hcl regex #[0-9a-f]{6}
+        ecl enum amb blu brn
+    """
+    key, kind, *args = raw_rule.split()
+    if kind == 'range' and len(args) == 1:
+        lower, upper = args[0].split('-')
+        return key, IntRange(int(lower), int(upper))
+    elif kind == 'units' and args:
+        ranges = []
+        for arg in args:
+            match = re.fullmatch(r'([0-9]+)-([0-9]+)(\S+)', arg)
+            if match is None:
+                raise ValueError(f"Invalid unit range: {arg}")
+            ranges.append((match[3], int(match[1]), int(match[2])))
+        return key, UnitRange(tuple(ranges))
+    elif kind == 'regex' and len(args) == 1:
+        return key, Pattern(args[0])
+    elif kind == 'enum' and args:
+        return key, OneOf(tuple(args))
+    raise ValueError(f"Unrecognized rule: {raw_rule}")
+
+
+def parse_schema(raw_schema: str) -> Schema:
+    return dict(parse_rule(line) for line in iter_lines(raw_schema))
+
+
+def compile_schema(schema: Schema) -> PassportValidator:
+    """
+    Fuses each field's rule into a single compiled regex, so checking a field
+    is one fullmatch. Fields are checked in schema order, stopping at the
+    first missing or invalid one.
+    """
+    checks = tuple(
+        (key, re.compile(rule_pattern(rule)).fullmatch)
+        for key, rule in schema.items()
+    )
+
+    def validate(passport: Dict[str, str]) -> bool:
+        for key, fullmatch in checks:
+            value = passport.get(key)
+            if value is None or fullmatch(value) is None:
+                return False
+        return True
+    return validate
+
+
+validate_schema = compile_schema(PASSPORT_SCHEMA)
+
+
+def count_valid(
+    source: Source,
+    validate: PassportValidator = validate_schema,
+) -> Tuple[int, int]:
+    """
+    Passports with every required field, and passports that validate, in
+    one pass. The two checks are independent, so validate may require
+    different fields than REQUIRED_FIELDS.
+    """
+    present = valid = 0
+    for passport in iter_passports(source):
+        present += validate_passport(passport)
+        valid += validate(passport)
+    return present, valid
+
+
+def parse_input(raw_input: Source) -> List[Dict[str, str]]:
+    return list(iter_passports(raw_input))
+
+
+def solve_1(passports: List[Dict[str, str]]) -> int:
+    return sum(1 for passport in passports if validate_passport(passport))
+
+
+def solve_2(passports: List[Dict[str, str]]) -> int:
+    return (
+        sum(1 for passport in passports if validate_schema(passport))
+    )
+
+
+def solve_stream(source: Source) -> Tuple[int, int]:
+    "Both answers in one pass over the records, in constant memory"
+    return count_valid(source)
 
 
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        passport_batch = f.read()
-    passports = parse_records(passport_batch)
+        passports = parse_input(f)
 
-    answer_1 = sum(1 for passport in passports if validate_passport(passport))
+    answer_1 = solve_1(passports)
     assert answer_1 == 250
     print(answer_1)
 
-    answer_2 = (
-        sum(1 for passport in passports if strict_validate_passport(passport))
-    )
+    answer_2 = solve_2(passports)
     assert answer_2 == 158
     print(answer_2)
 
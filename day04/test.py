@@ -1,6 +1,9 @@
+import random
+import re
+
 import pytest
 
-from . import main
+from . import generate, main
 
 
 def test_main() -> None:
@@ -135,3 +138,83 @@ def test_validate_passport_id(passport_id: str, is_valid: bool) -> None:
 )
 def test_strict_validate_password(record: str, is_valid: bool) -> None:
     assert main.strict_validate_passport(main.parse_record(record)) == is_valid
+
+
+def test_generate() -> None:
+    passports = main.parse_input(generate.generate(50, seed=1))
+    assert len(passports) == 50
+    assert 0 < main.solve_2(passports) < main.solve_1(passports) < 50
+
+
+def test_iter_passports() -> None:
+    document = "\n\nbyr:1937 iyr:2017\ncid:147\n\n\n\nhgt:183cm\n\n"
+    assert list(main.iter_passports(document)) == [
+        {'byr': '1937', 'iyr': '2017', 'cid': '147'},
+        {'hgt': '183cm'},
+    ]
+
+
+def test_solve_stream() -> None:
+    raw_input = generate.generate(200, seed=2)
+    passports = main.parse_input(raw_input)
+    assert main.solve_stream(raw_input.splitlines(keepends=True)) == (
+        main.solve_1(passports), main.solve_2(passports)
+    )
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_range_pattern(seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(50):
+        lower = rng.randint(0, 300)
+        upper = rng.randint(lower, 1200)
+        pattern = re.compile(main.range_pattern(lower, upper))
+        for value in range(1300):
+            for text in (str(value), f'00{value}'):
+                assert (pattern.fullmatch(text) is not None) == (
+                    lower <= value <= upper
+                )
+    with pytest.raises(ValueError):
+        main.range_pattern(5, 4)
+
+
+RAW_SCHEMA = """
+byr range 1920-2002
+iyr range 2010-2020
+eyr range 2020-2030
+hgt units 150-193cm 59-76in
+hcl regex #[0-9a-f]{6}
+ecl enum amb blu brn gry grn hzl oth
+pid regex [0-9]{9}
+"""
+
+
+def test_parse_schema() -> None:
+    assert main.parse_schema(RAW_SCHEMA) == main.PASSPORT_SCHEMA
+    for raw_rule in ('byr range 1920', 'hgt units 150cm', 'pid digits 9'):
+        with pytest.raises(ValueError):
+            main.parse_rule(raw_rule)
+
+
+def test_validate_schema() -> None:
+    passports = main.parse_input(generate.generate(500, seed=3))
+    assert [main.validate_schema(passport) for passport in passports] == [
+        main.strict_validate_passport(passport) for passport in passports
+    ]
+
+
+def test_compile_schema() -> None:
+    validate = main.compile_schema(main.parse_schema(
+        "hgt units 100-200cm\nhcl enum #fff #000"
+    ))
+    assert validate({'hgt': '100cm', 'hcl': '#000', 'byr': '1'})
+    assert not validate({'hgt': '60in', 'hcl': '#000'})
+    assert not validate({'hgt': '100cm', 'hcl': '#00'})
+    assert not validate({'hcl': '#000'})
+
+
+def test_count_valid_schema() -> None:
+    validate = main.compile_schema(main.parse_schema('hgt units 100-200cm'))
+    assert main.count_valid(
+        'hgt:150cm\n\nhgt:150cm pid:1\n', validate
+    ) == (0, 2)
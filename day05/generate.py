@@ -0,0 +1,31 @@
+import random
+
+
+def encode_boarding_id(seat_id: int, width: int) -> str:
+    bits = format(seat_id, f'0{width}b')
+    return (
+        bits[:-3].replace('1', 'B').replace('0', 'F') +
+        bits[-3:].replace('1', 'R').replace('0', 'L')
+    )
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    size boarding passes covering a contiguous run of seat ids with exactly
+    one seat missing from the middle. Passes get more row characters than
+    the usual seven when size does not fit on a 128 row plane.
+    """
+    if size < 2:
+        raise ValueError(f"size must be at least 2: got {size}")
+    rng = random.Random(seed)
+    width = max(10, (size + 1).bit_length() + 1)
+    first = rng.randint(1, 2 ** width - size - 2)
+    missing = first + rng.randint(1, size - 1)
+    seat_ids = [
+        seat_id for seat_id in range(first, first + size + 1)
+        if seat_id != missing
+    ]
+    rng.shuffle(seat_ids)
+    return ''.join(
+        f'{encode_boarding_id(seat_id, width)}\n' for seat_id in seat_ids
+    )
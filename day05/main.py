@@ -1,33 +1,129 @@
 import os.path
+from typing import Tuple, TYPE_CHECKING
+
+from runner.stream import iter_lines, Source
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
+BINARY = str.maketrans('BFRL', '1010')
+# the bit each byte of a pass stands for, newlines are kept as they are and
+# any other byte becomes 255
+PASS_BITS = bytes(
+    1 if byte in b'BR' else 0 if byte in b'FL' else
+    byte if byte == ord('\n') else 255
+    for byte in range(256)
+)
+MAX_WIDTH = 62
+
 
 def decode_boarding_id(boarding_id: str) -> int:
-    tr = {
-        ord('B'): '1',
-        ord('F'): '0',
-        ord('R'): '1',
-        ord('L'): '0',
-    }
-    return int(boarding_id.translate(tr), 2)
+    return int(boarding_id.translate(BINARY), 2)
+
+
+def decode_boarding_ids(raw_passes: bytes) -> 'npt.NDArray[np.int64]':
+    """
+    Every boarding pass of a newline separated batch at once. The passes are
+    translated to bits a byte each, viewed as a matrix with one row per pass
+    and shifted in a column at a time. A dot product with powers of two
+    would widen every bit to int64 first.
+    """
+    # imported here since numpy alone is most of the day's import time, and
+    # decode_boarding_id and solve_stream don't need it
+    import numpy as np
+
+    data = raw_passes.strip()
+    if b'\r' in data:
+        data = data.replace(b'\r', b'')
+    if not data:
+        return np.zeros(0, dtype=np.int64)
+    width = data.find(b'\n') if b'\n' in data else len(data)
+    n_passes = (len(data) + 1) // (width + 1)
+    flat = np.frombuffer(data.translate(PASS_BITS), dtype=np.uint8)
+    if (
+        not 0 < width <= MAX_WIDTH or
+        len(flat) != n_passes * (width + 1) - 1 or
+        not np.all(flat[width::width + 1] == ord('\n'))
+    ):
+        raise ValueError("boarding passes must all be equally long")
+    # a view skipping the newlines, not a copy
+    bits = np.lib.stride_tricks.as_strided(
+        flat, shape=(n_passes, width), strides=(width + 1, 1),
+        writeable=False,
+    )
+    if np.any(bits > 1):
+        raise ValueError("boarding passes may only hold B, F, R and L")
+    ids = np.zeros(n_passes, dtype=np.int64)
+    for col in range(width):
+        ids <<= 1
+        ids |= bits[:, col]
+    return ids
+
+
+def find_gaps(
+    boarding_ids: 'npt.NDArray[np.int64]',
+) -> 'npt.NDArray[np.int64]':
+    "Every id between the lowest and highest taken ones that is not taken"
+    import numpy as np
+
+    if len(boarding_ids) == 0:
+        return np.zeros(0, dtype=np.int64)
+    min_id = int(boarding_ids.min())
+    taken = np.zeros(int(boarding_ids.max()) - min_id + 1, dtype=np.bool_)
+    taken[boarding_ids - min_id] = True
+    gaps: npt.NDArray[np.int64] = np.flatnonzero(~taken) + min_id
+    return gaps
+
+
+def parse_input(raw_input: Source) -> 'npt.NDArray[np.int64]':
+    if not isinstance(raw_input, str):
+        raw_input = '\n'.join(iter_lines(raw_input))
+    return decode_boarding_ids(raw_input.encode())
+
+
+def solve_1(boarding_ids: 'npt.NDArray[np.int64]') -> int:
+    return int(boarding_ids.max())
+
+
+def solve_2(boarding_ids: 'npt.NDArray[np.int64]') -> int:
+    gaps = find_gaps(boarding_ids)
+    if len(gaps) != 1:
+        raise ValueError(
+            f"expected exactly one missing boarding id, found {len(gaps)}"
+        )
+    return int(gaps[0])
+
+
+def solve_stream(source: Source) -> Tuple[int, int]:
+    """
+    Both answers in one pass in constant memory. The seats between the
+    lowest and highest id are all taken except one, so the missing id is
+    whatever their total falls short of the full range.
+    """
+    min_id, max_id, total, count = None, 0, 0, 0
+    for boarding_id in map(decode_boarding_id, iter_lines(source)):
+        min_id = boarding_id if min_id is None else min(min_id, boarding_id)
+        max_id = max(max_id, boarding_id)
+        total += boarding_id
+        count += 1
+    if min_id is None or count != max_id - min_id:
+        raise ValueError("expected exactly one missing boarding id")
+    missing_id = (min_id + max_id) * (count + 1) // 2 - total
+    return max_id, missing_id
 
 
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        boarding_ids = [
-            decode_boarding_id(bid.strip()) for bid in f.readlines()
-        ]
-    max_id = max(boarding_ids)
-    min_id = min(boarding_ids)
+        boarding_ids = parse_input(f)
 
-    answer_1 = max_id
+    answer_1 = solve_1(boarding_ids)
     assert answer_1 == 989
     print(answer_1)
 
-    missing_ids = set(range(min_id, max_id + 1)) - set(boarding_ids)
-    assert len(missing_ids) == 1
-    answer_2 = missing_ids.pop()
+    answer_2 = solve_2(boarding_ids)
     assert answer_2 == 548
     print(answer_2)
 
@@ -1,6 +1,7 @@
+import numpy as np
 import pytest
 
-from . import main
+from . import generate, main
 
 
 def test_main() -> None:
@@ -17,3 +18,60 @@ def test_main() -> None:
 )
 def test_decode_boarding_id(boarding_id: str, expected: int) -> None:
     assert main.decode_boarding_id(boarding_id) == expected
+
+
+def test_generate() -> None:
+    boarding_ids = main.parse_input(generate.generate(2000, seed=1))
+    assert len(boarding_ids) == 2000
+    missing_id = main.solve_2(boarding_ids)
+    assert missing_id not in boarding_ids
+    assert min(boarding_ids) < missing_id < main.solve_1(boarding_ids)
+
+
+def test_solve_stream() -> None:
+    raw_input = generate.generate(500, seed=2)
+    boarding_ids = main.parse_input(raw_input)
+    assert main.solve_stream(raw_input.splitlines(keepends=True)) == (
+        main.solve_1(boarding_ids), main.solve_2(boarding_ids)
+    )
+
+
+def test_solve_stream_without_gap() -> None:
+    with pytest.raises(ValueError):
+        main.solve_stream(['FFFFFFFLLR', 'FFFFFFFLRL'])
+
+
+def test_decode_boarding_ids() -> None:
+    raw_input = generate.generate(300, seed=3)
+    assert main.decode_boarding_ids(raw_input.encode()).tolist() == [
+        main.decode_boarding_id(line) for line in raw_input.split()
+    ]
+    assert main.decode_boarding_ids(
+        b'BFFFBBFRRR\r\nFFFBBBFRRR\r\n\n'
+    ).tolist() == [567, 119]
+    assert main.decode_boarding_ids(b'\n').tolist() == []
+
+
+def test_parse_input_lines() -> None:
+    assert main.parse_input(['BFFFBBFRRR', 'FFFBBBFRRR']).tolist() == [
+        567, 119
+    ]
+    assert main.parse_input(['BFFFBBFRRR\n', 'FFFBBBFRRR\n']).tolist() == [
+        567, 119
+    ]
+
+
+@pytest.mark.parametrize(
+    'raw_passes', (b'BFFFBBFRRR\nFFFBBBFRR', b'BFFFBBFRRR\nFFFBBBFRRX')
+)
+def test_decode_boarding_ids_invalid(raw_passes: bytes) -> None:
+    with pytest.raises(ValueError):
+        main.decode_boarding_ids(raw_passes)
+
+
+def test_find_gaps() -> None:
+    boarding_ids = np.array([9, 3, 5, 4, 10, 7], dtype=np.int64)
+    assert main.find_gaps(boarding_ids).tolist() == [6, 8]
+    assert main.find_gaps(boarding_ids[:0]).tolist() == []
+    with pytest.raises(ValueError):
+        main.solve_2(boarding_ids)
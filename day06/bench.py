@@ -0,0 +1,29 @@
+import pytest
+
+from runner.benchmark import Benchmark
+
+from . import generate, main
+
+
+@pytest.mark.parametrize('size', [1_000, 10_000])
+def test_solve_1(benchmark: Benchmark, size: int) -> None:
+    parsed = main.parse_input(generate.generate(size))
+    benchmark(lambda: main.solve_1(parsed))
+
+
+@pytest.mark.parametrize('size', [1_000, 10_000])
+def test_solve_2(benchmark: Benchmark, size: int) -> None:
+    parsed = main.parse_input(generate.generate(size))
+    benchmark(lambda: main.solve_2(parsed))
+
+
+@pytest.mark.parametrize('size', [1_000, 10_000])
+def test_parse_input(benchmark: Benchmark, size: int) -> None:
+    raw_input = generate.generate(size)
+    benchmark(lambda: main.parse_input(raw_input))
+
+
+@pytest.mark.parametrize('size', [1_000, 10_000])
+def test_solve_stream(benchmark: Benchmark, size: int) -> None:
+    raw_input = generate.generate(size)
+    benchmark(lambda: main.solve_stream(raw_input))
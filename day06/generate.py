@@ -0,0 +1,19 @@
+import random
+from string import ascii_lowercase
+
+
+def generate(size: int, seed: int = 0) -> str:
+    "size groups of one to five people each"
+    rng = random.Random(seed)
+    groups = []
+    for _ in range(size):
+        common = rng.sample(ascii_lowercase, rng.randint(0, 5))
+        forms = []
+        for _ in range(rng.randint(1, 5)):
+            extra = rng.sample(ascii_lowercase, rng.randint(0, 10))
+            form = set(common) | set(extra)
+            if not form:
+                form = {rng.choice(ascii_lowercase)}
+            forms.append(''.join(rng.sample(sorted(form), len(form))))
+        groups.append(''.join(f'{form}\n' for form in forms))
+    return '\n'.join(groups)
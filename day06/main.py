@@ -1,31 +1,136 @@
+from dataclasses import dataclass
+from functools import reduce
+from operator import and_, or_
 import os.path
-from string import ascii_lowercase
-from typing import Set
+from typing import Iterable, List, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from runner.stream import iter_records, Source
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
+ALL_QUESTIONS = (1 << 26) - 1
+# the ASCII characters str.split separates on
+WHITESPACE = np.frombuffer(
+    b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f', dtype=np.uint8
+)
+QUESTION_BITS = {chr(ord('a') + i): 1 << i for i in range(26)}
+
+
+@dataclass(frozen=True)
+class GroupAnswers:
+    "Per group, a 26 bit mask of the questions anyone and everyone answered"
+    anyone: npt.NDArray[np.uint32]
+    everyone: npt.NDArray[np.uint32]
+
+    def __len__(self) -> int:
+        return len(self.anyone)
+
+
+def split_forms(text: str) -> List[str]:
+    "Forms are separated by ASCII whitespace, within a line or across lines"
+    if not text.isascii():
+        raise ValueError(f"answers must be lowercase letters: {text!r}")
+    return text.split()
 
-def parse_group_or(record: str) -> Set[str]:
-    return set('').union(*(set(form) for form in record.split()))
 
+def form_mask(form: str) -> int:
+    mask = 0
+    try:
+        for question in form:
+            mask |= QUESTION_BITS[question]
+    except KeyError:
+        raise ValueError(
+            f"answers must be lowercase letters: {form!r}"
+        ) from None
+    return mask
 
-def parse_group_and(record: str) -> Set[str]:
-    return set(ascii_lowercase).intersection(
-        *(set(form) for form in record.split()),
+
+def parse_group_or(record: str) -> int:
+    return reduce(or_, map(form_mask, split_forms(record)), 0)
+
+
+def parse_group_and(record: str) -> int:
+    return reduce(and_, map(form_mask, split_forms(record)), ALL_QUESTIONS)
+
+
+def group_answers(raw_groups: bytes) -> GroupAnswers:
+    """
+    The masks of every group of a whole file at once. Each byte becomes its
+    question's bit, each run of letters is OR reduced into a form, and the
+    forms between blank lines are OR and AND reduced into their group.
+    """
+    data = np.frombuffer(raw_groups, dtype=np.uint8)
+    is_letter = (data >= ord('a')) & (data <= ord('z'))
+    if not np.all(is_letter | np.isin(data, WHITESPACE)):
+        raise ValueError("answers must be lowercase letters")
+    shifts = np.where(is_letter, data - ord('a'), 0).astype(np.uint32)
+    bits = np.where(is_letter, np.uint32(1) << shifts, np.uint32(0))
+    form_starts = np.flatnonzero(
+        is_letter & ~np.concatenate(([False], is_letter[:-1]))
+    )
+    if len(form_starts) == 0:
+        empty = np.zeros(0, dtype=np.uint32)
+        return GroupAnswers(empty, empty)
+    forms = np.bitwise_or.reduceat(bits, form_starts)
+    # forms hold no newlines, so two or more between neighbouring forms
+    # means a line of nothing but whitespace separates them
+    newlines = np.cumsum(data == ord('\n'))[form_starts]
+    group_starts = np.flatnonzero(
+        np.concatenate(([True], np.diff(newlines) >= 2))
     )
+    return GroupAnswers(
+        np.bitwise_or.reduceat(forms, group_starts),
+        np.bitwise_and.reduceat(forms, group_starts),
+    )
+
+
+def count_answers(masks: npt.NDArray[np.uint32]) -> int:
+    return int(np.bitwise_count(masks).sum(dtype=np.int64))
+
+
+def count_groups(records: Iterable[Iterable[str]]) -> Tuple[int, int]:
+    "Questions anyone and everyone answered, summed over groups in one pass"
+    anyone = everyone = 0
+    for record in records:
+        masks = [
+            form_mask(form) for line in record for form in split_forms(line)
+        ]
+        anyone += reduce(or_, masks, 0).bit_count()
+        everyone += reduce(and_, masks, ALL_QUESTIONS).bit_count()
+    return anyone, everyone
+
+
+def parse_input(raw_input: Source) -> GroupAnswers:
+    if not isinstance(raw_input, str):
+        raw_input = '\n'.join(line.rstrip('\r\n') for line in raw_input)
+    return group_answers(raw_input.encode())
+
+
+def solve_1(groups: GroupAnswers) -> int:
+    return count_answers(groups.anyone)
+
+
+def solve_2(groups: GroupAnswers) -> int:
+    return count_answers(groups.everyone)
+
+
+def solve_stream(source: Source) -> Tuple[int, int]:
+    "Both answers in one pass over the records, in constant memory"
+    return count_groups(iter_records(source))
 
 
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        raw_records = f.read().split('\n\n')
+        groups = parse_input(f)
 
-    or_groups = [parse_group_or(record) for record in raw_records]
-    answer_1 = sum(len(group) for group in or_groups)
+    answer_1 = solve_1(groups)
     assert answer_1 == 6768
     print(answer_1)
 
-    and_groups = [parse_group_and(record) for record in raw_records]
-    answer_2 = sum(len(group) for group in and_groups)
+    answer_2 = solve_2(groups)
     assert answer_2 == 3489
     print(answer_2)
 
@@ -1,6 +1,10 @@
+from typing import List
+
 import pytest
 
-from . import main
+from runner.stream import iter_records
+
+from . import generate, main
 
 
 def test_main() -> None:
@@ -16,10 +20,11 @@ def test_main() -> None:
         ('ab\nac', 3),
         ('a\na\na\na', 1),
         ('b', 1),
+        ('ab cd', 4),
     )
 )
 def test_parse_group_or(record: str, num_yes: int) -> None:
-    assert len(main.parse_group_or(record)) == num_yes
+    assert main.parse_group_or(record).bit_count() == num_yes
 
 
 @pytest.mark.parametrize(
@@ -31,7 +36,83 @@ def test_parse_group_or(record: str, num_yes: int) -> None:
         ('ab\nac', 1),
         ('a\na\na\na', 1),
         ('b', 1),
+        ('ab ac\tad', 1),
     )
 )
 def test_parse_group_and(record: str, num_yes: int) -> None:
-    assert len(main.parse_group_and(record)) == num_yes
+    assert main.parse_group_and(record).bit_count() == num_yes
+
+
+def test_generate() -> None:
+    groups = main.parse_input(generate.generate(50, seed=1))
+    assert len(groups) == 50
+    assert main.solve_2(groups) <= main.solve_1(groups)
+
+
+def test_group_answers() -> None:
+    raw_input = generate.generate(300, seed=2)
+    records = [
+        '\n'.join(record) for record in iter_records(raw_input)
+    ]
+    groups = main.group_answers(raw_input.encode())
+    assert groups.anyone.tolist() == [
+        main.parse_group_or(record) for record in records
+    ]
+    assert groups.everyone.tolist() == [
+        main.parse_group_and(record) for record in records
+    ]
+
+
+def test_group_answers_blank_lines() -> None:
+    groups = main.group_answers(b'\n\nab\r\nb \n\n\n\nz\n\n')
+    assert groups.anyone.tolist() == [0b11, 1 << 25]
+    assert groups.everyone.tolist() == [0b10, 1 << 25]
+    assert len(main.group_answers(b'\n \n')) == 0
+    with pytest.raises(ValueError):
+        main.group_answers(b'aB\n')
+
+
+def test_solve_stream() -> None:
+    raw_input = generate.generate(200, seed=3)
+    groups = main.parse_input(raw_input)
+    assert main.solve_stream(raw_input.splitlines(keepends=True)) == (
+        main.solve_1(groups), main.solve_2(groups)
+    )
+
+
+@pytest.mark.parametrize(
+    'lines',
+    (
+        ['abc', 'a', '', 'b'],
+        ['abc\n', 'a\n', '\n', 'b\n'],
+        ['ab cd', 'ac\tbd', ' ', 'xy  z ', '', '', 'q'],
+        ['ab\x1ccd\x0bef', 'abc'],
+    )
+)
+def test_paths_agree(lines: List[str]) -> None:
+    groups = main.parse_input(lines)
+    raw_groups = '\n'.join(line.rstrip('\n') for line in lines) + '\n'
+    expected = (main.solve_1(groups), main.solve_2(groups))
+    assert main.solve_stream(lines) == expected
+    assert main.solve_stream(raw_groups) == expected
+    records = ['\n'.join(record) for record in iter_records(lines)]
+    assert expected == (
+        sum(main.parse_group_or(r).bit_count() for r in records),
+        sum(main.parse_group_and(r).bit_count() for r in records),
+    )
+
+
+def test_parse_input_lines() -> None:
+    groups = main.parse_input(['abc', 'a', '', 'b'])
+    assert (main.solve_1(groups), main.solve_2(groups)) == (4, 2)
+    assert main.solve_stream('ab cd\n') == (4, 0)
+
+
+@pytest.mark.parametrize(
+    'raw_groups', ('aB\n', 'a-b\n', 'ab\n\nc1\n', 'a\xa0b\n', 'é\n')
+)
+def test_invalid_answers(raw_groups: str) -> None:
+    with pytest.raises(ValueError):
+        main.parse_input(raw_groups)
+    with pytest.raises(ValueError):
+        main.solve_stream(raw_groups)
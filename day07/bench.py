@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from runner.benchmark import Benchmark
+
+from . import generate, main
+
+
+@pytest.mark.parametrize('size', [100, 1_000])
+def test_parse_input(benchmark: Benchmark, size: int) -> None:
+    raw_input = generate.generate(size)
+    benchmark(lambda: main.parse_input(raw_input))
+
+
+@pytest.mark.parametrize('size', [100, 1_000])
+def test_solve_1(benchmark: Benchmark, size: int) -> None:
+    parsed = main.parse_input(generate.generate(size))
+
+    def solve() -> int:
+        parsed.clear_cache()
+        return main.solve_1(parsed)
+    benchmark(solve)
+
+
+@pytest.mark.parametrize('size', [100, 1_000])
+def test_solve_2(benchmark: Benchmark, size: int) -> None:
+    parsed = main.parse_input(generate.generate(size))
+
+    def solve() -> int:
+        parsed.clear_cache()
+        return main.solve_2(parsed)
+    benchmark(solve)
+
+
+def query_every_bag(digraph: main.WeightedDigraph[main.BagType]) -> None:
+    digraph.clear_cache()
+    for name in digraph.names():
+        digraph.in_set({name})
+        digraph.contained_count(name)
+
+
+@pytest.mark.parametrize('size', [100, 1_000])
+def test_query_every_bag(benchmark: Benchmark, size: int) -> None:
+    parsed = main.parse_input(generate.generate(size))
+    benchmark(lambda: query_every_bag(parsed))
+
+
+@pytest.mark.parametrize('size', [1_000, 10_000])
+def test_parse_compact(benchmark: Benchmark, size: int) -> None:
+    raw_input = generate.generate(size)
+    benchmark(lambda: main.parse_compact(raw_input))
+
+
+@pytest.mark.parametrize('size', [1_000, 10_000])
+def test_compact_closures(benchmark: Benchmark, size: int) -> None:
+    parsed = main.parse_compact(generate.generate(size))
+    benchmark(lambda: (
+        parsed.in_set({main.MY_BAG}), parsed.contained_count(main.MY_BAG)
+    ))
+
+
+@pytest.mark.parametrize('size', [1_000, 10_000])
+def test_rule_edits(benchmark: Benchmark, size: int) -> None:
+    parsed = main.parse_input(generate.generate(size))
+    rng = random.Random(0)
+    names = list(parsed.names())
+    edits = [
+        (name, {
+            out_name: count + rng.randint(0, 1)
+            for out_name, count in parsed.rule(name).items()
+        })
+        for name in rng.sample(names, 100)
+    ]
+
+    def edit_and_query() -> None:
+        for name, out_edges in edits:
+            parsed.update_rule(name, out_edges)
+            main.solve_1(parsed)
+            main.solve_2(parsed)
+    edit_and_query()
+    benchmark(edit_and_query)
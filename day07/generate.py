@@ -0,0 +1,74 @@
+import random
+from typing import List, Optional, Set, Tuple
+
+ADJECTIVES = [
+    'bright', 'clear', 'dark', 'dim', 'dotted', 'drab', 'dull', 'faded',
+    'light', 'mirrored', 'muted', 'pale', 'plaid', 'posh', 'striped',
+    'vibrant', 'wavy',
+]
+COLORS = [
+    'aqua', 'beige', 'black', 'blue', 'bronze', 'brown', 'coral', 'crimson',
+    'cyan', 'fuchsia', 'gold', 'gray', 'green', 'indigo', 'lavender', 'lime',
+    'magenta', 'maroon', 'olive', 'orange', 'plum', 'purple', 'red', 'salmon',
+    'silver', 'tan', 'teal', 'tomato', 'turquoise', 'violet', 'white',
+    'yellow',
+]
+MY_BAG = 'shiny gold'
+
+
+def _bag_names(count: int, rng: random.Random) -> List[str]:
+    names = [
+        f'{adjective} {color}'
+        for adjective in ADJECTIVES
+        for color in COLORS
+    ]
+    suffix = 2
+    while len(names) < count:
+        names.extend(
+            f'{adjective}{suffix} {color}'
+            for adjective in ADJECTIVES
+            for color in COLORS
+        )
+        suffix += 1
+    chosen = rng.sample(names, count - 1)
+    chosen.insert(rng.randrange(count), MY_BAG)
+    return chosen
+
+
+def _format_edge(count: int, name: str) -> str:
+    return f"{count} {name} bag{'' if count == 1 else 's'}"
+
+
+def generate(size: int, seed: int = 0, edges: Optional[int] = None) -> str:
+    """
+    A rule set for size bag colors, one of them shiny gold, with edges
+    containment rules (twice as many as colors by default). Bags only ever
+    contain bags that come later in a hidden topological order so the graph
+    is acyclic.
+    """
+    if edges is None:
+        edges = 2 * size
+    if not 0 <= edges <= size * (size - 1) // 2:
+        raise ValueError(f"can not fit {edges} edges between {size} bags")
+    rng = random.Random(seed)
+    names = _bag_names(size, rng)
+    chosen_edges: Set[Tuple[int, int]] = set()
+    while len(chosen_edges) < edges:
+        outer, inner = sorted(rng.sample(range(size), 2))
+        chosen_edges.add((outer, inner))
+    contents: List[List[int]] = [[] for _ in range(size)]
+    for outer, inner in chosen_edges:
+        contents[outer].append(inner)
+
+    rules = []
+    for outer, inners in enumerate(contents):
+        if inners:
+            raw_contents = ', '.join(
+                _format_edge(rng.randint(1, 5), names[inner])
+                for inner in sorted(inners)
+            )
+        else:
+            raw_contents = 'no other bags'
+        rules.append(f'{names[outer]} bags contain {raw_contents}.\n')
+    rng.shuffle(rules)
+    return ''.join(rules)
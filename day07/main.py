@@ -1,48 +1,23 @@
 from collections import defaultdict
 from dataclasses import dataclass
-from itertools import chain, repeat, takewhile, tee
-from operator import itemgetter
 import os.path
 from typing import (
-    Callable, cast, DefaultDict, Dict, Generic, Iterable, Iterator,
-    Mapping, NewType, Set, Tuple, TypeVar,
+    Callable, Collection, DefaultDict, Dict, Generic, Iterable, Iterator,
+    List, Mapping, NewType, Set, Tuple, TypeVar,
 )
 
+import numpy as np
+import numpy.typing as npt
+
+from runner.stream import iter_lines, Source
+
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
 A = TypeVar('A')
+B = TypeVar('B')
 BagType = NewType('BagType', str)
 
 
-def takeuntil_stable(it: Iterable[A]) -> Iterator[A]:
-    start_sentinel = object()
-    this_it, that_it = tee(it)
-    return map(
-        itemgetter(0),
-        takewhile(
-            lambda t: t[0] != t[1],
-            zip(this_it, chain([start_sentinel], that_it))
-        )
-    )
-
-
-def iterate_func(func: Callable[[A], A], value: A) -> Iterator[A]:
-    while True:
-        yield value
-        value = func(value)
-
-
-def sum_dicts(
-    dicts: Iterable[Mapping[A, int]],
-    weights: Iterable[int] = repeat(1),
-) -> Dict[A, int]:
-    ret: DefaultDict[A, int] = defaultdict(lambda: 0)
-    for d, w in zip(dicts, weights):
-        for k, v in d.items():
-            ret[k] += v * w
-    return dict(ret)
-
-
 @dataclass
 class Node(Generic[A]):
     name: A
@@ -54,39 +29,357 @@ class Node(Generic[A]):
 
 
 class WeightedDigraph(Generic[A]):
+    """
+    Contained counts are memoized per node, so across any number of queries
+    each is worked out once, from those of the bags it holds, in topological
+    order. Editing a rule only forgets the counts that depended on it. An
+    in_set is one walk over in edges per query instead, since memoizing
+    every node's ancestors would take quadratic space on deep graphs.
+    """
     def __init__(self, nodes: Iterable[Node[A]]) -> None:
         self._nodes = {node.name: node for node in nodes}
         for node_name, node in self._nodes.items():
             for out_node_name in node.out_edges.keys():
                 self._nodes[out_node_name].register_in_edge(node_name)
+        self._contained: Dict[A, int] = {}
 
-    def in_set(self, names: Set[A]) -> Set[A]:
-        in_sets = takeuntil_stable(
-            iterate_func(
-                lambda names_: cast(Set[A], set()).union(
-                    *(self._nodes[name].in_edges for name in names_)
-                ),
-                names
+    def names(self) -> Iterator[A]:
+        return iter(self._nodes)
+
+    def rule(self, name: A) -> Dict[A, int]:
+        return dict(self._nodes[name].out_edges)
+
+    def clear_cache(self) -> None:
+        self._contained.clear()
+
+    def _invalidate(
+        self,
+        names: Iterable[A],
+        edges: Callable[[A], Iterable[A]],
+        memo: Dict[A, B],
+    ) -> None:
+        """
+        Forgets the memos of names and of every node beyond them through
+        edges. A memo is only ever made after those of the nodes it depends
+        on, so the walk can stop at the first node without one.
+        """
+        stack = [name for name in names if name in memo]
+        for name in stack:
+            del memo[name]
+        while stack:
+            for next_name in edges(stack.pop()):
+                if next_name in memo:
+                    del memo[next_name]
+                    stack.append(next_name)
+
+    def add_rule(self, name: A, out_edges: Mapping[A, int]) -> None:
+        if name in self._nodes:
+            raise ValueError(f"There is already a rule for {name}")
+        self._nodes[name] = Node(name, {}, set())
+        try:
+            self.update_rule(name, out_edges)
+        except ValueError:
+            del self._nodes[name]
+            raise
+
+    def update_rule(self, name: A, out_edges: Mapping[A, int]) -> None:
+        """
+        Replaces what name holds. Its contained count and those of everything
+        holding it are forgotten.
+        """
+        node = self._nodes[name]
+        for out_name in out_edges:
+            if out_name not in self._nodes:
+                raise ValueError(f"There is no rule for {out_name}")
+        removed = node.out_edges.keys() - out_edges.keys()
+        added = out_edges.keys() - node.out_edges.keys()
+        self._invalidate([name], self._in_names, self._contained)
+        for out_name in removed:
+            self._nodes[out_name].in_edges.discard(name)
+        for out_name in added:
+            self._nodes[out_name].register_in_edge(name)
+        node.out_edges = dict(out_edges)
+
+    def remove_rule(self, name: A) -> None:
+        if self._nodes[name].in_edges:
+            raise ValueError(f"{name} is still held by other bags")
+        self.update_rule(name, {})
+        del self._nodes[name]
+        self._contained.pop(name, None)
+
+    def _out_names(self, name: A) -> Iterable[A]:
+        return self._nodes[name].out_edges.keys()
+
+    def _in_names(self, name: A) -> Iterable[A]:
+        return self._nodes[name].in_edges
+
+    def _postorder(
+        self,
+        starts: Iterable[A],
+        edges: Callable[[A], Iterable[A]],
+        done: Collection[A] = (),
+    ) -> List[A]:
+        """
+        The nodes reachable from starts through edges, skipping those done,
+        each listed after every node it leads to: a topological sort of the
+        part of the graph not yet memoized.
+        """
+        order: List[A] = []
+        finished: Dict[A, bool] = {}
+        for start in starts:
+            if start in done or start in finished:
+                continue
+            finished[start] = False
+            stack: List[Tuple[A, Iterator[A]]] = [
+                (start, iter(edges(start)))
+            ]
+            while stack:
+                name, next_names = stack[-1]
+                for next_name in next_names:
+                    if next_name in done:
+                        continue
+                    if next_name not in finished:
+                        finished[next_name] = False
+                        stack.append((next_name, iter(edges(next_name))))
+                        break
+                    if not finished[next_name]:
+                        raise ValueError(
+                            f"Bag rules contain a cycle through {next_name}"
+                        )
+                else:
+                    stack.pop()
+                    finished[name] = True
+                    order.append(name)
+        return order
+
+    def contained_count(self, name: A) -> int:
+        "The node itself plus everything it holds, counted with multiplicity"
+        for node_name in self._postorder(
+            [name], self._out_names, self._contained
+        ):
+            self._contained[node_name] = 1 + sum(
+                count * self._contained[out_name]
+                for out_name, count in self._nodes[node_name].out_edges.items()
             )
-        )
-        return cast(Set[A], set()).union(*in_sets)
+        return self._contained[name]
+
+    def in_set(self, names: Set[A]) -> Set[A]:
+        "The names and every node that can reach one of them"
+        reached = set(names)
+        stack = list(reached)
+        while stack:
+            for in_name in self._nodes[stack.pop()].in_edges:
+                if in_name not in reached:
+                    reached.add(in_name)
+                    stack.append(in_name)
+        return reached
 
     def weighted_out_set(
         self, weighted_names: Mapping[A, int],
     ) -> Dict[A, int]:
-        out_sets = takeuntil_stable(
-            iterate_func(
-                lambda weighted_names_: sum_dicts(
-                    (
-                        self._nodes[name].out_edges
-                        for name in weighted_names_.keys()
-                    ),
-                    weighted_names_.values()
-                ),
-                weighted_names
+        """
+        How many of each node the weighted names hold, themselves included,
+        pushed down once through the reachable nodes in topological order.
+        """
+        weights: DefaultDict[A, int] = defaultdict(lambda: 0)
+        weights.update(weighted_names)
+        for name in reversed(
+            self._postorder(weighted_names.keys(), self._out_names)
+        ):
+            weight = weights[name]
+            for out_name, count in self._nodes[name].out_edges.items():
+                weights[out_name] += weight * count
+        return dict(weights)
+
+
+INT64_LIMIT = 1 << 63
+N = TypeVar('N', np.int64, np.float64)
+
+# indptr, indices and the weights parallel to the indices
+CsrArrays = Tuple[
+    npt.NDArray[np.int64], npt.NDArray[np.int32], npt.NDArray[np.int64]
+]
+
+
+def _csr(
+    rows: npt.NDArray[np.int64],
+    cols: npt.NDArray[np.int64],
+    weights: npt.NDArray[np.int64],
+    n_rows: int,
+) -> CsrArrays:
+    order = np.argsort(rows, kind='stable')
+    indptr = np.zeros(n_rows + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n_rows), out=indptr[1:])
+    return (
+        indptr,
+        cols[order].astype(np.int32),
+        weights[order],
+    )
+
+
+def _row_edges(
+    indptr: npt.NDArray[np.int64],
+    rows: npt.NDArray[np.int64],
+) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    "The positions of the edges of rows, and which of rows each belongs to"
+    starts = indptr[rows]
+    lengths = indptr[rows + 1] - starts
+    owners = np.repeat(np.arange(len(rows)), lengths)
+    offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    positions = np.arange(len(owners)) - offsets + starts[owners]
+    return positions, owners
+
+
+def _push(
+    csr: CsrArrays,
+    rows: npt.NDArray[np.int64],
+    values: npt.NDArray[N],
+) -> Tuple[npt.NDArray[np.int64], npt.NDArray[N]]:
+    """
+    The transposed matrix times a sparse vector holding values at rows,
+    touching only the edges of those rows. Returns the vector the same way.
+    """
+    indptr, indices, weights = csr
+    positions, owners = _row_edges(indptr, rows)
+    products = values[owners] * weights[positions]
+    out_rows, inverse = np.unique(indices[positions], return_inverse=True)
+    sums = np.zeros(len(out_rows), dtype=values.dtype)
+    np.add.at(sums, inverse, products)
+    return out_rows.astype(np.int64), sums
+
+
+class CompactDigraph(Generic[A]):
+    """
+    A weighted digraph with its nodes interned to integer ids and its edges
+    stored as compressed sparse rows both ways: the out edges of node i are
+    out_indices[out_indptr[i]:out_indptr[i + 1]], weighted by the same slice
+    of out_weights, and likewise for in edges. Closures are repeated sparse
+    matrix-vector products, each touching only the edges of the nodes the
+    previous one reached.
+    """
+    def __init__(
+        self,
+        names: List[A],
+        sources: npt.NDArray[np.int64],
+        targets: npt.NDArray[np.int64],
+        weights: npt.NDArray[np.int64],
+    ) -> None:
+        self.names = names
+        self.ids = {name: i for i, name in enumerate(names)}
+        self.out_csr = _csr(sources, targets, weights, len(names))
+        self.in_csr = _csr(targets, sources, weights, len(names))
+        in_weight_sums = np.bincount(
+            targets, weights=weights, minlength=len(names)
+        )
+        self._max_in_weight_sum = int(in_weight_sums.max(initial=0))
+
+    @classmethod
+    def from_rules(
+        cls,
+        rules: Iterable[Tuple[A, Mapping[A, int]]],
+    ) -> 'CompactDigraph[A]':
+        "Interns names as they come, so rules may refer to later ones"
+        ids: Dict[A, int] = {}
+        has_rule: List[bool] = []
+        sources: List[int] = []
+        targets: List[int] = []
+        weights: List[int] = []
+
+        def intern(name: A) -> int:
+            if name not in ids:
+                ids[name] = len(ids)
+                has_rule.append(False)
+            return ids[name]
+
+        for name, out_edges in rules:
+            source = intern(name)
+            has_rule[source] = True
+            for out_name, count in out_edges.items():
+                sources.append(source)
+                targets.append(intern(out_name))
+                weights.append(count)
+        names = list(ids)
+        for name, ruled in zip(names, has_rule):
+            if not ruled:
+                raise ValueError(f"No rule for {name}")
+        return cls(
+            names,
+            np.array(sources, dtype=np.int64),
+            np.array(targets, dtype=np.int64),
+            np.array(weights, dtype=np.int64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def ancestor_mask(self, ids: Iterable[int]) -> npt.NDArray[np.bool_]:
+        "Whether each node is one of ids or can reach one of them"
+        reached = np.zeros(len(self), dtype=np.bool_)
+        frontier = np.unique(np.fromiter(ids, dtype=np.int64))
+        reached[frontier] = True
+        while len(frontier):
+            parents, _ = _push(
+                self.in_csr, frontier, np.ones(len(frontier), np.int64)
             )
+            frontier = parents[~reached[parents]]
+            reached[frontier] = True
+        return reached
+
+    def out_counts(
+        self,
+        weights: npt.NDArray[np.int64],
+    ) -> npt.NDArray[np.int64]:
+        """
+        How many of each node the weighted nodes hold, themselves included.
+        Raises OverflowError rather than wrapping around past int64.
+        """
+        total = weights.astype(np.int64)
+        rows = np.flatnonzero(total)
+        values = total[rows]
+        total_max = int(total.max(initial=0))
+        for _ in range(len(self) + 1):
+            if len(rows) == 0:
+                return total
+            bound = int(values.max()) * self._max_in_weight_sum
+            if total_max + bound >= INT64_LIMIT:
+                self._check_overflow(total, rows, values)
+            rows, values = _push(self.out_csr, rows, values)
+            total[rows] += values
+            total_max = max(total_max, int(total[rows].max(initial=0)))
+        raise ValueError("Bag rules contain a cycle")
+
+    def _check_overflow(
+        self,
+        total: npt.NDArray[np.int64],
+        rows: npt.NDArray[np.int64],
+        values: npt.NDArray[np.int64],
+    ) -> None:
+        "Works the next step out in floating point when the bound is loose"
+        next_rows, approx = _push(
+            self.out_csr, rows, values.astype(np.float64)
         )
-        return sum_dicts(out_sets)
+        if np.any(total[next_rows] + approx >= INT64_LIMIT * (1 - 1e-9)):
+            raise OverflowError("Bag counts do not fit in int64")
+
+    def in_set(self, names: Set[A]) -> Set[A]:
+        reached = self.ancestor_mask(self.ids[name] for name in names)
+        return {self.names[i] for i in np.flatnonzero(reached)}
+
+    def weighted_out_set(
+        self, weighted_names: Mapping[A, int],
+    ) -> Dict[A, int]:
+        weights = np.zeros(len(self), dtype=np.int64)
+        for name, weight in weighted_names.items():
+            weights[self.ids[name]] += weight
+        counts = self.out_counts(weights)
+        return {
+            self.names[i]: int(counts[i]) for i in np.flatnonzero(counts)
+        }
+
+    def contained_count(self, name: A) -> int:
+        weights = np.zeros(len(self), dtype=np.int64)
+        weights[self.ids[name]] = 1
+        return sum(self.out_counts(weights).tolist())
 
 
 def parse_bag_rule(bag_rule: str) -> Node[BagType]:
@@ -120,21 +413,40 @@ def _parse_count(raw_count: str) -> int:
     return int(raw_count)
 
 
+MY_BAG = BagType('shiny gold')
+
+
+def parse_input(raw_input: Source) -> WeightedDigraph[BagType]:
+    bag_nodes = [
+        parse_bag_rule(raw_rule) for raw_rule in iter_lines(raw_input)
+    ]
+    return WeightedDigraph(bag_nodes)
+
+
+def parse_compact(raw_input: Source) -> CompactDigraph[BagType]:
+    rules = map(parse_bag_rule, iter_lines(raw_input))
+    return CompactDigraph.from_rules(
+        (node.name, node.out_edges) for node in rules
+    )
+
+
+def solve_1(bag_rule_digraph: WeightedDigraph[BagType]) -> int:
+    return len(bag_rule_digraph.in_set({MY_BAG})) - 1
+
+
+def solve_2(bag_rule_digraph: WeightedDigraph[BagType]) -> int:
+    return bag_rule_digraph.contained_count(MY_BAG) - 1
+
+
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        bag_nodes = [
-            parse_bag_rule(raw_rule.strip()) for raw_rule in f.readlines()
-        ]
-
-    bag_rule_digraph = WeightedDigraph(bag_nodes)
-    my_bag = BagType('shiny gold')
+        bag_rule_digraph = parse_input(f)
 
-    answer_1 = len(bag_rule_digraph.in_set({my_bag})) - 1
+    answer_1 = solve_1(bag_rule_digraph)
     assert answer_1 == 316
     print(answer_1)
 
-    out_set = bag_rule_digraph.weighted_out_set({my_bag: 1})
-    answer_2 = sum(out_set.values()) - 1
+    answer_2 = solve_2(bag_rule_digraph)
     assert answer_2 == 11310
     print(answer_2)
 
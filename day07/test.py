@@ -1,8 +1,48 @@
-from typing import List, Dict
+from collections import defaultdict
+from itertools import chain, repeat, takewhile, tee
+from operator import itemgetter
+import random
+from typing import (
+    Callable, cast, DefaultDict, Dict, Iterable, Iterator, List, Mapping,
+    Set, TypeVar,
+)
 
 import pytest
 
-from . import main
+from runner.main import measure
+
+from . import generate, main
+
+A = TypeVar('A')
+
+
+def takeuntil_stable(it: Iterable[A]) -> Iterator[A]:
+    start_sentinel = object()
+    this_it, that_it = tee(it)
+    return map(
+        itemgetter(0),
+        takewhile(
+            lambda t: t[0] != t[1],
+            zip(this_it, chain([start_sentinel], that_it))
+        )
+    )
+
+
+def iterate_func(func: Callable[[A], A], value: A) -> Iterator[A]:
+    while True:
+        yield value
+        value = func(value)
+
+
+def sum_dicts(
+    dicts: Iterable[Mapping[A, int]],
+    weights: Iterable[int] = repeat(1),
+) -> Dict[A, int]:
+    ret: DefaultDict[A, int] = defaultdict(lambda: 0)
+    for d, w in zip(dicts, weights):
+        for k, v in d.items():
+            ret[k] += v * w
+    return dict(ret)
 
 
 def parse_rules(raw_rules: str) -> main.WeightedDigraph[main.BagType]:
@@ -29,11 +69,11 @@ def test_main() -> None:
     )
 )
 def test_takeuntil_stable(it: List[int], expected: List[int]) -> None:
-    assert list(main.takeuntil_stable(it)) == expected
+    assert list(takeuntil_stable(it)) == expected
 
 
 def test_iterate_func() -> None:
-    it = main.iterate_func(lambda x: x + 1, 0)
+    it = iterate_func(lambda x: x + 1, 0)
     assert all(actual == expected for actual, expected in zip(it, range(10)))
 
 
@@ -54,7 +94,7 @@ def test_sum_dicti(
     dicts: List[Dict[str, int]],
     expected: Dict[str, int],
 ) -> None:
-    actual = main.sum_dicts(dicts)
+    actual = sum_dicts(dicts)
     assert actual == expected
 
 
@@ -92,3 +132,248 @@ def test_weighted_out_set() -> None:
         bag_rule_digraph.weighted_out_set({main.BagType('shiny gold'): 1})
     )
     assert sum(actual_weighted_out_set.values()) - 1 == 126
+
+
+def test_generate() -> None:
+    bag_rule_digraph = main.parse_input(
+        generate.generate(50, seed=1, edges=120)
+    )
+    main.solve_1(bag_rule_digraph)
+    main.solve_2(bag_rule_digraph)
+
+
+def frontier_in_set(
+    nodes: Mapping[main.BagType, main.Node[main.BagType]],
+    names: Set[main.BagType],
+) -> Set[main.BagType]:
+    in_sets = takeuntil_stable(iterate_func(
+        lambda names_: cast(Set[main.BagType], set()).union(
+            *(nodes[name].in_edges for name in names_)
+        ),
+        names,
+    ))
+    return cast(Set[main.BagType], set()).union(*in_sets)
+
+
+def frontier_weighted_out_set(
+    nodes: Mapping[main.BagType, main.Node[main.BagType]],
+    weighted_names: Mapping[main.BagType, int],
+) -> Dict[main.BagType, int]:
+    out_sets = takeuntil_stable(iterate_func(
+        lambda weighted_names_: sum_dicts(
+            (nodes[name].out_edges for name in weighted_names_.keys()),
+            weighted_names_.values(),
+        ),
+        weighted_names,
+    ))
+    return sum_dicts(out_sets)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_closures_match_frontier_expansion(seed: int) -> None:
+    bag_nodes = [
+        main.parse_bag_rule(raw_rule) for raw_rule in
+        generate.generate(60, seed=seed, edges=150).splitlines()
+    ]
+    bag_rule_digraph = main.WeightedDigraph(bag_nodes)
+    nodes = {node.name: node for node in bag_nodes}
+    for name in nodes:
+        assert bag_rule_digraph.in_set({name}) == frontier_in_set(
+            nodes, {name}
+        )
+        expected = frontier_weighted_out_set(nodes, {name: 1})
+        assert bag_rule_digraph.weighted_out_set({name: 1}) == expected
+        assert bag_rule_digraph.contained_count(name) == sum(
+            expected.values()
+        )
+    weighted_names = {bag_nodes[0].name: 2, bag_nodes[1].name: 3}
+    assert bag_rule_digraph.weighted_out_set(weighted_names) == (
+        frontier_weighted_out_set(nodes, weighted_names)
+    )
+
+
+def test_cycle() -> None:
+    bag_rule_digraph = parse_rules("""
+        light red bags contain 1 bright white bag.
+        bright white bags contain 2 muted yellow bags.
+        muted yellow bags contain 2 light red bags, 1 shiny gold bag.
+        shiny gold bags contain no other bags.
+    """.strip())
+    with pytest.raises(ValueError):
+        bag_rule_digraph.contained_count(main.BagType('light red'))
+    assert bag_rule_digraph.in_set({main.BagType('shiny gold')}) == {
+        'shiny gold', 'muted yellow', 'bright white', 'light red'
+    }
+    assert bag_rule_digraph.in_set({main.BagType('light red')}) == {
+        'muted yellow', 'bright white', 'light red'
+    }
+
+
+def test_in_set_agrees_on_cycles() -> None:
+    raw_rules = (
+        'light red bags contain 1 bright white bag.\n'
+        'bright white bags contain 2 muted yellow bags.\n'
+        'muted yellow bags contain 2 light red bags, 1 shiny gold bag.\n'
+        'shiny gold bags contain no other bags.\n'
+    )
+    bag_rule_digraph = main.parse_input(raw_rules)
+    compact = main.parse_compact(raw_rules)
+    for name in bag_rule_digraph.names():
+        assert bag_rule_digraph.in_set({name}) == compact.in_set({name})
+
+
+def test_in_set_deep_chain() -> None:
+    bag_rule_digraph = main.parse_input(''.join(
+        f'bag{i} red bags contain 1 bag{i + 1} red bag.\n'
+        for i in range(5_000)
+    ) + 'bag5000 red bags contain no other bags.\n')
+    assert len(bag_rule_digraph.in_set({main.BagType('bag5000 red')})) == (
+        5_001
+    )
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_compact_digraph(seed: int) -> None:
+    raw_input = generate.generate(60, seed=seed, edges=150)
+    bag_rule_digraph = main.parse_input(raw_input)
+    compact = main.parse_compact(raw_input)
+    assert len(compact) == 60
+    for name in bag_rule_digraph.names():
+        assert compact.in_set({name}) == bag_rule_digraph.in_set({name})
+        assert compact.weighted_out_set({name: 2}) == (
+            bag_rule_digraph.weighted_out_set({name: 2})
+        )
+        assert compact.contained_count(name) == (
+            bag_rule_digraph.contained_count(name)
+        )
+
+
+def test_compact_digraph_invalid() -> None:
+    with pytest.raises(ValueError):
+        main.parse_compact('light red bags contain 1 bright white bag.')
+    cycle = main.parse_compact(
+        'light red bags contain 1 bright white bag.\n'
+        'bright white bags contain 2 light red bags.\n'
+    )
+    assert cycle.in_set({main.BagType('light red')}) == {
+        'light red', 'bright white'
+    }
+    with pytest.raises(ValueError):
+        cycle.contained_count(main.BagType('light red'))
+    deep = main.parse_compact(''.join(
+        f'bag{i} red bags contain 1000 bag{i + 1} red bags.\n'
+        for i in range(10)
+    ) + 'bag10 red bags contain no other bags.\n')
+    assert deep.contained_count(main.BagType('bag4 red')) == sum(
+        1000 ** i for i in range(7)
+    )
+    with pytest.raises(OverflowError):
+        deep.contained_count(main.BagType('bag0 red'))
+
+
+def test_compact_large_counts() -> None:
+    raw_input = (
+        'a red bags contain 2000000000 b red bags, 2000000000 c red bags.\n'
+        'b red bags contain 3000000000 c red bags.\n'
+        'c red bags contain no other bags.\n'
+    )
+    expected = 2000000000 * (1 + 3000000000) + 2000000000 + 1
+    assert main.parse_input(raw_input).contained_count(
+        main.BagType('a red')
+    ) == expected
+    assert main.parse_compact(raw_input).contained_count(
+        main.BagType('a red')
+    ) == expected
+
+
+def test_compact_memory() -> None:
+    raw_input = generate.generate(5_000)
+    _, dict_measurement = measure(main.parse_input, raw_input)
+    _, compact_measurement = measure(main.parse_compact, raw_input)
+    assert dict_measurement.peak_memory is not None
+    assert compact_measurement.peak_memory is not None
+    assert compact_measurement.peak_memory < dict_measurement.peak_memory
+
+
+def rebuild(
+    digraph: main.WeightedDigraph[main.BagType],
+) -> main.WeightedDigraph[main.BagType]:
+    return main.WeightedDigraph(
+        main.Node(name, digraph.rule(name), set())
+        for name in digraph.names()
+    )
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_rule_edits(seed: int) -> None:
+    rng = random.Random(seed)
+    bag_rule_digraph = main.parse_input(
+        generate.generate(40, seed=seed, edges=80)
+    )
+    # edits only point down a fixed order, so the rules stay acyclic
+    order = sorted(
+        bag_rule_digraph.names(),
+        key=lambda name: -bag_rule_digraph.contained_count(name),
+    )
+    for step in range(60):
+        names = list(bag_rule_digraph.names())
+        action = rng.random()
+        if action < 0.2:
+            name = main.BagType(f'new{step} red')
+            children = rng.sample(names, rng.randint(0, 3))
+            order.insert(0, name)
+            bag_rule_digraph.add_rule(
+                name, {child: rng.randint(1, 3) for child in children}
+            )
+        elif action < 0.3:
+            roots = [name for name in names if not rebuild(
+                bag_rule_digraph
+            ).in_set({name}) - {name}]
+            name = rng.choice(roots)
+            order.remove(name)
+            bag_rule_digraph.remove_rule(name)
+        else:
+            name = rng.choice(names)
+            later = order[order.index(name) + 1:]
+            children = rng.sample(later, min(len(later), rng.randint(0, 3)))
+            bag_rule_digraph.update_rule(
+                name, {child: rng.randint(1, 3) for child in children}
+            )
+        expected = rebuild(bag_rule_digraph)
+        for name in rng.sample(list(expected.names()), 10):
+            assert bag_rule_digraph.in_set({name}) == expected.in_set({name})
+            assert bag_rule_digraph.contained_count(name) == (
+                expected.contained_count(name)
+            )
+
+
+def test_rule_edits_invalid() -> None:
+    bag_rule_digraph = parse_rules("""
+        light red bags contain 1 bright white bag.
+        bright white bags contain 2 shiny gold bags.
+        shiny gold bags contain no other bags.
+    """.strip())
+    light_red = main.BagType('light red')
+    bright_white = main.BagType('bright white')
+    shiny_gold = main.BagType('shiny gold')
+    assert bag_rule_digraph.contained_count(light_red) == 4
+    with pytest.raises(ValueError):
+        bag_rule_digraph.add_rule(light_red, {})
+    with pytest.raises(ValueError):
+        bag_rule_digraph.add_rule(
+            main.BagType('dark red'), {main.BagType('dark blue'): 1}
+        )
+    assert set(bag_rule_digraph.names()) == {
+        light_red, bright_white, shiny_gold
+    }
+    with pytest.raises(ValueError):
+        bag_rule_digraph.remove_rule(shiny_gold)
+    bag_rule_digraph.update_rule(shiny_gold, {light_red: 1})
+    with pytest.raises(ValueError):
+        bag_rule_digraph.contained_count(light_red)
+    bag_rule_digraph.update_rule(shiny_gold, {})
+    bag_rule_digraph.remove_rule(light_red)
+    assert bag_rule_digraph.contained_count(bright_white) == 3
+    assert bag_rule_digraph.in_set({shiny_gold}) == {
+        bright_white, shiny_gold
+    }
@@ -0,0 +1,38 @@
+import pytest
+
+from runner.benchmark import Benchmark
+
+from . import generate, main
+
+
+@pytest.mark.parametrize('size', [1_000, 10_000])
+def test_parse_input(benchmark: Benchmark, size: int) -> None:
+    raw_program = generate.generate(size)
+    benchmark(lambda: main.parse_input(raw_program))
+
+
+@pytest.mark.parametrize('size', [100, 300, 1_000])
+def test_solve_1(benchmark: Benchmark, size: int) -> None:
+    parsed = main.parse_input(generate.generate(size))
+    benchmark(lambda: main.solve_1(parsed))
+
+
+@pytest.mark.parametrize('size', [100, 300, 1_000])
+def test_solve_2(benchmark: Benchmark, size: int) -> None:
+    parsed = main.parse_input(generate.generate(size))
+    benchmark(lambda: main.solve_2(parsed))
+
+
+@pytest.mark.parametrize('size', [1_000, 10_000])
+def test_execute(benchmark: Benchmark, size: int) -> None:
+    compiled = main.parse_input(generate.generate(size))
+    benchmark(lambda: main.execute(compiled))
+
+
+@pytest.mark.parametrize('size', [1_000, 10_000])
+def test_find_patch_last_line(benchmark: Benchmark, size: int) -> None:
+    "Only the final jmp can be flipped, the worst case for trying each flip"
+    compiled = main.parse_input(
+        'nop +1\n' * (size - 1) + f'jmp -{size - 1}\n'
+    )
+    benchmark(lambda: main.find_patch(compiled))
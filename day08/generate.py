@@ -0,0 +1,47 @@
+import random
+from typing import List, Tuple
+
+
+def _execution_path(program: List[Tuple[str, int]]) -> List[int]:
+    line_number = 0
+    path = []
+    while line_number < len(program):
+        path.append(line_number)
+        operation, argument = program[line_number]
+        line_number += argument if operation == 'jmp' else 1
+    return path
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    A boot program of size instructions. Every jump points forwards except
+    for a single backwards jmp on the execution path, so the program loops
+    and turning that jmp into a nop makes it terminate.
+    """
+    if size < 3:
+        raise ValueError(f"size must be at least 3: got {size}")
+    rng = random.Random(seed)
+    program: List[Tuple[str, int]] = []
+    for line_number in range(size):
+        remaining = size - line_number
+        roll = rng.random()
+        if roll < 0.5:
+            program.append(('acc', rng.randint(-50, 50)))
+        elif roll < 0.8:
+            program.append(('jmp', rng.randint(1, min(remaining, 10))))
+        else:
+            program.append(('nop', rng.randint(-line_number, remaining)))
+
+    path = _execution_path(program)
+    while len(path) < 2:
+        program[0] = ('nop', 0)
+        program[1] = ('acc', 1)
+        path = _execution_path(program)
+    loop_index = rng.randrange(1, len(path))
+    loop_line = path[loop_index]
+    target = path[rng.randrange(loop_index)]
+    program[loop_line] = ('jmp', target - loop_line)
+
+    return ''.join(
+        f'{operation} {argument:+d}\n' for operation, argument in program
+    )
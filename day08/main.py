@@ -1,7 +1,10 @@
 from dataclasses import dataclass
 from enum import auto, Enum
 import os.path
-from typing import Iterator, List, NoReturn, Set
+from typing import Dict, List, NoReturn, Set, Tuple
+
+from runner import instrument
+from runner.stream import iter_lines, Source
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
@@ -94,60 +97,232 @@ class TracingInterpreter:
         self._state = next_state
         self._line_cache.add(next_state.line_number)
 
+    @instrument.probe('day08.run')
     def run(self) -> TerminationReason:
-        while True:
-            try:
-                self._run_step_or_raise()
-            except InfiniteLoopError:
-                return TerminationReason.InfiniteLoop
-            except ProgramTermination:
-                return TerminationReason.NormalTermination
+        try:
+            while True:
+                try:
+                    self._run_step_or_raise()
+                except InfiniteLoopError:
+                    return TerminationReason.InfiniteLoop
+                except ProgramTermination:
+                    return TerminationReason.NormalTermination
+        finally:
+            instrument.count('day08.steps', len(self._line_cache))
 
     @property
     def accumulator(self) -> int:
         return self._state.accumulator
 
 
-def program_patches(program: Program) -> Iterator[Program]:
-    for i, instruction in enumerate(program):
-        if instruction.operation == Operation.NOP:
-            new_instruction = Instruction(Operation.JMP, instruction.argument)
-        elif instruction.operation == Operation.JMP:
-            new_instruction = Instruction(Operation.NOP, instruction.argument)
+OP_NOP = 0
+OP_ACC = 1
+OP_JMP = 2
+
+EXIT_TERMINATED = 0
+EXIT_LOOPED = 1
+EXIT_OUT_OF_BOUNDS = 2
+
+
+@dataclass
+class CompiledProgram:
+    """
+    A program decoded into parallel int lists. Besides each instruction's
+    opcode and argument, it keeps what running it does: the line it moves on
+    to and how much it adds to the accumulator, so the VM never dispatches
+    on opcodes. Jumps off either end go to the line past the end sentinel.
+    """
+    opcodes: List[int]
+    arguments: List[int]
+    targets: List[int]
+    increments: List[int]
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+    def target(self, line_number: int, opcode: int) -> int:
+        "Where the line goes when it holds opcode, keeping its argument"
+        if opcode == OP_JMP:
+            target = line_number + self.arguments[line_number]
         else:
+            target = line_number + 1
+        return target if 0 <= target <= len(self) else len(self) + 1
+
+    def flip(self, line_number: int) -> None:
+        "Swaps a nop for a jmp or a jmp for a nop, in place"
+        opcode = self.opcodes[line_number]
+        if opcode == OP_ACC:
+            raise ValueError(f"line {line_number} is neither nop nor jmp")
+        opcode = OP_NOP if opcode == OP_JMP else OP_JMP
+        self.opcodes[line_number] = opcode
+        self.targets[line_number] = self.target(line_number, opcode)
+
+
+def assemble(opcodes: List[int], arguments: List[int]) -> CompiledProgram:
+    "Works out where each line goes and what it adds from its opcode"
+    end = len(opcodes)
+    targets = [
+        line_number + argument if opcode == OP_JMP
+        else line_number + 1
+        for line_number, (opcode, argument) in enumerate(
+            zip(opcodes, arguments)
+        )
+    ]
+    return CompiledProgram(
+        opcodes,
+        arguments,
+        [target if 0 <= target <= end else end + 1 for target in targets],
+        [
+            argument if opcode == OP_ACC else 0
+            for opcode, argument in zip(opcodes, arguments)
+        ],
+    )
+
+
+def compile_program(program: Program) -> CompiledProgram:
+    # identity checks against locals, since hashing an Enum member or
+    # looking one up on its class runs Python code
+    acc, jmp = Operation.ACC, Operation.JMP
+    return assemble(
+        [
+            OP_JMP if instruction.operation is jmp
+            else OP_ACC if instruction.operation is acc
+            else OP_NOP
+            for instruction in program
+        ],
+        [instruction.argument for instruction in program],
+    )
+
+
+@instrument.probe('day08.execute')
+def execute(compiled: CompiledProgram) -> Tuple[int, int]:
+    """
+    Runs until the program ends or a line would run twice, returning one of
+    the EXIT_ codes and the accumulator at that point. The two lines past the
+    end are marked as visited up front, so the loop has a single check.
+    """
+    targets = compiled.targets
+    increments = compiled.increments
+    end = len(compiled)
+    visited = bytearray(end + 2)
+    visited[end] = visited[end + 1] = 1
+    line_number = accumulator = 0
+    while not visited[line_number]:
+        visited[line_number] = 1
+        accumulator += increments[line_number]
+        line_number = targets[line_number]
+    if instrument.recorder() is not None:
+        instrument.count('day08.steps', visited.count(1) - 2)
+    if line_number == end:
+        return EXIT_TERMINATED, accumulator
+    if line_number == end + 1:
+        return EXIT_OUT_OF_BOUNDS, accumulator
+    return EXIT_LOOPED, accumulator
+
+
+def find_patch(compiled: CompiledProgram) -> Tuple[int, int]:
+    """
+    The lowest line whose nop or jmp to flip so the program ends, and the
+    final accumulator. Only a line on the looping trace can matter, and once
+    it is flipped, running into any line of the trace loops again. So the
+    flip works exactly when its new target runs to the end without touching
+    the trace, and every line a failed attempt walks through fails for all
+    later attempts too, which keeps the whole search O(n).
+    """
+    targets = compiled.targets
+    end = len(compiled)
+    # 1 for lines known not to run to the end, 2 for the walk under way
+    state = bytearray(end + 2)
+    state[end + 1] = 1
+    trace: List[int] = []
+    line_number = 0
+    while line_number < end and not state[line_number]:
+        state[line_number] = 1
+        trace.append(line_number)
+        line_number = targets[line_number]
+    if line_number == end:
+        raise ValueError("program already runs to the end")
+    opcodes = compiled.opcodes
+    for patched in sorted(trace):
+        if opcodes[patched] == OP_ACC:
+            continue
+        line_number = compiled.target(
+            patched, OP_NOP if opcodes[patched] == OP_JMP else OP_JMP
+        )
+        if state[line_number]:
             continue
-        patch = program.copy()
-        patch[i] = new_instruction
-        yield patch
+        walk: List[int] = []
+        while line_number != end and not state[line_number]:
+            state[line_number] = 2
+            walk.append(line_number)
+            line_number = targets[line_number]
+        if line_number == end:
+            lines = trace[:trace.index(patched)] + walk
+            return patched, sum(compiled.increments[i] for i in lines)
+        for i in walk:
+            state[i] = 1
+    raise RuntimeError('Patch could not be found')
 
 
 def patch_program(program: Program) -> Program:
-    for patched_program in program_patches(program):
-        interpreter = TracingInterpreter(patched_program)
-        termination_reason = interpreter.run()
-        if termination_reason == TerminationReason.NormalTermination:
-            return patched_program
-    raise RuntimeError('Patch could not be found')
+    line_number, _ = find_patch(compile_program(program))
+    instruction = program[line_number]
+    patch = program.copy()
+    patch[line_number] = Instruction(
+        Operation.NOP if instruction.operation is Operation.JMP
+        else Operation.JMP,
+        instruction.argument,
+    )
+    return patch
+
+
+def parse_program(raw_input: Source) -> Program:
+    return [
+        parse_instruction(raw_instruction)
+        for raw_instruction in iter_lines(raw_input)
+    ]
+
+
+OPCODES: Dict[str, int] = {'nop': OP_NOP, 'acc': OP_ACC, 'jmp': OP_JMP}
+
+
+def parse_input(raw_input: Source) -> CompiledProgram:
+    """
+    Decodes the text straight into a CompiledProgram, splitting it into
+    tokens in one go instead of building an Instruction per line, so both
+    parts run on the same decoded program.
+    """
+    lines = list(iter_lines(raw_input))
+    tokens = ' '.join(lines).split()
+    if len(tokens) != 2 * len(lines):
+        raise ValueError("each line must be an operation and an argument")
+    try:
+        opcodes = [OPCODES[raw_operation] for raw_operation in tokens[::2]]
+    except KeyError as e:
+        raise ValueError(f"unrecognized operation: {e.args[0]}") from None
+    return assemble(opcodes, list(map(int, tokens[1::2])))
+
+
+def solve_1(compiled: CompiledProgram) -> int:
+    exit_code, accumulator = execute(compiled)
+    assert exit_code == EXIT_LOOPED
+    return accumulator
+
+
+def solve_2(compiled: CompiledProgram) -> int:
+    _, accumulator = find_patch(compiled)
+    return accumulator
 
 
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        program = [
-            parse_instruction(raw_instruction)
-            for raw_instruction in f.readlines()
-        ]
-
-    interpreter = TracingInterpreter(program)
-    termination_reason = interpreter.run()
-    assert termination_reason == TerminationReason.InfiniteLoop
-    answer_1 = interpreter.accumulator
+        compiled = parse_input(f)
+
+    answer_1 = solve_1(compiled)
     assert answer_1 == 1553, "first answer is wrong"
     print(answer_1)
 
-    patch = patch_program(program)
-    interpreter = TracingInterpreter(patch)
-    interpreter.run()
-    answer_2 = interpreter.accumulator
+    answer_2 = solve_2(compiled)
     assert answer_2 == 1877, "second answer is wrong"
     print(answer_2)
 
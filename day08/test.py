@@ -1,4 +1,9 @@
-from . import main
+import random
+from typing import List, Tuple
+
+import pytest
+
+from . import generate, main
 
 
 def test_main() -> None:
@@ -62,3 +67,110 @@ def test_patch_program() -> None:
 
     actual_patch = main.patch_program(program)
     assert actual_patch == expected_patch
+
+
+def test_generate() -> None:
+    compiled = main.parse_input(generate.generate(50, seed=1))
+    assert len(compiled) == 50
+    main.solve_1(compiled)
+    main.solve_2(compiled)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_parse_input_matches_compile(seed: int) -> None:
+    raw_program = generate.generate(200, seed=seed)
+    assert main.parse_input(raw_program) == main.compile_program(
+        main.parse_program(raw_program)
+    )
+
+
+@pytest.mark.parametrize(
+    'raw_program', ['nop +0\nbad +1', 'nop\nacc +1', 'nop +0 +1', 'acc x']
+)
+def test_parse_input_invalid(raw_program: str) -> None:
+    with pytest.raises(ValueError):
+        main.parse_input(raw_program)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_execute_matches_interpreter(seed: int) -> None:
+    program = main.parse_program(generate.generate(200, seed=seed))
+    interpreter = main.TracingInterpreter(program)
+    termination_reason = interpreter.run()
+    assert termination_reason == main.TerminationReason.InfiniteLoop
+    assert main.execute(main.compile_program(program)) == (
+        main.EXIT_LOOPED, interpreter.accumulator
+    )
+
+
+@pytest.mark.parametrize(
+    ['raw_program', 'expected'],
+    (
+        ('acc +1\njmp +0', (main.EXIT_LOOPED, 1)),
+        ('acc +1\nacc +2', (main.EXIT_TERMINATED, 3)),
+        ('acc +1\njmp +2\nacc +2', (main.EXIT_TERMINATED, 1)),
+        ('acc +1\njmp +3\nacc +2', (main.EXIT_OUT_OF_BOUNDS, 1)),
+        ('acc +1\njmp -2', (main.EXIT_OUT_OF_BOUNDS, 1)),
+        ('', (main.EXIT_TERMINATED, 0)),
+    )
+)
+def test_execute(raw_program: str, expected: Tuple[int, int]) -> None:
+    compiled = main.parse_input(raw_program)
+    assert main.execute(compiled) == expected
+
+
+def test_flip() -> None:
+    compiled = main.parse_input('nop +2\nacc +1\njmp -2')
+    assert main.execute(compiled) == (main.EXIT_LOOPED, 1)
+    compiled.flip(0)
+    assert main.execute(compiled) == (main.EXIT_LOOPED, 0)
+    compiled.flip(2)
+    assert main.execute(compiled) == (main.EXIT_TERMINATED, 0)
+    with pytest.raises(ValueError):
+        compiled.flip(1)
+
+
+def brute_force_patches(program: main.Program) -> List[Tuple[int, int]]:
+    compiled = main.compile_program(program)
+    patches = []
+    for line_number, opcode in enumerate(compiled.opcodes):
+        if opcode == main.OP_ACC:
+            continue
+        compiled.flip(line_number)
+        exit_code, accumulator = main.execute(compiled)
+        compiled.flip(line_number)
+        if exit_code == main.EXIT_TERMINATED:
+            patches.append((line_number, accumulator))
+    return patches
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_find_patch(seed: int) -> None:
+    rng = random.Random(seed)
+    raw_program = '\n'.join(
+        f"{rng.choice(['nop', 'acc', 'jmp'])} {rng.randint(-4, 4):+d}"
+        for _ in range(12)
+    )
+    program = main.parse_program(raw_program)
+    patches = brute_force_patches(program)
+    compiled = main.compile_program(program)
+    if main.execute(compiled)[0] != main.EXIT_LOOPED or not patches:
+        return
+    assert main.find_patch(compiled) == patches[0]
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_find_patch_generated(seed: int) -> None:
+    program = main.parse_program(generate.generate(300, seed=seed))
+    patch = brute_force_patches(program)[0]
+    assert main.find_patch(main.compile_program(program)) == patch
+
+
+def test_find_patch_missing() -> None:
+    with pytest.raises(RuntimeError):
+        main.find_patch(main.parse_input('nop +0\njmp -1\njmp -2'))
+
+
+def test_find_patch_terminating() -> None:
+    with pytest.raises(ValueError):
+        main.find_patch(main.parse_input('nop +0\njmp +1\nacc +1'))
@@ -0,0 +1,40 @@
+from itertools import combinations
+import random
+from typing import List
+
+LAG = 25
+
+
+def _next_valid(numbers: List[int], rng: random.Random) -> int:
+    "Sums of the oldest numbers in the window keep the growth rate down"
+    window = numbers[-LAG:]
+    i, j = rng.sample(range(5), 2)
+    return window[i] + window[j]
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    size numbers where every number after the preamble is a sum of two of
+    the 25 before it, except one which is instead the sum of a contiguous
+    run of earlier numbers.
+    """
+    if size < LAG + 2:
+        raise ValueError(f"size must be at least {LAG + 2}: got {size}")
+    rng = random.Random(seed)
+    numbers = rng.sample(range(1, 4 * LAG), LAG)
+    invalid_at = rng.randint(LAG + 1, size - 1)
+    while len(numbers) < invalid_at:
+        numbers.append(_next_valid(numbers, rng))
+
+    pair_sums = {x + y for x, y in combinations(numbers[-LAG:], 2)}
+    while True:
+        start = rng.randrange(len(numbers) - 1)
+        stop = rng.randint(start + 2, min(len(numbers), start + 20))
+        invalid = sum(numbers[start:stop])
+        if invalid not in pair_sums:
+            break
+    numbers.append(invalid)
+
+    while len(numbers) < size:
+        numbers.append(_next_valid(numbers, rng))
+    return ''.join(f'{number}\n' for number in numbers)
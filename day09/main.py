@@ -2,6 +2,8 @@ from itertools import combinations
 import os.path
 from typing import List, Optional
 
+from runner.stream import iter_lines, Source
+
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
 
@@ -41,18 +43,32 @@ def vulnerable_stride_of_length(
     return None
 
 
+def parse_input(raw_input: Source) -> List[int]:
+    return [int(line) for line in iter_lines(raw_input)]
+
+
+def solve_1(numbers: List[int]) -> int:
+    invalid = first_invalid(numbers, 25)
+    assert invalid is not None
+    return invalid
+
+
+def solve_2(numbers: List[int]) -> int:
+    vulnerable_stride = first_vulnerable_stride(numbers, solve_1(numbers))
+    assert vulnerable_stride is not None
+    assert len(vulnerable_stride) >= 2
+    return min(vulnerable_stride) + max(vulnerable_stride)
+
+
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        numbers = [int(line) for line in f.readlines()]
+        numbers = parse_input(f)
 
-    answer_1 = first_invalid(numbers, 25)
+    answer_1 = solve_1(numbers)
     assert answer_1 == 57195069
     print(answer_1)
 
-    vulnerable_stride = first_vulnerable_stride(numbers, answer_1)
-    assert vulnerable_stride is not None
-    assert len(vulnerable_stride) >= 2
-    answer_2 = min(vulnerable_stride) + max(vulnerable_stride)
+    answer_2 = solve_2(numbers)
     assert answer_2 == 7409241
     print(answer_2)
 
@@ -1,4 +1,4 @@
-from . import main
+from . import generate, main
 
 EXAMPLE_NUMBERS = [
     35, 20, 15, 25, 47, 40, 62, 55, 65, 95, 102,
@@ -18,3 +18,9 @@ def test_first_vulnerable_stride() -> None:
     assert (
         main.first_vulnerable_stride(EXAMPLE_NUMBERS, 127) == [15, 25, 47, 40]
     )
+
+
+def test_generate() -> None:
+    numbers = main.parse_input(generate.generate(50, seed=1))
+    assert len(numbers) == 50
+    main.solve_2(numbers)
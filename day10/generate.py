@@ -0,0 +1,19 @@
+import random
+from typing import List
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    size adapters whose sorted joltages step by 1 or 3, with runs of at
+    most four single steps
+    """
+    rng = random.Random(seed)
+    jolts: List[int] = []
+    jolt = 0
+    while len(jolts) < size:
+        for _ in range(min(rng.randint(1, 4), size - len(jolts))):
+            jolt += 1
+            jolts.append(jolt)
+        jolt += 2
+    rng.shuffle(jolts)
+    return ''.join(f'{jolt}\n' for jolt in jolts)
@@ -5,6 +5,8 @@ from operator import mul
 import os.path
 from typing import cast, Iterable, List, Literal, Tuple
 
+from runner.stream import iter_lines, Source
+
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
 
@@ -48,22 +50,35 @@ def diff_sequences_non_rec(diffs: Iterable[Literal[1, 3]]) -> int:
     )
 
 
-def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        jolts = [int(j) for j in f.readlines()]
-
+def parse_input(raw_input: Source) -> List[int]:
+    jolts = [int(j) for j in iter_lines(raw_input)]
     jolts.append(0)
     jolts.append(max(jolts) + 3)
+    return jolts
 
+
+def solve_1(jolts: List[int]) -> int:
     jolt_diffs = all_chargers_jolt_diffs(jolts)
-    answer_1 = jolt_diffs.count(1) * jolt_diffs.count(3)
+    return jolt_diffs.count(1) * jolt_diffs.count(3)
+
+
+def solve_2(jolts: List[int]) -> int:
+    return diff_sequences(tuple(all_chargers_jolt_diffs(jolts)), 3)
+
+
+def main() -> None:
+    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
+        jolts = parse_input(f)
+
+    answer_1 = solve_1(jolts)
     assert answer_1 == 2201
     print(answer_1)
 
-    answer_2 = diff_sequences(tuple(jolt_diffs), 3)
+    answer_2 = solve_2(jolts)
     assert answer_2 == 169255295254528
     print(answer_2)
 
+    jolt_diffs = all_chargers_jolt_diffs(jolts)
     assert all(jolt_diff in (1, 3) for jolt_diff in jolt_diffs)
     literal_jolt_diffs = cast(List[Literal[1, 3]], jolt_diffs)
     answer_2_prime = diff_sequences_non_rec(literal_jolt_diffs)
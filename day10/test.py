@@ -1,8 +1,8 @@
-from typing import List, Literal, Tuple
+from typing import cast, List, Literal, Tuple
 
 import pytest
 
-from . import main
+from . import generate, main
 
 
 def test_main() -> None:
@@ -79,3 +79,13 @@ def test_diff_sequences_non_rec(
 )
 def test_tribonacci(n: int, expected: int) -> None:
     assert main.tribonacci(n) == expected
+
+
+def test_generate() -> None:
+    jolts = main.parse_input(generate.generate(50, seed=1))
+    assert len(jolts) == 52
+    jolt_diffs = main.all_chargers_jolt_diffs(jolts)
+    assert set(jolt_diffs) == {1, 3}
+    assert main.solve_2(jolts) == main.diff_sequences_non_rec(
+        cast(List[Literal[1, 3]], jolt_diffs)
+    )
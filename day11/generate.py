@@ -0,0 +1,11 @@
+import random
+
+
+def generate(size: int, seed: int = 0) -> str:
+    "A size by size grid of empty seats and floor"
+    rng = random.Random(seed)
+    return ''.join(
+        ''.join('.' if rng.random() < 0.15 else 'L' for _ in range(size)) +
+        '\n'
+        for _ in range(size)
+    )
@@ -3,6 +3,8 @@ from itertools import repeat
 import os.path
 from typing import Callable, Iterable, Sequence, Tuple
 
+from runner import instrument
+
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
 
@@ -44,6 +46,7 @@ class StateArrangement:
             return NotImplemented
         return self._states == other._states
 
+    @instrument.probe('day11.next_state')
     def _next_state(
         self,
         neighbor_func: Callable[[int, int], int],
@@ -131,29 +134,39 @@ class StateArrangement:
         ])
 
 
-def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        init_arrangement = StateArrangement.from_raw(f.read())
+def parse_input(raw_input: str) -> StateArrangement:
+    return StateArrangement.from_raw(raw_input)
+
 
+def solve_1(init_arrangement: StateArrangement) -> int:
     arrangement = init_arrangement
     while True:
         next_arrangement = arrangement.next_state_adjacent()
         if arrangement == next_arrangement:
             break
         arrangement = next_arrangement
+    return arrangement.num_in_state(State.Occupied)
 
-    answer_1 = arrangement.num_in_state(State.Occupied)
-    assert answer_1 == 2277
-    print(answer_1)
 
+def solve_2(init_arrangement: StateArrangement) -> int:
     arrangement = init_arrangement
     while True:
         next_arrangement = arrangement.next_state_visible()
         if arrangement == next_arrangement:
             break
         arrangement = next_arrangement
+    return arrangement.num_in_state(State.Occupied)
+
+
+def main() -> None:
+    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
+        init_arrangement = parse_input(f.read())
+
+    answer_1 = solve_1(init_arrangement)
+    assert answer_1 == 2277
+    print(answer_1)
 
-    answer_2 = arrangement.num_in_state(State.Occupied)
+    answer_2 = solve_2(init_arrangement)
     assert answer_2 == 2066
     print(answer_2)
 
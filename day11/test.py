@@ -1,6 +1,6 @@
 import pytest
 
-from . import main
+from . import generate, main
 
 
 @pytest.mark.slow
@@ -184,3 +184,9 @@ def test_next_state_visible() -> None:
         assert st_init.next_state_visible() == st_next
     assert states[-1].next_state_visible() == states[-1]
     assert states[-1].num_in_state(main.State.Occupied) == 26
+
+
+def test_generate() -> None:
+    init_arrangement = main.parse_input(generate.generate(10, seed=1))
+    main.solve_1(init_arrangement)
+    main.solve_2(init_arrangement)
@@ -3,6 +3,9 @@ from enum import auto, Enum
 from functools import reduce
 import math
 import os.path
+from typing import List
+
+from runner.stream import iter_lines, Source
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
@@ -154,23 +157,35 @@ def follow_waypoint_instruction(
         )
 
 
-def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        instructions = [Instruction.parse(line) for line in f.readlines()]
+def parse_input(raw_input: Source) -> List[Instruction]:
+    return [Instruction.parse(line) for line in iter_lines(raw_input)]
+
 
+def solve_1(instructions: List[Instruction]) -> int:
     initial_state = ShipState(0, 0, Facing.E)
     final_state = reduce(follow_instruction, instructions, initial_state)
-    answer_1 = abs(final_state.x_pos) + abs(final_state.y_pos)
-    assert answer_1 == 1319
-    print(answer_1)
+    return abs(final_state.x_pos) + abs(final_state.y_pos)
 
+
+def solve_2(instructions: List[Instruction]) -> int:
     initial_waypoint_state = WaypointState(0, 0, 10, 1)
     final_waypoint_state = reduce(
         follow_waypoint_instruction, instructions, initial_waypoint_state
     )
-    answer_2 = (
+    return (
         abs(final_waypoint_state.ship_x) + abs(final_waypoint_state.ship_y)
     )
+
+
+def main() -> None:
+    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
+        instructions = parse_input(f)
+
+    answer_1 = solve_1(instructions)
+    assert answer_1 == 1319
+    print(answer_1)
+
+    answer_2 = solve_2(instructions)
     assert answer_2 == 62434
     print(answer_2)
 
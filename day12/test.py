@@ -1,6 +1,6 @@
 import pytest
 
-from . import main
+from . import generate, main
 
 
 def test_main() -> None:
@@ -85,3 +85,10 @@ def test_follow_waypoint_instruction(
     assert expected_state == main.follow_waypoint_instruction(
         initial_state, instruction
     )
+
+
+def test_generate() -> None:
+    instructions = main.parse_input(generate.generate(50, seed=1))
+    assert len(instructions) == 50
+    main.solve_1(instructions)
+    main.solve_2(instructions)
@@ -0,0 +1,31 @@
+import random
+from typing import List
+
+
+def _primes(count: int, at_least: int) -> List[int]:
+    primes: List[int] = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % p for p in range(2, int(candidate ** 0.5) + 1)):
+            if candidate >= at_least:
+                primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Notes with a schedule of size slots. About one slot in five has a bus
+    and bus ids are distinct primes so the part two congruences always have
+    a solution.
+    """
+    if size < 1:
+        raise ValueError(f"size must be at least 1: got {size}")
+    rng = random.Random(seed)
+    has_bus = [True] + [rng.random() < 0.2 for _ in range(size - 1)]
+    buses = _primes(sum(has_bus) * 3, 7)
+    rng.shuffle(buses)
+    bus_iter = iter(buses)
+    slots = [str(next(bus_iter)) if bus else 'x' for bus in has_bus]
+    arrival = rng.randint(1_000, 1_000_000)
+    return f"{arrival}\n{','.join(slots)}\n"
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from functools import reduce
 from operator import itemgetter
 import os.path
-from typing import Iterable, Tuple
+from typing import Iterable, List, Tuple
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
@@ -93,23 +93,43 @@ def next_departure_bus_and_wait(
     )
 
 
+@dataclass(frozen=True)
+class Notes:
+    arrival: int
+    buses: List[int]
+    congruences: List[ModularCongruence]
+
+
+def parse_input(raw_input: str) -> Notes:
+    first_line, second_line = raw_input.splitlines()[:2]
+    arrival = int(first_line.strip())
+    buses = [int(b) for b in second_line.split(',') if b != 'x']
+    congruences = [
+        ModularCongruence(-i, int(b))
+        for i, b in enumerate(second_line.split(','))
+        if b != 'x'
+    ]
+    return Notes(arrival, buses, congruences)
+
+
+def solve_1(notes: Notes) -> int:
+    bus, wait = next_departure_bus_and_wait(notes.arrival, notes.buses)
+    return bus * wait
+
+
+def solve_2(notes: Notes) -> int:
+    return crt(notes.congruences).remainder
+
+
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        arrival = int(f.readline().strip())
-        second_line = f.readline()
-        buses = [int(b) for b in second_line.split(',') if b != 'x']
-        congruences = [
-            ModularCongruence(-i, int(b))
-            for i, b in enumerate(second_line.split(','))
-            if b != 'x'
-        ]
-
-    bus, wait = next_departure_bus_and_wait(arrival, buses)
-    answer_1 = bus * wait
+        notes = parse_input(f.read())
+
+    answer_1 = solve_1(notes)
     assert answer_1 == 2545
     print(answer_1)
 
-    answer_2 = crt(congruences).remainder
+    answer_2 = solve_2(notes)
     assert answer_2 == 266204454441577
     print(answer_2)
 
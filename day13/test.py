@@ -1,4 +1,4 @@
-from . import main
+from . import generate, main
 
 
 def test_main() -> None:
@@ -20,3 +20,14 @@ def test_crt() -> None:
         main.ModularCongruence(-7, 19),
     ]
     assert main.crt(congruences).remainder == 1068781
+
+
+def test_generate() -> None:
+    notes = main.parse_input(generate.generate(50, seed=1))
+    bus, wait = main.next_departure_bus_and_wait(notes.arrival, notes.buses)
+    assert 0 <= wait < bus
+    timestamp = main.solve_2(notes)
+    assert all(
+        (timestamp - congruence.remainder) % congruence.modulus == 0
+        for congruence in notes.congruences
+    )
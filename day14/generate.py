@@ -0,0 +1,25 @@
+import random
+from typing import List
+
+
+def _mask(rng: random.Random) -> str:
+    floating = set(rng.sample(range(36), rng.randint(0, 9)))
+    return ''.join(
+        'X' if i in floating else rng.choice('01') for i in range(36)
+    )
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    A program of size instructions. Masks float at most nine bits so the
+    part two address expansion stays bounded.
+    """
+    rng = random.Random(seed)
+    lines: List[str] = []
+    while len(lines) < size:
+        lines.append(f'mask = {_mask(rng)}\n')
+        for _ in range(min(rng.randint(1, 6), size - len(lines))):
+            register = rng.randrange(2 ** 16)
+            value = rng.randrange(2 ** 30)
+            lines.append(f'mem[{register}] = {value}\n')
+    return ''.join(lines)
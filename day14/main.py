@@ -4,6 +4,8 @@ from itertools import product
 import os.path
 from typing import Dict, Iterator, List, NoReturn, Union
 
+from runner.stream import iter_lines, Source
+
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
 
@@ -96,21 +98,33 @@ class BitmaskComputer:
             raise TypeError(f'absurd reached with value {absurd}')
 
 
-def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        program = [parse_instruction(line.strip()) for line in f.readlines()]
+def parse_input(raw_input: Source) -> List[Instruction]:
+    return [parse_instruction(line) for line in iter_lines(raw_input)]
+
 
+def solve_1(program: List[Instruction]) -> int:
     comp = BitmaskComputer()
     for instruction in program:
         comp.run_instruction(instruction)
-    answer_1 = sum(comp.memory.values())
-    assert answer_1 == 16003257187056
-    print(answer_1)
+    return sum(comp.memory.values())
 
+
+def solve_2(program: List[Instruction]) -> int:
     comp = BitmaskComputer()
     for instruction in program:
         comp.run_instruction_v2(instruction)
-    answer_2 = sum(comp.memory.values())
+    return sum(comp.memory.values())
+
+
+def main() -> None:
+    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
+        program = parse_input(f)
+
+    answer_1 = solve_1(program)
+    assert answer_1 == 16003257187056
+    print(answer_1)
+
+    answer_2 = solve_2(program)
     print(answer_2)
 
 
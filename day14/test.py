@@ -2,7 +2,7 @@ from typing import Set
 
 import pytest
 
-from . import main
+from . import generate, main
 
 
 @pytest.mark.slow
@@ -41,3 +41,10 @@ def test_mask_register(
 ) -> None:
     mask = main.parse_mask(raw_mask)
     assert set(main.mask_register(register, mask)) == expected_registers
+
+
+def test_generate() -> None:
+    program = main.parse_input(generate.generate(50, seed=1))
+    assert len(program) == 50
+    main.solve_1(program)
+    main.solve_2(program)
@@ -0,0 +1,10 @@
+import pytest
+
+from runner.benchmark import Benchmark
+
+from . import main
+
+
+@pytest.mark.parametrize('to_round', [10_000, 100_000, 300_000])
+def test_run_game(benchmark: Benchmark, to_round: int) -> None:
+    benchmark(lambda: main.run_game([0, 3, 6], to_round))
@@ -0,0 +1,7 @@
+import random
+
+
+def generate(size: int, seed: int = 0) -> str:
+    "size distinct starting numbers"
+    rng = random.Random(seed)
+    return ','.join(str(n) for n in rng.sample(range(20 * size), size)) + '\n'
@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 import os.path
-from typing import Dict, Sequence
+from typing import Dict, List, Sequence
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
@@ -32,17 +32,27 @@ def run_game(starting_numbers: Sequence[int], to_round: int) -> Game:
     return game
 
 
+def parse_input(raw_input: str) -> List[int]:
+    return [int(n) for n in raw_input.split(',')]
+
+
+def solve_1(starting_numbers: List[int]) -> int:
+    return run_game(starting_numbers, 2020).last_number
+
+
+def solve_2(starting_numbers: List[int]) -> int:
+    return run_game(starting_numbers, 30_000_000).last_number
+
+
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        starting_numbers = [int(n) for n in f.read().split(',')]
+        starting_numbers = parse_input(f.read())
 
-    game = run_game(starting_numbers, 2020)
-    answer_1 = game.last_number
+    answer_1 = solve_1(starting_numbers)
     assert answer_1 == 755
     print(answer_1)
 
-    game = run_game(starting_numbers, 30_000_000)
-    answer_2 = game.last_number
+    answer_2 = solve_2(starting_numbers)
     assert answer_2 == 11962
     print(answer_2)
 
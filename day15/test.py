@@ -2,7 +2,9 @@ from typing import List
 
 import pytest
 
-from . import main
+from runner.main import measure
+from runner.memory import MIB
+from . import generate, main
 
 
 @pytest.mark.slow
@@ -24,3 +26,15 @@ def test_main() -> None:
 def test_game(starting_numbers: List[int], expected_number: int) -> None:
     game = main.run_game(starting_numbers, 2020)
     assert game.last_number == expected_number
+
+
+def test_generate() -> None:
+    starting_numbers = main.parse_input(generate.generate(5, seed=1))
+    assert len(set(starting_numbers)) == 5
+    main.solve_1(starting_numbers)
+
+
+def test_memory_budget() -> None:
+    _, measurement = measure(lambda n: main.run_game([0, 3, 6], n), 100_000)
+    assert measurement.peak_memory is not None
+    assert measurement.peak_memory < 3 * MIB
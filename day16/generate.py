@@ -0,0 +1,52 @@
+import random
+from typing import List
+
+BAND = 100
+
+
+def generate(size: int, seed: int = 0, fields: int = 20) -> str:
+    """
+    Notes with fields ticket fields and size nearby tickets. Field rank r
+    accepts every value from band r upwards, and the column holding rank r
+    only ever sees values from band r, so the columns can be deduced one at
+    a time starting from the highest rank. Roughly one nearby ticket in five
+    carries a value no rule accepts.
+    """
+    if fields < 1:
+        raise ValueError(f"fields must be at least 1: got {fields}")
+    rng = random.Random(seed)
+    names = [
+        f'departure field {rank}' if rank < 6 else f'field {rank}'
+        for rank in range(fields)
+    ]
+    lowest = [BAND * (fields - rank) for rank in range(fields)]
+    top = BAND * (fields + 1) - 1
+    upper_lower = top + 1 + BAND
+    upper_upper = upper_lower + BAND
+    rules = [
+        f'{name}: {low}-{top} or {upper_lower}-{upper_upper}\n'
+        for name, low in zip(names, lowest)
+    ]
+    rng.shuffle(rules)
+    column_ranks = list(range(fields))
+    rng.shuffle(column_ranks)
+
+    def ticket() -> List[int]:
+        return [
+            rng.randint(lowest[rank], lowest[rank] + BAND - 1)
+            for rank in column_ranks
+        ]
+
+    nearby = []
+    for _ in range(size):
+        values = ticket()
+        if rng.random() < 0.2:
+            values[rng.randrange(fields)] = rng.randint(0, BAND - 1)
+        nearby.append(','.join(str(v) for v in values) + '\n')
+
+    my_ticket = ','.join(str(v) for v in ticket())
+    return (
+        ''.join(rules) +
+        f'\nyour ticket:\n{my_ticket}\n' +
+        '\nnearby tickets:\n' + ''.join(nearby)
+    )
@@ -93,32 +93,40 @@ def pop_known_correspondence(
     return idx, rule
 
 
-def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        raw_rules, raw_my_ticket, raw_nearby_tickets = (
-            f.read().split('\n\n', 2)
-        )
+@dataclass(frozen=True)
+class Notes:
+    rules: List[Rule]
+    my_ticket: Ticket
+    nearby_tickets: List[Ticket]
+
 
+def parse_input(raw_input: str) -> Notes:
+    raw_rules, raw_my_ticket, raw_nearby_tickets = raw_input.split('\n\n', 2)
     rules = [Rule.from_str(raw_rule) for raw_rule in raw_rules.splitlines()]
+    my_ticket = parse_ticket(raw_my_ticket.splitlines()[1])
     nearby_tickets = [
         parse_ticket(raw_ticket)
         for raw_ticket in raw_nearby_tickets.splitlines()[1:]
     ]
+    return Notes(rules, my_ticket, nearby_tickets)
+
 
-    answer_1 = sum(chain.from_iterable(
-        invalid_fields(ticket, rules) for ticket in nearby_tickets
+def solve_1(notes: Notes) -> int:
+    return sum(chain.from_iterable(
+        invalid_fields(ticket, notes.rules) for ticket in notes.nearby_tickets
     ))
-    assert answer_1 == 26009
-    print(answer_1)
 
-    my_ticket = parse_ticket(raw_my_ticket.splitlines()[1])
+
+def solve_2(notes: Notes) -> int:
     valid_nearby_tickets = [
-        ticket for ticket in nearby_tickets
-        if is_valid(ticket, rules)
-    ] + [my_ticket]
-    idx_to_name = deduce(valid_nearby_tickets, rules)
-    nice_my_ticket = {name: my_ticket[i] for i, name in idx_to_name.items()}
-    answer_2 = reduce(
+        ticket for ticket in notes.nearby_tickets
+        if is_valid(ticket, notes.rules)
+    ] + [notes.my_ticket]
+    idx_to_name = deduce(valid_nearby_tickets, notes.rules)
+    nice_my_ticket = {
+        name: notes.my_ticket[i] for i, name in idx_to_name.items()
+    }
+    return reduce(
         mul,
         (
             value for name, value in nice_my_ticket.items()
@@ -126,6 +134,17 @@ def main() -> None:
         ),
         1
     )
+
+
+def main() -> None:
+    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
+        notes = parse_input(f.read())
+
+    answer_1 = solve_1(notes)
+    assert answer_1 == 26009
+    print(answer_1)
+
+    answer_2 = solve_2(notes)
     assert answer_2 == 589685618167
     print(answer_2)
 
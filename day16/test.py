@@ -1,6 +1,6 @@
 import pytest
 
-from . import main
+from . import generate, main
 
 
 def test_main() -> None:
@@ -40,3 +40,11 @@ def test_deduce() -> None:
     ]
     expected = {0: 'row', 1: 'class', 2: 'seat'}
     assert main.deduce(tickets, rules) == expected
+
+
+def test_generate() -> None:
+    notes = main.parse_input(generate.generate(50, seed=1, fields=8))
+    assert len(notes.rules) == 8
+    assert len(notes.nearby_tickets) == 50
+    main.solve_1(notes)
+    main.solve_2(notes)
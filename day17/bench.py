@@ -0,0 +1,17 @@
+import pytest
+
+from runner.benchmark import Benchmark
+
+from . import generate, main
+
+
+@pytest.mark.parametrize('size', [3, 5, 8])
+def test_startup_cube(benchmark: Benchmark, size: int) -> None:
+    cube = main.parse_initial_state(generate.generate(size), 3)
+    benchmark(lambda: main.startup_cube(cube))
+
+
+@pytest.mark.parametrize('size', [1, 2])
+def test_startup_hypercube(benchmark: Benchmark, size: int) -> None:
+    hypercube = main.parse_initial_state(generate.generate(size), 4)
+    benchmark(lambda: main.startup_cube(hypercube))
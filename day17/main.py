@@ -151,19 +151,35 @@ def startup_cube(cube: ConwayCube[CubeState]) -> ConwayCube[CubeState]:
     return cube
 
 
+InitialCubes = Tuple[ConwayCube[CubeState], ConwayCube[CubeState]]
+
+
+def parse_input(raw_input: str) -> InitialCubes:
+    return (
+        parse_initial_state(raw_input, 3),
+        parse_initial_state(raw_input, 4),
+    )
+
+
+def solve_1(cubes: InitialCubes) -> int:
+    cube, _ = cubes
+    return len(startup_cube(cube))
+
+
+def solve_2(cubes: InitialCubes) -> int:
+    _, hypercube = cubes
+    return len(startup_cube(hypercube))
+
+
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        raw_lattice = f.read()
-        cube = parse_initial_state(raw_lattice, 3)
-        hypercube = parse_initial_state(raw_lattice, 4)
+        cubes = parse_input(f.read())
 
-    started_cube = startup_cube(cube)
-    answer_1 = len(started_cube)
+    answer_1 = solve_1(cubes)
     assert answer_1 == 338
     print(answer_1)
 
-    started_hypercube = startup_cube(hypercube)
-    answer_2 = len(started_hypercube)
+    answer_2 = solve_2(cubes)
     assert answer_2 == 2440
     print(answer_2)
 
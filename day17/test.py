@@ -1,6 +1,6 @@
 import pytest
 
-from . import main
+from . import generate, main
 
 
 @pytest.mark.slow
@@ -21,3 +21,8 @@ def test_startup_hypercube() -> None:
     cube = main.parse_initial_state(raw_lattice, 4)
 
     assert len(main.startup_cube(cube)) == 848
+
+
+def test_generate() -> None:
+    cubes = main.parse_input(generate.generate(3, seed=1))
+    main.solve_1(cubes)
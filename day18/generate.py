@@ -0,0 +1,20 @@
+import random
+
+
+def _expression(rng: random.Random, depth: int) -> str:
+    terms = []
+    for _ in range(rng.randint(2, 6)):
+        if depth > 0 and rng.random() < 0.25:
+            terms.append(f'({_expression(rng, depth - 1)})')
+        else:
+            terms.append(str(rng.randint(1, 9)))
+    expression = terms[0]
+    for term in terms[1:]:
+        expression += f" {rng.choice('+*')} {term}"
+    return expression
+
+
+def generate(size: int, seed: int = 0) -> str:
+    "size homework expressions nested at most three deep"
+    rng = random.Random(seed)
+    return ''.join(f'{_expression(rng, 3)}\n' for _ in range(size))
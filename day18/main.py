@@ -1,8 +1,13 @@
 import os.path
 import re
+from typing import List, Tuple
+
+from runner.stream import iter_lines, Source
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
+NUMBER_RE = re.compile(r'(\d+)')
+
 
 class NewNum:
     def __init__(self, num: int) -> None:
@@ -50,7 +55,7 @@ class NewerNum:
 
 def translate_raw_equation(raw_equation: str) -> str:
     return (
-        re.sub(r"(\d+)", lambda m: f"NewNum({m.group(0)})", raw_equation)
+        NUMBER_RE.sub(lambda m: f"NewNum({m.group(0)})", raw_equation)
         .replace('+', '<<')
         .replace('*', '>>')
     )
@@ -58,7 +63,7 @@ def translate_raw_equation(raw_equation: str) -> str:
 
 def other_translate_raw_equation(raw_equation: str) -> str:
     return (
-        re.sub(r"(\d+)", lambda m: f"NewerNum({m.group(0)})", raw_equation)
+        NUMBER_RE.sub(lambda m: f"NewerNum({m.group(0)})", raw_equation)
         .replace('+', '^')
         .replace('*', '+')
         .replace('^', '*')
@@ -85,15 +90,36 @@ def validate_equation(eq: str) -> None:
         )
 
 
+def parse_input(raw_input: Source) -> List[str]:
+    return list(iter_lines(raw_input))
+
+
+def solve_1(eqs: List[str]) -> int:
+    return sum(new_math(eq) for eq in eqs)
+
+
+def solve_2(eqs: List[str]) -> int:
+    return sum(newer_math(eq) for eq in eqs)
+
+
+def solve_stream(source: Source) -> Tuple[int, int]:
+    "Both answers in one pass over the lines, in constant memory"
+    total, newer_total = 0, 0
+    for eq in iter_lines(source):
+        total += new_math(eq)
+        newer_total += newer_math(eq)
+    return total, newer_total
+
+
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        eqs = list(f.readlines())
+        eqs = parse_input(f)
 
-    answer_1 = sum(new_math(eq) for eq in eqs)
+    answer_1 = solve_1(eqs)
     assert answer_1 == 13976444272545
     print(answer_1)
 
-    answer_2 = sum(newer_math(eq) for eq in eqs)
+    answer_2 = solve_2(eqs)
     assert answer_2 == 88500956630893
     print(answer_2)
 
@@ -2,7 +2,7 @@ from typing import Callable
 
 import pytest
 
-from . import main
+from . import generate, main
 
 
 def test_main() -> None:
@@ -43,3 +43,18 @@ def test_newer_math(eq: str, expected: int) -> None:
 def test_validate_equation(calculator: Callable[[str], int]) -> None:
     with pytest.raises(ValueError):
         calculator("hack('the_world')")
+
+
+def test_generate() -> None:
+    eqs = main.parse_input(generate.generate(50, seed=1))
+    assert len(eqs) == 50
+    main.solve_1(eqs)
+    main.solve_2(eqs)
+
+
+def test_solve_stream() -> None:
+    raw_input = generate.generate(50, seed=2)
+    eqs = main.parse_input(raw_input)
+    assert main.solve_stream(raw_input.splitlines(keepends=True)) == (
+        main.solve_1(eqs), main.solve_2(eqs)
+    )
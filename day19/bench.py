@@ -0,0 +1,23 @@
+import pytest
+
+from runner.benchmark import Benchmark
+
+from . import generate, main
+
+
+@pytest.mark.parametrize('length', [4, 5, 6])
+def test_parse_input(benchmark: Benchmark, length: int) -> None:
+    raw_input = generate.generate(100, length=length)
+    benchmark(lambda: main.parse_input(raw_input))
+
+
+@pytest.mark.parametrize('size', [100, 1_000])
+def test_solve_1(benchmark: Benchmark, size: int) -> None:
+    messages = main.parse_input(generate.generate(size, length=6))
+    benchmark(lambda: main.solve_1(messages))
+
+
+@pytest.mark.parametrize('size', [100, 1_000])
+def test_solve_2(benchmark: Benchmark, size: int) -> None:
+    messages = main.parse_input(generate.generate(size, length=6))
+    benchmark(lambda: main.solve_2(messages))
@@ -0,0 +1,101 @@
+import random
+from typing import Dict, Iterator, List, Tuple, Union
+
+Rule = Union[str, List[List[int]]]
+RESERVED = {0, 8, 11, 31, 42}
+
+
+def _fresh_ids() -> Iterator[int]:
+    rule_id = 1
+    while True:
+        if rule_id not in RESERVED:
+            yield rule_id
+        rule_id += 1
+
+
+def _build_rules(
+    length: int,
+    rng: random.Random,
+) -> Dict[int, Rule]:
+    """
+    Builds rules 42 and 31 so that between them they match every string of
+    a and b of the given length exactly once. Each level pairs up two
+    complementary rules from the level below, splitting on the first or
+    last letter.
+    """
+    ids = _fresh_ids()
+    letter_a, letter_b = next(ids), next(ids)
+    rules: Dict[int, Rule] = {letter_a: 'a', letter_b: 'b'}
+    pairs: List[Tuple[int, int]] = [(letter_a, letter_b)]
+    for level in range(2, length + 1):
+        new_pairs = []
+        for pair_num in range(1 if level == length else 2):
+            (p_0, p_1), (q_0, q_1) = rng.choice(pairs), rng.choice(pairs)
+            if level == length:
+                x, y = 42, 31
+            else:
+                x, y = next(ids), next(ids)
+            if rng.random() < 0.5:
+                rules[x] = [[letter_a, p_0], [letter_b, q_0]]
+                rules[y] = [[letter_a, p_1], [letter_b, q_1]]
+            else:
+                rules[x] = [[p_0, letter_a], [q_0, letter_b]]
+                rules[y] = [[p_1, letter_a], [q_1, letter_b]]
+            new_pairs.append((x, y))
+        pairs = new_pairs
+    rules[8] = [[42]]
+    rules[11] = [[42, 31]]
+    rules[0] = [[8, 11]]
+    return rules
+
+
+def _sample(rules: Dict[int, Rule], rule_id: int, rng: random.Random) -> str:
+    rule = rules[rule_id]
+    if isinstance(rule, str):
+        return rule
+    return ''.join(_sample(rules, ref, rng) for ref in rng.choice(rule))
+
+
+def _message(rules: Dict[int, Rule], rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.3:
+        n_42, n_31 = 2, 1
+    elif roll < 0.6:
+        n_31 = rng.randint(1, 3)
+        n_42 = n_31 + rng.randint(1, 3)
+    else:
+        n_42 = rng.randint(0, 4)
+        n_31 = rng.randint(max(n_42, 1), n_42 + 2)
+    chunks = (
+        [_sample(rules, 42, rng) for _ in range(n_42)] +
+        [_sample(rules, 31, rng) for _ in range(n_31)]
+    )
+    if roll >= 0.6 and rng.random() < 0.5:
+        rng.shuffle(chunks)
+    return ''.join(chunks)
+
+
+def _format_rule(rule_id: int, rule: Rule) -> str:
+    if isinstance(rule, str):
+        return f'{rule_id}: "{rule}"\n'
+    options = ' | '.join(' '.join(str(ref) for ref in opt) for opt in rule)
+    return f'{rule_id}: {options}\n'
+
+
+def generate(size: int, seed: int = 0, length: int = 8) -> str:
+    """
+    A grammar whose rules 42 and 31 each match strings of the given length,
+    followed by size messages. Messages are a mix of part one matches, part
+    two only matches and strings with too many 31 chunks or chunks out of
+    order.
+    """
+    if length < 2:
+        raise ValueError(f"length must be at least 2: got {length}")
+    rng = random.Random(seed)
+    rules = _build_rules(length, rng)
+    raw_rules = [
+        _format_rule(rule_id, rule) for rule_id, rule in rules.items()
+    ]
+    rng.shuffle(raw_rules)
+    messages = [_message(rules, rng) for _ in range(size)]
+    return ''.join(raw_rules) + '\n' + ''.join(f'{m}\n' for m in messages)
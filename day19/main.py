@@ -1,16 +1,19 @@
 from itertools import product
 import os.path
 import re
-from typing import Dict, Iterator, Set, Tuple
+from typing import Dict, Iterator, List, Set, Tuple
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
+NUMBER_RE = re.compile(r'(\d+)')
+REF_RE = re.compile(r'{(\d+)}')
+
 
 def parse_rule(raw_rule: str) -> Tuple[int, Set[str]]:
     ref, pipe_delim_parts = raw_rule.split(': ')
     parts = {
         (
-            re.sub(r'(\d+)', lambda m: f'{{{m.group(0)}}}', part)
+            NUMBER_RE.sub(lambda m: f'{{{m.group(0)}}}', part)
             .replace(' ', '')
             .replace('"', '')
         )
@@ -46,8 +49,8 @@ def simplify_rule(rule: Set[str], rule_dict: Dict[int, Set[str]]) -> Set[str]:
 
 
 def deref_option(option: str, rule_dict: Dict[int, Set[str]]) -> Set[str]:
-    refs = [int(match) for match in re.findall(r'{(\d+)}', option)]
-    anonymous_option = re.sub(r'\d+', '', option)
+    refs = [int(match) for match in REF_RE.findall(option)]
+    anonymous_option = NUMBER_RE.sub('', option)
     return {
         anonymous_option.format(*derefs) for derefs in
         product(*(rule_dict[ref] for ref in refs))
@@ -80,25 +83,40 @@ def matches_special_case(
     )
 
 
-def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        block_rules, block_examples = f.read().split('\n\n')
+Messages = Tuple[Dict[int, Set[str]], List[str]]
+
 
-    examples = block_examples.splitlines()
+def parse_input(raw_input: str) -> Messages:
+    block_rules, block_examples = raw_input.split('\n\n')
     rule_dict = dict(parse_rule(rule) for rule in block_rules.splitlines())
-    simple_rule_dict = fully_simplify_rule_dict(rule_dict)
+    return fully_simplify_rule_dict(rule_dict), block_examples.splitlines()
 
+
+def solve_1(messages: Messages) -> int:
+    simple_rule_dict, examples = messages
     rule_0 = simple_rule_dict[0]
-    answer_1 = sum(1 for example in examples if example in rule_0)
-    assert answer_1 == 176
-    print(answer_1)
+    return sum(1 for example in examples if example in rule_0)
+
 
+def solve_2(messages: Messages) -> int:
+    simple_rule_dict, examples = messages
     rule_42 = simple_rule_dict[42]
     rule_31 = simple_rule_dict[31]
-    answer_2 = sum(
+    return sum(
         1 for example in examples
         if matches_special_case(example, rule_42, rule_31)
     )
+
+
+def main() -> None:
+    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
+        messages = parse_input(f.read())
+
+    answer_1 = solve_1(messages)
+    assert answer_1 == 176
+    print(answer_1)
+
+    answer_2 = solve_2(messages)
     assert answer_2 == 352
     print(answer_2)
 
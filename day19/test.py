@@ -2,7 +2,7 @@ from typing import Iterator, Set, Tuple
 
 import pytest
 
-from . import main
+from . import generate, main
 
 
 @pytest.mark.slow
@@ -130,3 +130,13 @@ def flat_rules_42_and_31() -> Iterator[Tuple[Set[str], Set[str]]]:
     )
     simple_rule_dict = main.fully_simplify_rule_dict(rule_dict)
     yield simple_rule_dict[42], simple_rule_dict[31]
+
+
+def test_generate() -> None:
+    messages = main.parse_input(generate.generate(50, seed=1, length=4))
+    simple_rule_dict, examples = messages
+    assert len(examples) == 50
+    rule_42, rule_31 = simple_rule_dict[42], simple_rule_dict[31]
+    assert not rule_42 & rule_31
+    assert len(rule_42 | rule_31) == 2 ** 4
+    assert 0 < main.solve_1(messages) < main.solve_2(messages) < 50
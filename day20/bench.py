@@ -0,0 +1,25 @@
+import pytest
+
+from runner.benchmark import Benchmark
+
+from . import generate, main
+
+
+def initial_arrangement(side_len: int) -> main.TileArrangement:
+    return [[None] * side_len] * side_len
+
+
+@pytest.mark.parametrize('size', [3, 5, 8])
+def test_arrange_tiles(benchmark: Benchmark, size: int) -> None:
+    tiles = main.sort_by_edge_match_count(
+        main.parse_input(generate.generate(size))
+    )
+    benchmark(
+        lambda: next(main.arrange_tiles(tiles, initial_arrangement(size)))
+    )
+
+
+@pytest.mark.parametrize('size', [3, 5])
+def test_solve_2(benchmark: Benchmark, size: int) -> None:
+    tiles = main.parse_input(generate.generate(size))
+    benchmark(lambda: main.solve_2(tiles))
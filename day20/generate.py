@@ -0,0 +1,118 @@
+import random
+from typing import List, Set, Tuple
+
+from .main import (
+    Angle, Flip, flip_image, rev_str, rotate_image, sea_monster_pattern,
+)
+
+MAX_ATTEMPTS = 10_000
+
+
+def _image(side: int, rng: random.Random) -> List[List[str]]:
+    image = [
+        ['#' if rng.random() < 0.3 else '.' for _ in range(side)]
+        for _ in range(side)
+    ]
+    pattern = sea_monster_pattern()
+    height = max(row for row, _ in pattern) + 1
+    width = max(col for _, col in pattern) + 1
+    taken: Set[Tuple[int, int]] = set()
+    for _ in range(max(1, side * side // 600)):
+        row = rng.randrange(side - height + 1)
+        col = rng.randrange(side - width + 1)
+        cells = {(row + d_row, col + d_col) for d_row, d_col in pattern}
+        if cells & taken:
+            continue
+        taken |= cells
+        for cell_row, cell_col in cells:
+            image[cell_row][cell_col] = '#'
+    return image
+
+
+def _unique_edge(
+    first: str,
+    last: str,
+    length: int,
+    used: Set[str],
+    rng: random.Random,
+) -> str:
+    for _ in range(MAX_ATTEMPTS):
+        edge = (
+            first +
+            ''.join(rng.choice('#.') for _ in range(length - 2)) +
+            last
+        )
+        cannonical = min(edge, rev_str(edge))
+        if edge != rev_str(edge) and cannonical not in used:
+            used.add(cannonical)
+            return edge
+    raise ValueError(
+        f"could not find enough unique edges of length {length}, "
+        f"try a larger tile_size"
+    )
+
+
+def generate(size: int, seed: int = 0, tile_size: int = 10) -> str:
+    """
+    A size by size mosaic of shuffled, rotated and flipped tiles. Every
+    shared border is unique up to reversal so the tiles fit together in
+    exactly one way, and the assembled image contains at least one sea
+    monster. Large mosaics need a larger tile_size to have enough distinct
+    borders.
+    """
+    image_side = size * (tile_size - 2)
+    if image_side < 20:
+        raise ValueError(
+            f"a {size}x{size} mosaic of {tile_size} wide tiles is too small "
+            f"to hold a sea monster"
+        )
+    rng = random.Random(seed)
+    image = _image(image_side, rng)
+
+    step = tile_size - 1
+    lattice_side = size * step + 1
+    lattice = [['.'] * lattice_side for _ in range(lattice_side)]
+    for row in range(0, lattice_side, step):
+        for col in range(0, lattice_side, step):
+            lattice[row][col] = rng.choice('#.')
+
+    used: Set[str] = set()
+    for line in range(0, lattice_side, step):
+        for start in range(0, lattice_side - 1, step):
+            across = _unique_edge(
+                lattice[line][start], lattice[line][start + step],
+                tile_size, used, rng,
+            )
+            down = _unique_edge(
+                lattice[start][line], lattice[start + step][line],
+                tile_size, used, rng,
+            )
+            for offset in range(tile_size):
+                lattice[line][start + offset] = across[offset]
+                lattice[start + offset][line] = down[offset]
+
+    for row, image_row in enumerate(image):
+        for col, px in enumerate(image_row):
+            lattice[row + 1 + row // (tile_size - 2)][
+                col + 1 + col // (tile_size - 2)
+            ] = px
+
+    tile_ids = rng.sample(range(1000, 1000 + 10 * size * size), size * size)
+    raw_tiles = []
+    for tile_id, (tile_row, tile_col) in zip(
+        tile_ids,
+        ((r, c) for r in range(size) for c in range(size)),
+    ):
+        tile_image = '\n'.join(
+            ''.join(lattice[tile_row * step + d_row][
+                tile_col * step:tile_col * step + tile_size
+            ])
+            for d_row in range(tile_size)
+        )
+        tile_image = flip_image(
+            rotate_image(tile_image, rng.choice(list(Angle))),
+            rng.choice(list(Flip)),
+        )
+        raw_tiles.append(f'Tile {tile_id}:\n{tile_image}\n')
+    rng.shuffle(raw_tiles)
+    return '\n'.join(raw_tiles)
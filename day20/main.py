@@ -2,12 +2,15 @@ from collections import defaultdict
 from dataclasses import dataclass
 from enum import auto, Enum
 from itertools import product
+from math import isqrt
 import os.path
 from typing import (
     cast, Dict, Iterator, List, MutableMapping, NoReturn, Optional,
     Sequence, Tuple, TypeVar, Union
 )
 
+from runner import instrument
+
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
 TileArrangement = List[List[Optional["Tile"]]]
@@ -201,6 +204,7 @@ def arrange_tiles(
     tiles: List[Tile],
     initial_arr: TileArrangement,
 ) -> Iterator[List[List[Tile]]]:
+    instrument.count('day20.arrange_tiles')
     if arrangement_is_full(initial_arr):
         yield cast(List[List[Tile]], initial_arr)
     else:
@@ -362,31 +366,47 @@ def sea_monster_pattern() -> Dict[Tuple[int, int], str]:
     }
 
 
-def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        tiles = [parse_tile(tile.strip()) for tile in f.read().split('\n\n')]
+def parse_input(raw_input: str) -> List[Tile]:
+    return [parse_tile(tile.strip()) for tile in raw_input.split('\n\n')]
+
 
+@instrument.probe('day20.first_arrangement')
+def first_arrangement(tiles: List[Tile]) -> List[List[Tile]]:
     sorted_tiles = sort_by_edge_match_count(tiles)
-    side_len = 12
+    side_len = isqrt(len(tiles))
     assert side_len ** 2 == len(tiles)
     initial_arr: TileArrangement = [[None] * side_len] * side_len
+    return next(arrange_tiles(sorted_tiles, initial_arr))
 
-    arrangement = next(arrange_tiles(sorted_tiles, initial_arr))
-    answer_1 = (
+
+def solve_1(tiles: List[Tile]) -> int:
+    arrangement = first_arrangement(tiles)
+    return (
         arrangement[0][0].tile_id *
         arrangement[0][-1].tile_id *
         arrangement[-1][-1].tile_id *
         arrangement[-1][0].tile_id
     )
-    assert answer_1 == 12519494280967
-    print(answer_1)
 
-    image = make_image(arrangement)
+
+def solve_2(tiles: List[Tile]) -> int:
+    image = make_image(first_arrangement(tiles))
     highlighted_image = highlight_in_any_orientation(
         image, sea_monster_pattern(), '\x1b[6;30;42mO\x1b[0m'
     )
     # print(highlighted_image)
-    answer_2 = highlighted_image.count('#')
+    return highlighted_image.count('#')
+
+
+def main() -> None:
+    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
+        tiles = parse_input(f.read())
+
+    answer_1 = solve_1(tiles)
+    assert answer_1 == 12519494280967
+    print(answer_1)
+
+    answer_2 = solve_2(tiles)
     assert answer_2 == 2442
     print(answer_2)
 
@@ -3,7 +3,9 @@ from typing import Iterator, List, Optional, Tuple
 
 import pytest
 
-from . import main
+from runner.main import measure
+from runner.memory import MIB
+from . import generate, main
 
 
 @pytest.mark.slow
@@ -231,3 +233,17 @@ def test_tiles() -> Iterator[List[main.Tile]]:
         "..#.###...\n"
     )
     yield [main.parse_tile(tile.strip()) for tile in raw_tiles.split('\n\n')]
+
+
+def test_generate() -> None:
+    tiles = main.parse_input(generate.generate(3, seed=1))
+    assert len(tiles) == 9
+    main.solve_1(tiles)
+    main.solve_2(tiles)
+
+
+def test_memory_budget() -> None:
+    tiles = main.parse_input(generate.generate(8, seed=1))
+    _, measurement = measure(main.first_arrangement, tiles)
+    assert measurement.peak_memory is not None
+    assert measurement.peak_memory < MIB // 2
@@ -0,0 +1,63 @@
+import random
+from string import ascii_lowercase
+from typing import List, Set
+
+
+def _words(count: int, rng: random.Random) -> List[str]:
+    words: Set[str] = set()
+    while len(words) < count:
+        words.add(''.join(
+            rng.choice(ascii_lowercase) for _ in range(rng.randint(4, 8))
+        ))
+    return sorted(words)
+
+
+def generate(
+    size: int,
+    seed: int = 0,
+    ingredients: int = 200,
+    allergens: int = 8,
+) -> str:
+    """
+    A list of size foods drawn from the given numbers of ingredients and
+    allergens. Each allergen is in exactly one ingredient and appears in at
+    least two foods with no other ingredient in common, so every allergen
+    can be pinned down.
+    """
+    if size < 2 * allergens:
+        raise ValueError(
+            f"size must be at least {2 * allergens} for {allergens} "
+            f"allergens: got {size}"
+        )
+    if ingredients <= allergens:
+        raise ValueError("there must be more ingredients than allergens")
+    rng = random.Random(seed)
+    words = _words(ingredients + allergens, rng)
+    rng.shuffle(words)
+    allergen_names = words[:allergens]
+    ingredient_names = words[allergens:]
+    carriers = ingredient_names[:allergens]
+    safe = ingredient_names[allergens:]
+
+    foods = []
+    for allergen, carrier in zip(allergen_names, carriers):
+        first, second = rng.sample(safe, 2)
+        foods.append(([carrier, first], [allergen]))
+        foods.append(([carrier, second], [allergen]))
+    while len(foods) < size:
+        contained = rng.sample(range(allergens), rng.randint(1, 3))
+        listed = rng.sample(contained, rng.randint(1, len(contained)))
+        food = (
+            [carriers[i] for i in contained] +
+            rng.sample(safe, rng.randint(1, min(len(safe), 15)))
+        )
+        foods.append((food, [allergen_names[i] for i in listed]))
+    rng.shuffle(foods)
+
+    lines = []
+    for food, listed_allergens in foods:
+        rng.shuffle(food)
+        lines.append(
+            f"{' '.join(food)} (contains {', '.join(listed_allergens)})\n"
+        )
+    return ''.join(lines)
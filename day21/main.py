@@ -1,10 +1,16 @@
 from dataclasses import dataclass
 import os.path
 import re
-from typing import Collection, Container, Dict, FrozenSet, Iterable, Mapping
+from typing import (
+    Collection, Container, Dict, FrozenSet, Iterable, Mapping, Set,
+)
+
+from runner.stream import iter_lines, Source
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
+FOOD_INFO_RE = re.compile(r"([^\(]+) \(contains ([^\)]+)\)")
+
 
 @dataclass(frozen=True)
 class FoodInfo:
@@ -13,7 +19,7 @@ class FoodInfo:
 
 
 def parse_food_info(line: str) -> FoodInfo:
-    match = re.fullmatch(r"([^\(]+) \(contains ([^\)]+)\)", line)
+    match = FOOD_INFO_RE.fullmatch(line)
     assert match is not None
     raw_ingredients, raw_alergens = match.groups()
     return FoodInfo(
@@ -81,33 +87,49 @@ def determine_allergens(
     return definite_allergens
 
 
-def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        food_infos = {parse_food_info(line.strip()) for line in f.readlines()}
+def parse_input(raw_input: Source) -> Set[FoodInfo]:
+    return {parse_food_info(line) for line in iter_lines(raw_input)}
+
 
+def solve_1(food_infos: Set[FoodInfo]) -> int:
     all_ingredients = collect_ingredients(food_infos)
-    all_allergens = collect_allergens(food_infos)
     possible_allergens = find_possible_allergens(
         food_infos,
-        all_allergens,
+        collect_allergens(food_infos),
         all_ingredients,
     )
     safe_ingredients = eliminate_possible_allergens(
         possible_allergens, all_ingredients
     )
-    answer_1 = sum(
+    return sum(
         sum(1 for food_info in food_infos
             if safe_ingredient in food_info.ingredients)
         for safe_ingredient in safe_ingredients
     )
-    assert answer_1 == 2374
-    print(answer_1)
 
+
+def solve_2(food_infos: Set[FoodInfo]) -> str:
+    possible_allergens = find_possible_allergens(
+        food_infos,
+        collect_allergens(food_infos),
+        collect_ingredients(food_infos),
+    )
     definite_allergens = determine_allergens(possible_allergens)
-    answer_2 = ','.join(
+    return ','.join(
         pair[1]
         for pair in sorted(definite_allergens.items(), key=lambda p: p[0])
     )
+
+
+def main() -> None:
+    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
+        food_infos = parse_input(f)
+
+    answer_1 = solve_1(food_infos)
+    assert answer_1 == 2374
+    print(answer_1)
+
+    answer_2 = solve_2(food_infos)
     assert answer_2 == 'fbtqkzc,jbbsjh,cpttmnv,ccrbr,tdmqcl,vnjxjg,nlph,mzqjxq'
     print(answer_2)
 
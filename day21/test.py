@@ -2,7 +2,7 @@ from typing import Iterator, List
 
 import pytest
 
-from . import main
+from . import generate, main
 
 
 def test_main() -> None:
@@ -57,3 +57,11 @@ def food_infos() -> Iterator[List[main.FoodInfo]]:
         "sqjhc mxmxvkd sbzzf (contains fish)\n"
     ).strip()
     yield [main.parse_food_info(line) for line in raw_food_infos.splitlines()]
+
+
+def test_generate() -> None:
+    food_infos = main.parse_input(
+        generate.generate(50, seed=1, ingredients=30, allergens=4)
+    )
+    main.solve_1(food_infos)
+    assert len(main.solve_2(food_infos).split(',')) == 4
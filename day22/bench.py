@@ -0,0 +1,17 @@
+import pytest
+
+from runner.benchmark import Benchmark
+
+from . import generate, main
+
+
+@pytest.mark.parametrize('size', [25, 100, 400])
+def test_combat(benchmark: Benchmark, size: int) -> None:
+    deck_1, deck_2 = main.parse_input(generate.generate(size))
+    benchmark(lambda: main.combat(deck_1, deck_2))
+
+
+@pytest.mark.parametrize('size', [10, 15, 20])
+def test_recursive_combat(benchmark: Benchmark, size: int) -> None:
+    deck_1, deck_2 = main.parse_input(generate.generate(size))
+    benchmark(lambda: main.recursive_combat(deck_1, deck_2))
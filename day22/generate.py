@@ -0,0 +1,40 @@
+import random
+from collections import deque
+from typing import Deque, List, Set
+
+
+def _combat_terminates(deck_1: List[int], deck_2: List[int]) -> bool:
+    queue_1: Deque[int] = deque(deck_1)
+    queue_2: Deque[int] = deque(deck_2)
+    seen: Set[int] = set()
+    while queue_1 and queue_2:
+        state = hash((tuple(queue_1), tuple(queue_2)))
+        if state in seen:
+            return False
+        seen.add(state)
+        card_1, card_2 = queue_1.popleft(), queue_2.popleft()
+        if card_1 > card_2:
+            queue_1.extend((card_1, card_2))
+        else:
+            queue_2.extend((card_2, card_1))
+    return True
+
+
+def generate(size: int, seed: int = 0) -> str:
+    """
+    Two decks of size cards each. Deals where regular combat would never
+    end are discarded and redealt.
+    """
+    if size < 1:
+        raise ValueError(f"size must be at least 1: got {size}")
+    rng = random.Random(seed)
+    while True:
+        cards = list(range(1, 2 * size + 1))
+        rng.shuffle(cards)
+        deck_1, deck_2 = cards[:size], cards[size:]
+        if _combat_terminates(deck_1, deck_2):
+            break
+    return (
+        'Player 1:\n' + ''.join(f'{card}\n' for card in deck_1) +
+        '\nPlayer 2:\n' + ''.join(f'{card}\n' for card in deck_2)
+    )
@@ -74,20 +74,30 @@ def recursive_combat(
             return EndState.TWO_WON, deck_1, deck_2
 
 
+def parse_input(raw_input: str) -> Tuple[Deck, Deck]:
+    raw_deck_1, raw_deck_2 = raw_input.split('\n\n')
+    return parse_deck(raw_deck_1), parse_deck(raw_deck_2)
+
+
+def solve_1(decks: Tuple[Deck, Deck]) -> int:
+    res_1, res_2 = combat(*decks)
+    return max(score_deck(res_1), score_deck(res_2))
+
+
+def solve_2(decks: Tuple[Deck, Deck]) -> int:
+    _, rec_res_1, rec_res_2 = recursive_combat(*decks)
+    return max(score_deck(rec_res_1), score_deck(rec_res_2))
+
+
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        raw_deck_1, raw_deck_2 = f.read().split('\n\n')
-
-    deck_1 = parse_deck(raw_deck_1)
-    deck_2 = parse_deck(raw_deck_2)
+        decks = parse_input(f.read())
 
-    res_1, res_2 = combat(deck_1, deck_2)
-    answer_1 = max(score_deck(res_1), score_deck(res_2))
+    answer_1 = solve_1(decks)
     assert answer_1 == 32472
     print(answer_1)
 
-    _, rec_res_1, rec_res_2 = recursive_combat(deck_1, deck_2)
-    answer_2 = max(score_deck(rec_res_1), score_deck(rec_res_2))
+    answer_2 = solve_2(decks)
     assert answer_2 == 36463
     print(answer_2)
 
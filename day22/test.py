@@ -1,6 +1,6 @@
 import pytest
 
-from . import main
+from . import generate, main
 
 
 @pytest.mark.slow
@@ -28,3 +28,10 @@ def test_recursive_combat() -> None:
     assert end_state is main.EndState.TWO_WON
     assert res_1 == ()
     assert res_2 == (7, 5, 6, 2, 4, 1, 10, 8, 9, 3)
+
+
+def test_generate() -> None:
+    decks = main.parse_input(generate.generate(10, seed=1))
+    assert sorted(decks[0] + decks[1]) == list(range(1, 21))
+    main.solve_1(decks)
+    main.solve_2(decks)
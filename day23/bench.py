@@ -0,0 +1,19 @@
+import pytest
+
+from runner.benchmark import Benchmark
+
+from . import generate, main
+
+
+@pytest.mark.parametrize(
+    ['cups', 'rounds'],
+    (
+        (9, 10_000),
+        (10_000, 10_000),
+        (100_000, 100_000),
+    )
+)
+def test_cup_game(benchmark: Benchmark, cups: int, rounds: int) -> None:
+    order = main.parse_input(generate.generate(9))
+    order += list(range(10, cups + 1))
+    benchmark(lambda: main.cup_game(order, rounds))
@@ -0,0 +1,14 @@
+import random
+
+
+def generate(size: int = 9, seed: int = 0) -> str:
+    """
+    An arrangement of size cups. Cups are labelled with single digits so
+    there are at most nine; the solvers scale with the rounds they play
+    rather than the input.
+    """
+    if not 1 <= size <= 9:
+        raise ValueError(f"size must be between 1 and 9: got {size}")
+    rng = random.Random(seed)
+    cups = rng.sample(range(1, size + 1), size)
+    return ''.join(str(cup) for cup in cups) + '\n'
@@ -2,6 +2,8 @@ from itertools import islice
 import os.path
 from typing import Generic, Hashable, Iterable, Iterator, List, TypeVar
 
+from runner import instrument
+
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
 H = TypeVar('H', bound=Hashable)
@@ -45,12 +47,14 @@ class Rosary(Generic[H]):
     def scan_next(self) -> None:
         self._active = self._lookup[self._active]
 
+    @instrument.probe('day23.cut')
     def cut(self, length: int) -> List[H]:
         "Cut after active location, tecnically leaks memory but not materially"
         segment = [v for v in islice(self, 1, length + 1)]
         self._lookup[self._active] = self._lookup[segment[-1]]
         return segment
 
+    @instrument.probe('day23.insert')
     def insert(self, segment: Iterable[H]) -> None:
         last_value = self._lookup[self._active]
         key = self._active
@@ -78,18 +82,30 @@ def cup_game(order: List[int], rounds: int) -> List[int]:
     return rosary.cut(n_cups)
 
 
+def parse_input(raw_input: str) -> List[int]:
+    return [int(i) for i in raw_input.strip()]
+
+
+def solve_1(order: List[int]) -> int:
+    end_order = cup_game(order, 100)
+    return int(''.join(str(i) for i in end_order[:-1]))
+
+
+def solve_2(order: List[int]) -> int:
+    more_order = order + list(range(max(order) + 1, 1_000_001))
+    more_end_order = cup_game(more_order, 10_000_000)
+    return more_end_order[0] * more_end_order[1]
+
+
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        order = [int(i) for i in f.read().strip()]
+        order = parse_input(f.read())
 
-    end_order = cup_game(order, 100)
-    answer_1 = int(''.join(str(i) for i in end_order[:-1]))
+    answer_1 = solve_1(order)
     assert answer_1 == 24798635
     print(answer_1)
 
-    more_order = order + list(range(max(order) + 1, 1_000_001))
-    more_end_order = cup_game(more_order, 10_000_000)
-    answer_2 = more_end_order[0] * more_end_order[1]
+    answer_2 = solve_2(order)
     assert answer_2 == 12757828710
     print(answer_2)
 
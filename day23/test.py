@@ -2,7 +2,9 @@ from typing import List
 
 import pytest
 
-from . import main
+from runner.main import measure
+from runner.memory import MIB
+from . import generate, main
 
 
 @pytest.mark.slow
@@ -20,3 +22,18 @@ def test_main() -> None:
 def test_moves(num_moves: int, expected: List[int]) -> None:
     order = [3, 8, 9, 1, 2, 5, 4, 6, 7]
     assert main.cup_game(order, num_moves) == expected
+
+
+def test_generate() -> None:
+    order = main.parse_input(generate.generate(9, seed=1))
+    assert sorted(order) == list(range(1, 10))
+    main.solve_1(order)
+    with pytest.raises(ValueError):
+        generate.generate(10)
+
+
+def test_memory_budget() -> None:
+    order = [3, 8, 9, 1, 2, 5, 4, 6, 7] + list(range(10, 50_001))
+    _, measurement = measure(lambda n: main.cup_game(order, n), 50_000)
+    assert measurement.peak_memory is not None
+    assert measurement.peak_memory < 12 * MIB
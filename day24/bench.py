@@ -0,0 +1,25 @@
+import pytest
+
+from runner.benchmark import Benchmark
+
+from . import generate, main
+
+
+@pytest.mark.parametrize('size', [100, 1_000])
+def test_solve_1(benchmark: Benchmark, size: int) -> None:
+    vecs = main.parse_input(generate.generate(size))
+    benchmark(lambda: main.solve_1(vecs))
+
+
+@pytest.mark.parametrize('days', [1, 5, 10])
+def test_next_arrangement(benchmark: Benchmark, days: int) -> None:
+    tiles = main.tiles_from_initial_vecs(
+        main.parse_input(generate.generate(300))
+    )
+
+    def flip_days() -> main.TileArr:
+        tile_arr = tiles
+        for _ in range(days):
+            tile_arr = main.next_arrangement(tile_arr)
+        return tile_arr
+    benchmark(flip_days)
@@ -0,0 +1,13 @@
+import random
+
+DIRECTIONS = ['e', 'se', 'sw', 'w', 'nw', 'ne']
+
+
+def generate(size: int, seed: int = 0) -> str:
+    "size tile paths of ten to twenty steps each"
+    rng = random.Random(seed)
+    return ''.join(
+        ''.join(rng.choice(DIRECTIONS) for _ in range(rng.randint(10, 20))) +
+        '\n'
+        for _ in range(size)
+    )
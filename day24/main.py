@@ -3,7 +3,11 @@ from dataclasses import dataclass
 from enum import auto, Enum
 import os.path
 import re
-from typing import DefaultDict, Iterable, NoReturn, Set
+from typing import (
+    DefaultDict, Iterable, List, NoReturn, Set, Tuple, Type,
+)
+
+from runner.stream import iter_lines, Source
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
@@ -17,6 +21,10 @@ class Vec:
     def __add__(self, other: "Vec") -> "Vec":
         return Vec(self.q + other.q, self.r + other.r)
 
+    def __reduce__(self) -> Tuple[Type["Vec"], Tuple[int, int]]:
+        "frozen slotted dataclasses can not be unpickled from their slots"
+        return Vec, (self.q, self.r)
+
 
 CARDINALS = {
     'ne': Vec(1, -1),
@@ -26,10 +34,11 @@ CARDINALS = {
     'e': Vec(1, 0),
     'w': Vec(-1, 0),
 }
+STEP_RE = re.compile('|'.join(CARDINALS))
 
 
 def parse_steps(raw_steps: str) -> Vec:
-    delimited_steps = re.findall('ne|nw|se|sw|e|w', raw_steps)
+    delimited_steps = STEP_RE.findall(raw_steps)
     return sum(
         (CARDINALS[raw_step] for raw_step in delimited_steps), Vec(0, 0)
     )
@@ -90,19 +99,30 @@ def next_tile(tile: Tile, black_neighbor_count: int) -> Tile:
     raise ValueError(f"found absurd with value {absurd}")
 
 
-def main() -> None:
-    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        vecs = [parse_steps(raw_steps) for raw_steps in f.readlines()]
+def parse_input(raw_input: Source) -> List[Vec]:
+    return [parse_steps(raw_steps) for raw_steps in iter_lines(raw_input)]
 
+
+def solve_1(vecs: List[Vec]) -> int:
+    return count_black_tiles(tiles_from_initial_vecs(vecs))
+
+
+def solve_2(vecs: List[Vec]) -> int:
     tiles = tiles_from_initial_vecs(vecs)
+    for _ in range(100):
+        tiles = next_arrangement(tiles)
+    return count_black_tiles(tiles)
+
 
-    answer_1 = count_black_tiles(tiles)
+def main() -> None:
+    with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
+        vecs = parse_input(f)
+
+    answer_1 = solve_1(vecs)
     assert answer_1 == 232
     print(answer_1)
 
-    for _ in range(100):
-        tiles = next_arrangement(tiles)
-    answer_2 = count_black_tiles(tiles)
+    answer_2 = solve_2(vecs)
     assert answer_2 == 3519
     print(answer_2)
 
@@ -2,7 +2,7 @@ from typing import DefaultDict, Generator
 
 import pytest
 
-from . import main
+from . import generate, main
 
 
 @pytest.mark.slow
@@ -94,3 +94,9 @@ def initial_arr() -> Generator[DefaultDict[main.Vec, main.Tile], None, None]:
     ]
     vecs = [main.parse_steps(raw_steps) for raw_steps in raw_tiles]
     yield main.tiles_from_initial_vecs(vecs)
+
+
+def test_generate() -> None:
+    vecs = main.parse_input(generate.generate(50, seed=1))
+    assert len(vecs) == 50
+    main.solve_1(vecs)
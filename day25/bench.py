@@ -0,0 +1,11 @@
+import pytest
+
+from runner.benchmark import Benchmark
+
+from . import main
+
+
+@pytest.mark.parametrize('loop_size', [10_000, 100_000, 1_000_000])
+def test_decode_pubkey(benchmark: Benchmark, loop_size: int) -> None:
+    pubkey = main.pubkey(loop_size)
+    benchmark(lambda: main.decode_pubkey(pubkey))
@@ -0,0 +1,12 @@
+import random
+
+from .main import MODULUS, pubkey
+
+
+def generate(size: int, seed: int = 0) -> str:
+    "A card and door public key each with a loop size of at most size"
+    if not 1 <= size < MODULUS:
+        raise ValueError(f"size must be between 1 and {MODULUS - 1}")
+    rng = random.Random(seed)
+    card_loop_size, door_loop_size = (rng.randint(1, size) for _ in range(2))
+    return f'{pubkey(card_loop_size)}\n{pubkey(door_loop_size)}\n'
@@ -1,7 +1,9 @@
 from functools import reduce
 from itertools import accumulate
 import os.path
-from typing import Callable
+from typing import Callable, Tuple
+
+from runner.stream import iter_lines, Source
 
 SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
 
@@ -39,12 +41,22 @@ def decode_pubkey(
     )
 
 
+def parse_input(raw_input: Source) -> Tuple[int, int]:
+    card_pubkey, door_pubkey = (int(line) for line in iter_lines(raw_input))
+    return card_pubkey, door_pubkey
+
+
+def solve_1(pubkeys: Tuple[int, int]) -> int:
+    card_pubkey, door_pubkey = pubkeys
+    card_loop_size = decode_pubkey(card_pubkey)
+    return pubkey(card_loop_size, subject_number=door_pubkey)
+
+
 def main() -> None:
     with open(f'{SCRIPT_DIR}/input.txt', 'r') as f:
-        card_pubkey, door_pubkey = (int(line) for line in f.readlines())
+        pubkeys = parse_input(f)
 
-    card_loop_size = decode_pubkey(card_pubkey)
-    answer_1 = pubkey(card_loop_size, subject_number=door_pubkey)
+    answer_1 = solve_1(pubkeys)
     assert answer_1 == 181800
     print(answer_1)
 
@@ -1,6 +1,6 @@
 import pytest
 
-from . import main
+from . import generate, main
 
 
 @pytest.mark.slow
@@ -28,3 +28,14 @@ def test_decode_pubkey(pubkey: int, loop_size: int) -> None:
 )
 def test_second_encoding(pubkey: int, loop_size: int) -> None:
     assert main.pubkey(loop_size, subject_number=pubkey) == 14897079
+
+
+def test_generate() -> None:
+    card_pubkey, door_pubkey = main.parse_input(generate.generate(50, seed=1))
+    card_loop_size = main.decode_pubkey(card_pubkey)
+    door_loop_size = main.decode_pubkey(door_pubkey)
+    assert card_loop_size <= 50
+    assert door_loop_size <= 50
+    assert main.solve_1((card_pubkey, door_pubkey)) == main.pubkey(
+        door_loop_size, subject_number=card_pubkey
+    )
@@ -0,0 +1,157 @@
+"""
+Solves one day over many inputs in a single process, or a pool of them, so
+module level tables and compiled patterns are built once per worker rather
+than once per input.
+"""
+from dataclasses import asdict, dataclass
+import os.path
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .main import load_day
+from .stream import open_input, STDIN
+
+DEFAULT_SEPARATOR = '%%'
+CHUNK_SIZE = 16
+
+BatchInput = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class BatchRecord:
+    name: str
+    answers: Dict[str, str]
+    wall_time: float
+    error: Optional[str] = None
+
+
+def split_stream(
+    lines: Iterable[str],
+    separator: str = DEFAULT_SEPARATOR,
+    name: str = STDIN,
+) -> Iterator[BatchInput]:
+    "Inputs of a concatenated stream, delimited by lines holding separator"
+    index = 0
+    buffer: List[str] = []
+    for line in lines:
+        if line.rstrip('\r\n') == separator:
+            yield f'{name}:{index}', ''.join(buffer)
+            index += 1
+            buffer = []
+        else:
+            buffer.append(line)
+    if any(line.strip() for line in buffer):
+        yield f'{name}:{index}', ''.join(buffer)
+
+
+def read_directory(directory: str) -> Iterator[BatchInput]:
+    for entry in sorted(os.listdir(directory)):
+        path = os.path.join(directory, entry)
+        if os.path.isfile(path):
+            with open(path, 'r') as f:
+                yield entry, f.read()
+
+
+def iter_inputs(
+    path: str,
+    separator: str = DEFAULT_SEPARATOR,
+) -> Iterator[BatchInput]:
+    "Every file of a directory, or the inputs of a concatenated file or stdin"
+    if path != STDIN and os.path.isdir(path):
+        yield from read_directory(path)
+        return
+    with open_input(path) as f:
+        yield from split_stream(f, separator, path)
+
+
+def solve_one(number: int, batch_input: BatchInput) -> BatchRecord:
+    name, raw_input = batch_input
+    day = load_day(number)
+    start = time.perf_counter()
+    answers: Dict[str, str] = {}
+    try:
+        parsed = day.parse_input(raw_input)
+        for stage, solver in day.solvers.items():
+            answers[stage] = str(solver(parsed))
+    except Exception as e:
+        return BatchRecord(
+            name, answers, time.perf_counter() - start, repr(e)
+        )
+    return BatchRecord(name, answers, time.perf_counter() - start)
+
+
+def solve_batch(
+    number: int,
+    inputs: Iterable[BatchInput],
+    jobs: int = 1,
+) -> Iterator[BatchRecord]:
+    """
+    One record per input in input order. A failing input is recorded with
+    its error rather than stopping the batch.
+    """
+    if jobs == 1:
+        for batch_input in inputs:
+            yield solve_one(number, batch_input)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import partial
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(
+            partial(solve_one, number), inputs, chunksize=CHUNK_SIZE
+        )
+
+
+def format_record(record: BatchRecord) -> str:
+    import json
+
+    return json.dumps(asdict(record))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    from argparse import ArgumentParser
+
+    parser = ArgumentParser(
+        description='Solve one day over many inputs, printing a JSON record '
+                    'per input'
+    )
+    parser.add_argument('day', metavar='DAY', type=int)
+    parser.add_argument(
+        'path', metavar='PATH', nargs='?', default=STDIN,
+        help='directory with one input per file, or a file of inputs '
+             f'delimited by separator lines (default: {STDIN}, stdin)',
+    )
+    parser.add_argument(
+        '--separator', default=DEFAULT_SEPARATOR,
+        help='line between concatenated inputs '
+             f'(default: {DEFAULT_SEPARATOR})',
+    )
+    parser.add_argument(
+        '-j', '--jobs', type=int, nargs='?', default=1,
+        const=os.cpu_count() or 1,
+        help='solve inputs in a pool of JOBS processes '
+             '(default: 1, bare -j: one per core)',
+    )
+    args = parser.parse_args(argv)
+    jobs: int = args.jobs
+    if jobs < 1:
+        parser.error(f"--jobs must be at least 1, got {jobs}")
+    try:
+        load_day(args.day)
+    except (ImportError, ValueError) as e:
+        parser.error(str(e))
+
+    failed = False
+    for record in solve_batch(
+        args.day, iter_inputs(args.path, args.separator), jobs
+    ):
+        failed = failed or record.error is not None
+        print(format_record(record), flush=jobs == 1)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
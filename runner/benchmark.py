@@ -0,0 +1,106 @@
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+import json
+import os.path
+import time
+from typing import Callable, Dict, Iterable, Tuple, TypeVar
+
+SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
+BASELINE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(SCRIPT_DIR)), 'benchmarks.json'
+)
+DEFAULT_THRESHOLD = 2.0
+# baselines below this are compared as if they were this long, since timer
+# and scheduler noise alone can double a few microseconds
+MIN_BASELINE = 5e-5
+
+A = TypeVar('A')
+
+
+class PerformanceRegression(AssertionError):
+    pass
+
+
+def matches_any(name: str, patterns: Iterable[str]) -> bool:
+    "Whether name is one of patterns or matches one of them as a glob"
+    return any(
+        name == pattern or fnmatchcase(name, pattern) for pattern in patterns
+    )
+
+
+@dataclass
+class BaselineStore:
+    baselines: Dict[str, float]
+    results: Dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: str = BASELINE_PATH) -> "BaselineStore":
+        if not os.path.exists(path):
+            return cls({})
+        with open(path, 'r') as f:
+            baselines: Dict[str, float] = json.load(f)
+        return cls(baselines)
+
+    def save(
+        self,
+        path: str = BASELINE_PATH,
+        update: Iterable[str] = (),
+    ) -> None:
+        """
+        Adds the results of benchmarks without a baseline, and replaces the
+        baselines of only those that match one of the update patterns.
+        """
+        update = list(update)
+        merged = dict(self.baselines)
+        for name, elapsed in self.results.items():
+            if name not in merged or matches_any(name, update):
+                merged[name] = elapsed
+        with open(path, 'w') as f:
+            json.dump(dict(sorted(merged.items())), f, indent=2)
+            f.write('\n')
+
+
+def time_call(
+    func: Callable[[], A],
+    min_rounds: int = 5,
+    max_rounds: int = 1000,
+    min_time: float = 0.2,
+) -> Tuple[A, float]:
+    """
+    Calls func repeatedly and returns its result along with the fastest
+    round, which is the least noisy estimate of what the code itself costs.
+    Fast functions get many rounds, so a stray slow one can't set the time.
+    """
+    best = float('inf')
+    total = 0.0
+    rounds = 0
+    while rounds < min_rounds or (rounds < max_rounds and total < min_time):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+        rounds += 1
+    return result, best
+
+
+@dataclass
+class Benchmark:
+    name: str
+    store: BaselineStore
+    threshold: float = DEFAULT_THRESHOLD
+    compare: bool = True
+    min_baseline: float = MIN_BASELINE
+
+    def __call__(self, func: Callable[[], A]) -> A:
+        result, elapsed = time_call(func)
+        self.store.results[self.name] = elapsed
+        baseline = self.store.baselines.get(self.name)
+        if self.compare and baseline is not None:
+            limit = max(baseline, self.min_baseline) * self.threshold
+            if elapsed > limit:
+                raise PerformanceRegression(
+                    f"{self.name} took {elapsed:.6f}s, more than "
+                    f"{self.threshold}x its baseline of {baseline:.6f}s"
+                )
+        return result
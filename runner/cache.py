@@ -0,0 +1,124 @@
+from dataclasses import dataclass
+from hashlib import sha256
+import os
+import os.path
+import pickle
+from typing import Callable, List, Tuple, TypeVar
+
+SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(SCRIPT_DIR)), '.parse-cache'
+)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+SUFFIX = '.pickle'
+
+A = TypeVar('A')
+
+
+def fingerprint(data: bytes) -> str:
+    return sha256(data).hexdigest()[:16]
+
+
+def source_fingerprint(path: str) -> str:
+    with open(path, 'rb') as f:
+        return fingerprint(f.read())
+
+
+@dataclass(frozen=True)
+class ParseCache:
+    """
+    Pickled parse results on disk, keyed by a namespace (usually the day),
+    a version of the code that produced them and a hash of the raw input.
+    Entries from another version of the same namespace are stale and are
+    dropped on lookup. Once the cache outgrows max_bytes the least recently
+    used entries are evicted.
+    """
+    directory: str = DEFAULT_CACHE_DIR
+    max_bytes: int = DEFAULT_MAX_BYTES
+
+    def _path(self, namespace: str, version: str, input_hash: str) -> str:
+        return os.path.join(
+            self.directory, f'{namespace}-{version}-{input_hash}{SUFFIX}'
+        )
+
+    def _entries(self) -> List[str]:
+        if not os.path.isdir(self.directory):
+            return []
+        return [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(SUFFIX)
+        ]
+
+    def drop_stale(self, namespace: str, version: str) -> None:
+        for path in self._entries():
+            entry_namespace, entry_version, _ = (
+                os.path.basename(path).split('-', 2)
+            )
+            if entry_namespace == namespace and entry_version != version:
+                _remove(path)
+
+    def evict(self) -> None:
+        sized = []
+        for path in self._entries():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            sized.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in sized)
+        for _, size, path in sorted(sized):
+            if total <= self.max_bytes:
+                break
+            _remove(path)
+            total -= size
+
+    def load_or_parse(
+        self,
+        namespace: str,
+        version: str,
+        raw_input: str,
+        parse: Callable[[str], A],
+    ) -> Tuple[A, bool]:
+        "Returns the parsed input and whether it came from the cache"
+        self.drop_stale(namespace, version)
+        path = self._path(
+            namespace, version, fingerprint(raw_input.encode())
+        )
+        try:
+            with open(path, 'rb') as f:
+                parsed: A = pickle.load(f)
+        except FileNotFoundError:
+            pass
+        except (pickle.UnpicklingError, EOFError, AttributeError):
+            _remove(path)
+        else:
+            os.utime(path)
+            return parsed, True
+
+        parsed = parse(raw_input)
+        self._store(path, parsed)
+        return parsed, False
+
+    def _store(self, path: str, parsed: object) -> None:
+        import tempfile
+
+        try:
+            data = pickle.dumps(parsed)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return
+        if len(data) > self.max_bytes:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self.evict()
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
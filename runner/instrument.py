@@ -0,0 +1,180 @@
+"""
+Opt-in counters, timers and call counts for solvers to record into.
+
+Instrumentation is switched on by setting AOC_INSTRUMENT=1 or by passing
+--instrument to the runner, either of which must happen before the days are
+imported. While it is off, probe hands back the undecorated function and the
+other hooks return at once, so instrumented code runs as it would without
+them.
+"""
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+import os
+import time
+from typing import (
+    Callable, ContextManager, DefaultDict, Dict, Iterator, List, Optional,
+    ParamSpec, Tuple, TypeVar,
+)
+
+ENV_VAR = 'AOC_INSTRUMENT'
+TOP_ALLOCATIONS = 5
+
+P = ParamSpec('P')
+R = TypeVar('R')
+
+
+@dataclass
+class Recorder:
+    counters: DefaultDict[str, int] = field(
+        default_factory=lambda: defaultdict(int)
+    )
+    calls: DefaultDict[str, int] = field(
+        default_factory=lambda: defaultdict(int)
+    )
+    timings: DefaultDict[str, float] = field(
+        default_factory=lambda: defaultdict(float)
+    )
+    self_times: DefaultDict[str, float] = field(
+        default_factory=lambda: defaultdict(float)
+    )
+    allocations: Dict[str, List[Tuple[str, int]]] = field(
+        default_factory=dict
+    )
+    _stack: List[str] = field(default_factory=list)
+    _child_times: List[float] = field(default_factory=list)
+
+    def enter(self, name: str) -> None:
+        self._stack.append(name)
+        self._child_times.append(0.0)
+
+    def exit(self, name: str, elapsed: float) -> None:
+        path = ';'.join(self._stack)
+        self._stack.pop()
+        child_time = self._child_times.pop()
+        if self._child_times:
+            self._child_times[-1] += elapsed
+        self.calls[name] += 1
+        self.timings[name] += elapsed
+        self.self_times[path] += elapsed - child_time
+
+    def folded(self) -> str:
+        """
+        The nested probes and timers in the collapsed stack format read by
+        flamegraph.pl and speedscope, weighted by self time in microseconds.
+        """
+        return ''.join(
+            f'{path} {round(seconds * 1e6)}\n'
+            for path, seconds in sorted(self.self_times.items())
+            if round(seconds * 1e6) > 0
+        )
+
+
+_recorder: Optional[Recorder] = (
+    Recorder() if os.environ.get(ENV_VAR, '') not in ('', '0') else None
+)
+
+
+def enable() -> Recorder:
+    global _recorder
+    if _recorder is None:
+        _recorder = Recorder()
+    return _recorder
+
+
+def disable() -> None:
+    global _recorder
+    _recorder = None
+
+
+def recorder() -> Optional[Recorder]:
+    return _recorder
+
+
+def count(name: str, n: int = 1) -> None:
+    if _recorder is not None:
+        _recorder.counters[name] += n
+
+
+@contextmanager
+def _timer(recorder: Recorder, name: str) -> Iterator[None]:
+    recorder.enter(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        recorder.exit(name, time.perf_counter() - start)
+
+
+@contextmanager
+def _no_timer() -> Iterator[None]:
+    yield
+
+
+def timer(name: str) -> ContextManager[None]:
+    if _recorder is None:
+        return _no_timer()
+    return _timer(_recorder, name)
+
+
+def probe(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    "Counts and times every call of the decorated function when enabled"
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        if _recorder is None:
+            return func
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            recorder = _recorder
+            if recorder is None:
+                return func(*args, **kwargs)
+            recorder.enter(name)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                recorder.exit(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def record_allocations(name: str) -> None:
+    "Keeps the top allocation sites while tracemalloc is tracing"
+    import tracemalloc
+
+    if _recorder is None or not tracemalloc.is_tracing():
+        return
+    statistics = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    )).statistics('lineno')
+    _recorder.allocations[name] = [
+        (str(statistic.traceback), statistic.size)
+        for statistic in statistics[:TOP_ALLOCATIONS]
+    ]
+
+
+def format_report(recorder: Recorder) -> str:
+    lines = []
+    if recorder.timings:
+        lines.append(
+            f"{'calls':>10}  {'total (s)':>10}  {'per call (us)':>13}  timer"
+        )
+        for name, total in sorted(
+            recorder.timings.items(), key=lambda item: -item[1]
+        ):
+            calls = recorder.calls[name]
+            lines.append(
+                f"{calls:>10}  {total:>10.4f}  "
+                f"{total / calls * 1e6:>13.2f}  {name}"
+            )
+    if recorder.counters:
+        lines.append(f"{'count':>10}  counter")
+        for name, value in sorted(recorder.counters.items()):
+            lines.append(f"{value:>10}  {name}")
+    for name, allocations in sorted(recorder.allocations.items()):
+        lines.append(f"{'KiB':>10}  allocated by {name}")
+        for site, size in allocations:
+            lines.append(f"{size / 1024:>10.1f}  {site}")
+    return '\n'.join(lines)
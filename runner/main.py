@@ -0,0 +1,481 @@
+from dataclasses import asdict, dataclass
+import importlib
+import os.path
+import sys
+import time
+import tracemalloc
+from typing import (
+    Callable, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING, TypeVar,
+)
+
+from . import instrument
+from .cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, ParseCache
+from .cache import source_fingerprint
+from .memory import day_budgets, format_budget_violations, MIB
+from .memory import peak_rss, reset_peak_rss
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
+ROOT_DIR = os.path.dirname(os.path.abspath(SCRIPT_DIR))
+
+A = TypeVar('A')
+B = TypeVar('B')
+
+PARSE_STAGE = 'parse'
+SOLVER_STAGES = {'part_1': 'solve_1', 'part_2': 'solve_2'}
+
+
+@dataclass(frozen=True)
+class Day:
+    number: int
+    input_path: str
+    source_path: str
+    parse_input: Callable[[str], object]
+    solvers: Dict[str, Callable[[object], object]]
+
+
+@dataclass(frozen=True)
+class Measurement:
+    wall_time: float
+    cpu_time: float
+    peak_memory: Optional[int]
+    peak_rss: Optional[int]
+
+
+@dataclass(frozen=True)
+class StageReport:
+    day: int
+    stage: str
+    wall_time: float
+    cpu_time: float
+    peak_memory: Optional[int]
+    peak_rss: Optional[int]
+    answer: Optional[str]
+    cached: bool = False
+
+    @classmethod
+    def from_measurement(
+        cls,
+        day: int,
+        stage: str,
+        measurement: Measurement,
+        answer: Optional[str],
+        cached: bool = False,
+    ) -> "StageReport":
+        return cls(
+            day,
+            stage,
+            measurement.wall_time,
+            measurement.cpu_time,
+            measurement.peak_memory,
+            measurement.peak_rss,
+            answer,
+            cached,
+        )
+
+
+def day_package(number: int) -> str:
+    return f'day{number:02d}'
+
+
+def available_days() -> List[int]:
+    return sorted(
+        int(entry.removeprefix('day'))
+        for entry in os.listdir(ROOT_DIR)
+        if entry.startswith('day')
+        and entry.removeprefix('day').isdigit()
+        and os.path.isfile(os.path.join(ROOT_DIR, entry, 'main.py'))
+    )
+
+
+def load_day(number: int) -> Day:
+    package = day_package(number)
+    module = importlib.import_module(f'{package}.main')
+    if not hasattr(module, 'parse_input'):
+        raise ValueError(f"{package} does not define parse_input")
+    solvers = {
+        stage: getattr(module, func_name)
+        for stage, func_name in SOLVER_STAGES.items()
+        if hasattr(module, func_name)
+    }
+    return Day(
+        number,
+        os.path.join(ROOT_DIR, package, 'input.txt'),
+        os.path.join(ROOT_DIR, package, 'main.py'),
+        module.parse_input,
+        solvers,
+    )
+
+
+def measure(
+    func: Callable[[A], B],
+    arg: A,
+    trace_memory: bool = True,
+    name: Optional[str] = None,
+) -> Tuple[B, Measurement]:
+    """
+    When named, the call is also timed and its allocations kept by
+    instrument. Tracing memory slows the call down several-fold, so times
+    measured with trace_memory are only comparable with each other.
+    """
+    reset_peak_rss()
+    if trace_memory:
+        tracemalloc.start()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        if name is None:
+            result = func(arg)
+        else:
+            with instrument.timer(name):
+                result = func(arg)
+        cpu_time = time.process_time() - cpu_start
+        wall_time = time.perf_counter() - wall_start
+        peak_memory = (
+            tracemalloc.get_traced_memory()[1] if trace_memory else None
+        )
+        if name is not None:
+            instrument.record_allocations(name)
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return result, Measurement(wall_time, cpu_time, peak_memory, peak_rss())
+
+
+def stage_name(number: int, stage: str) -> str:
+    return f'{day_package(number)}.{stage}'
+
+
+def read_input(day: Day) -> str:
+    with open(day.input_path, 'r') as f:
+        return f.read()
+
+
+def parse_day(
+    day: Day,
+    trace_memory: bool = False,
+    cache: Optional[ParseCache] = None,
+) -> Tuple[object, bool, Measurement]:
+    """
+    Parses the day's input, going through the cache when one is given. The
+    cache entries are versioned by the day's source so editing a parser
+    invalidates what it produced before.
+    """
+    raw_input = read_input(day)
+    name = stage_name(day.number, PARSE_STAGE)
+    if cache is None:
+        parsed, measurement = measure(
+            day.parse_input, raw_input, trace_memory, name
+        )
+        return parsed, False, measurement
+    version = source_fingerprint(day.source_path)
+    (parsed, cached), measurement = measure(
+        lambda raw: cache.load_or_parse(
+            day_package(day.number), version, raw, day.parse_input
+        ),
+        raw_input,
+        trace_memory,
+        name,
+    )
+    return parsed, cached, measurement
+
+
+def run_day(
+    day: Day,
+    trace_memory: bool = False,
+    cache: Optional[ParseCache] = None,
+) -> List[StageReport]:
+    parsed, cached, measurement = parse_day(day, trace_memory, cache)
+    reports = [
+        StageReport.from_measurement(
+            day.number, PARSE_STAGE, measurement, None, cached
+        )
+    ]
+    for stage, solver in day.solvers.items():
+        answer, measurement = measure(
+            solver, parsed, trace_memory, stage_name(day.number, stage)
+        )
+        reports.append(StageReport.from_measurement(
+            day.number, stage, measurement, str(answer)
+        ))
+    return reports
+
+
+def run_days(
+    numbers: Sequence[int],
+    trace_memory: bool = False,
+    cache: Optional[ParseCache] = None,
+) -> List[StageReport]:
+    return [
+        report
+        for number in numbers
+        for report in run_day(load_day(number), trace_memory, cache)
+    ]
+
+
+def parse_stage(
+    number: int,
+    trace_memory: bool,
+    cache: Optional[ParseCache],
+) -> Tuple[object, bool, Measurement]:
+    return parse_day(load_day(number), trace_memory, cache)
+
+
+def solve_stage(
+    number: int,
+    stage: str,
+    parsed: object,
+    trace_memory: bool,
+) -> Tuple[str, Measurement]:
+    solver = load_day(number).solvers[stage]
+    answer, measurement = measure(solver, parsed, trace_memory)
+    return str(answer), measurement
+
+
+def run_days_parallel(
+    numbers: Sequence[int],
+    jobs: Optional[int] = None,
+    trace_memory: bool = False,
+    cache: Optional[ParseCache] = None,
+) -> List[StageReport]:
+    """
+    Each day is parsed once in a worker and the parsed input is then shipped
+    to one worker per part, so the parts of a day run concurrently too.
+    Reports come back in the same order as run_days regardless of which
+    stage finishes first.
+    """
+    # imported here since the pool machinery alone doubles startup time
+    from concurrent.futures import as_completed, ProcessPoolExecutor
+
+    order = [
+        (number, stage)
+        for number in numbers
+        for stage in [PARSE_STAGE, *load_day(number).solvers]
+    ]
+    reports: Dict[Tuple[int, str], StageReport] = {}
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        parse_futures = {
+            executor.submit(parse_stage, number, trace_memory, cache): number
+            for number in numbers
+        }
+        solve_futures: Dict[Future[Tuple[str, Measurement]], Tuple[int, str]]
+        solve_futures = {}
+        for parse_future in as_completed(parse_futures):
+            number = parse_futures[parse_future]
+            parsed, cached, measurement = parse_future.result()
+            reports[number, PARSE_STAGE] = StageReport.from_measurement(
+                number, PARSE_STAGE, measurement, None, cached
+            )
+            for stage in load_day(number).solvers:
+                solve_future = executor.submit(
+                    solve_stage, number, stage, parsed, trace_memory
+                )
+                solve_futures[solve_future] = (number, stage)
+        for solve_future in as_completed(solve_futures):
+            number, stage = solve_futures[solve_future]
+            answer, measurement = solve_future.result()
+            reports[number, stage] = StageReport.from_measurement(
+                number, stage, measurement, answer
+            )
+    return [reports[key] for key in order]
+
+
+def budget_violations(
+    reports: Sequence[StageReport],
+    budgets: Dict[int, int],
+) -> List[Tuple[str, int, int]]:
+    """
+    Stages whose memory went over their day's budget. The tracemalloc peak is
+    used when it was traced as it only counts the solution's own objects,
+    otherwise the peak RSS.
+    """
+    violations = []
+    for report in reports:
+        used = (
+            report.peak_memory if report.peak_memory is not None
+            else report.peak_rss
+        )
+        budget = budgets.get(report.day)
+        if used is not None and budget is not None and used > budget:
+            violations.append(
+                (stage_name(report.day, report.stage), used, budget)
+            )
+    return violations
+
+
+def format_table(reports: Sequence[StageReport]) -> str:
+    header = (
+        f"{'day':>3}  {'stage':<6}  {'wall (s)':>9}  {'cpu (s)':>9}  "
+        f"{'peak (KiB)':>10}  {'rss (MiB)':>9}  answer"
+    )
+    lines = [header, '-' * len(header)]
+    for report in reports:
+        peak = (
+            '-' if report.peak_memory is None
+            else f'{report.peak_memory / 1024:.1f}'
+        )
+        rss = (
+            '-' if report.peak_rss is None
+            else f'{report.peak_rss / MIB:.1f}'
+        )
+        answer = '' if report.answer is None else report.answer
+        if report.cached:
+            answer = '(cached)'
+        lines.append((
+            f"{report.day:>3}  {report.stage:<6}  {report.wall_time:>9.4f}  "
+            f"{report.cpu_time:>9.4f}  {peak:>10}  {rss:>9}  {answer}"
+        ).rstrip())
+    return '\n'.join(lines)
+
+
+def format_json(reports: Sequence[StageReport]) -> str:
+    import json
+
+    return json.dumps([asdict(report) for report in reports], indent=2)
+
+
+@dataclass(frozen=True)
+class Options:
+    days: List[int]
+    output_format: str
+    trace_memory: bool
+    jobs: int
+    cache: Optional[ParseCache]
+    instrument: bool
+    flamegraph: Optional[str]
+    profile: Optional[str]
+    memory_budgets: Dict[int, int]
+
+
+def parse_args(argv: Optional[Sequence[str]]) -> Options:
+    from argparse import ArgumentParser
+
+    parser = ArgumentParser(
+        description='Run advent of code solutions and time each stage'
+    )
+    parser.add_argument(
+        'days', metavar='DAY', type=int, nargs='*',
+        help='days to run (default: all)',
+    )
+    parser.add_argument(
+        '--format', choices=['table', 'json'], default='table',
+        help='output format (default: table)',
+    )
+    memory = parser.add_mutually_exclusive_group()
+    memory.add_argument(
+        '--memory', dest='trace_memory', action='store_true',
+        help='also measure each stage\'s tracemalloc peak; tracing slows '
+             'stages down several-fold, so their times are inflated',
+    )
+    memory.add_argument(
+        '--no-memory', dest='trace_memory', action='store_false',
+        help='skip tracemalloc peak memory measurement (the default)',
+    )
+    parser.add_argument(
+        '-j', '--jobs', type=int, nargs='?', default=1,
+        const=os.cpu_count() or 1,
+        help='run days and parts in a pool of JOBS processes '
+             '(default: 1, bare -j: one per core)',
+    )
+    parser.add_argument(
+        '--cache', action='store_true',
+        help='reuse parsed input from earlier runs',
+    )
+    parser.add_argument(
+        '--cache-dir', default=DEFAULT_CACHE_DIR,
+        help=f'where to keep parsed input (default: {DEFAULT_CACHE_DIR})',
+    )
+    parser.add_argument(
+        '--cache-size', type=int, default=DEFAULT_MAX_BYTES // 2**20,
+        metavar='MIB',
+        help='evict the least recently used entries beyond this size '
+             f'(default: {DEFAULT_MAX_BYTES // 2**20})',
+    )
+    parser.add_argument(
+        '--instrument', action='store_true',
+        help='report the counters and timers solvers record into, as does '
+             f'setting {instrument.ENV_VAR}=1',
+    )
+    parser.add_argument(
+        '--flamegraph', metavar='PATH',
+        help='write the instrumented timers as collapsed stacks for '
+             'flamegraph.pl or speedscope, implies --instrument',
+    )
+    parser.add_argument(
+        '--profile', metavar='PATH',
+        help='run under cProfile and dump its stats to PATH',
+    )
+    parser.add_argument(
+        '--memory-budget', metavar='[DAY=]MIB', action='append', default=[],
+        help='fail the run when a stage of DAY, or of every day, uses more '
+             'memory than this; may be repeated',
+    )
+    args = parser.parse_args(argv)
+    jobs: int = args.jobs
+    if jobs < 1:
+        parser.error(f"--jobs must be at least 1, got {jobs}")
+    cache_size: int = args.cache_size
+    if cache_size < 0:
+        parser.error(f"--cache-size can not be negative, got {cache_size}")
+    use_instrument = args.instrument or args.flamegraph is not None
+    if jobs > 1 and (use_instrument or args.profile is not None):
+        parser.error("--instrument and --profile only work with --jobs 1")
+    days: List[int] = args.days or available_days()
+    try:
+        memory_budgets = day_budgets(days, args.memory_budget)
+    except ValueError as e:
+        parser.error(f"invalid --memory-budget: {e}")
+    return Options(
+        days=days,
+        output_format=args.format,
+        trace_memory=args.trace_memory,
+        jobs=jobs,
+        cache=(
+            ParseCache(args.cache_dir, cache_size * 2**20)
+            if args.cache else None
+        ),
+        instrument=use_instrument,
+        flamegraph=args.flamegraph,
+        profile=args.profile,
+        memory_budgets=memory_budgets,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    options = parse_args(argv)
+    if options.instrument:
+        # probes are only installed in days imported after this
+        instrument.enable()
+    if options.profile is not None:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        reports = profiler.runcall(
+            run_days, options.days, options.trace_memory, options.cache
+        )
+        profiler.dump_stats(options.profile)
+    elif options.jobs == 1:
+        reports = run_days(options.days, options.trace_memory, options.cache)
+    else:
+        reports = run_days_parallel(
+            options.days, options.jobs, options.trace_memory, options.cache
+        )
+    if options.output_format == 'json':
+        print(format_json(reports))
+    else:
+        print(format_table(reports))
+    recorder = instrument.recorder()
+    if recorder is not None:
+        print(instrument.format_report(recorder), file=sys.stderr)
+        if options.flamegraph is not None:
+            with open(options.flamegraph, 'w') as f:
+                f.write(recorder.folded())
+    violations = budget_violations(reports, options.memory_budgets)
+    if violations:
+        sys.exit(format_budget_violations(violations))
+
+
+if __name__ == "__main__":
+    main()
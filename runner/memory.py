@@ -0,0 +1,75 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+PROC_STATUS = '/proc/self/status'
+CLEAR_REFS = '/proc/self/clear_refs'
+MIB = 2**20
+
+
+def reset_peak_rss() -> bool:
+    """
+    Resets the process' peak RSS to its current RSS so the next peak_rss
+    only covers what ran in between. Only Linux supports this; elsewhere
+    peak_rss stays the peak of the whole process.
+    """
+    try:
+        with open(CLEAR_REFS, 'w') as f:
+            f.write('5')
+    except OSError:
+        return False
+    return True
+
+
+def peak_rss() -> Optional[int]:
+    "Peak resident set size in bytes"
+    try:
+        with open(PROC_STATUS, 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    import sys
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports KiB, macOS bytes
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def parse_budget(raw_budget: str) -> Tuple[Optional[int], int]:
+    "DAY=MIB for one day or a bare MIB for every day, returned in bytes"
+    raw_day, _, raw_mib = raw_budget.rpartition('=')
+    day = int(raw_day) if raw_day else None
+    mib = float(raw_mib)
+    if mib <= 0:
+        raise ValueError(f"memory budget must be positive, got {raw_mib}")
+    return day, int(mib * MIB)
+
+
+def day_budgets(
+    days: Iterable[int],
+    raw_budgets: Iterable[str],
+) -> Dict[int, int]:
+    default = None
+    budgets = {}
+    for raw_budget in raw_budgets:
+        day, budget = parse_budget(raw_budget)
+        if day is None:
+            default = budget
+        else:
+            budgets[day] = budget
+    if default is not None:
+        for day in days:
+            budgets.setdefault(day, default)
+    return budgets
+
+
+def format_budget_violations(violations: List[Tuple[str, int, int]]) -> str:
+    return '\n'.join(
+        f"{name} used {used / MIB:.2f} MiB, over its budget of "
+        f"{budget / MIB:.2f} MiB"
+        for name, used, budget in violations
+    )
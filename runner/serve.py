@@ -0,0 +1,120 @@
+"""
+A fast-start, optionally resident, entry point for calling single days from
+shell pipelines. It imports nothing but the day being solved, so its cost is
+interpreter startup plus that day's own imports. Without a DAY argument it
+stays resident and answers one request per line of stdin, each "DAY [PATH]",
+with the answers of that request on one tab separated line.
+"""
+import importlib
+import os.path
+import sys
+import time
+from typing import Iterable, List, Optional, Sequence, TextIO, Tuple
+
+SCRIPT_DIR = os.path.dirname(os.path.relpath(__file__))
+ROOT_DIR = os.path.dirname(os.path.abspath(SCRIPT_DIR))
+
+SOLVERS = ('solve_1', 'solve_2')
+USAGE = (
+    'usage: python -m runner.serve [--timings] [--import-times] [DAY [PATH]]'
+)
+
+
+def solve(number: int, path: Optional[str] = None) -> List[str]:
+    package = f'day{number:02d}'
+    module = importlib.import_module(f'{package}.main')
+    if path is None:
+        path = os.path.join(ROOT_DIR, package, 'input.txt')
+    with open(path, 'r') as f:
+        parsed = module.parse_input(f.read())
+    return [
+        str(getattr(module, solver)(parsed))
+        for solver in SOLVERS
+        if hasattr(module, solver)
+    ]
+
+
+def parse_request(request: str) -> Tuple[int, Optional[str]]:
+    day, *path = request.strip().split(maxsplit=1)
+    return int(day), (path[0] if path else None)
+
+
+def import_times(number: int) -> List[Tuple[int, int, str]]:
+    """
+    The (self, cumulative) microseconds of every module imported by a fresh
+    interpreter loading the day, as reported by -X importtime.
+    """
+    import subprocess
+
+    result = subprocess.run(
+        [
+            sys.executable, '-X', 'importtime', '-c',
+            f'import day{number:02d}.main',
+        ],
+        cwd=ROOT_DIR, capture_output=True, text=True, check=True,
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        raw_self, raw_cumulative, name = line.split(':', 1)[1].split('|')
+        times.append((int(raw_self), int(raw_cumulative), name.strip()))
+    return times
+
+
+def format_import_times(times: List[Tuple[int, int, str]]) -> str:
+    lines = [f"{'self (ms)':>9}  {'cumul (ms)':>10}  module"]
+    for self_us, cumulative_us, name in sorted(times, reverse=True):
+        lines.append(
+            f"{self_us / 1000:>9.2f}  {cumulative_us / 1000:>10.2f}  {name}"
+        )
+    total = sum(self_us for self_us, _, _ in times)
+    lines.append(f"{total / 1000:>9.2f}  {'':>10}  total")
+    return '\n'.join(lines)
+
+
+def serve(
+    requests: Iterable[str],
+    out: TextIO,
+    timings: Optional[TextIO] = None,
+) -> None:
+    for request in requests:
+        if not request.strip():
+            continue
+        start = time.perf_counter()
+        try:
+            answers = solve(*parse_request(request))
+        except Exception as e:
+            answers = [f'error: {e!r}']
+        print('\t'.join(answers), file=out, flush=True)
+        if timings is not None:
+            elapsed = time.perf_counter() - start
+            print(f'{request.strip()}\t{elapsed * 1000:.3f} ms', file=timings)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = list(sys.argv[1:] if argv is None else argv)
+    flags = {arg for arg in args if arg.startswith('--')}
+    positional = [arg for arg in args if not arg.startswith('--')]
+    if (
+        flags - {'--timings', '--import-times'}
+        or len(positional) > 2
+        or (positional and not positional[0].isdigit())
+        or ('--import-times' in flags and not positional)
+    ):
+        sys.exit(USAGE)
+    timings = sys.stderr if '--timings' in flags else None
+
+    if not positional:
+        serve(sys.stdin, sys.stdout, timings)
+        return
+
+    request = ' '.join(positional)
+    if '--import-times' in flags:
+        number, _ = parse_request(request)
+        print(format_import_times(import_times(number)), file=sys.stderr)
+    serve([request], sys.stdout, timings)
+
+
+if __name__ == "__main__":
+    main()
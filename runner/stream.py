@@ -0,0 +1,91 @@
+from contextlib import contextmanager
+import io
+import sys
+from typing import (
+    Callable, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple,
+    Union,
+)
+
+STDIN = '-'
+STREAM_SOLVER = 'solve_stream'
+
+Source = Union[str, Iterable[str]]
+
+
+@contextmanager
+def open_input(path: Optional[str] = None) -> Iterator[TextIO]:
+    "stdin when path is None or '-', which is left open afterwards"
+    if path is None or path == STDIN:
+        yield sys.stdin
+        return
+    with open(path, 'r') as f:
+        yield f
+
+
+def iter_lines(source: Source) -> Iterator[str]:
+    """
+    Lazily yields the stripped, non-blank lines of a string or of anything
+    that iterates over lines, such as an open file.
+    """
+    if isinstance(source, str):
+        source = io.StringIO(source)
+    for line in source:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def iter_records(source: Source) -> Iterator[List[str]]:
+    "Lazily yields the lines of each blank line separated record"
+    if isinstance(source, str):
+        source = io.StringIO(source)
+    record: List[str] = []
+    for line in source:
+        line = line.strip()
+        if line:
+            record.append(line)
+        elif record:
+            yield record
+            record = []
+    if record:
+        yield record
+
+
+def load_stream_solver(number: int) -> Callable[[Source], Tuple[int, ...]]:
+    import importlib
+
+    package = f'day{number:02d}'
+    module = importlib.import_module(f'{package}.main')
+    if not hasattr(module, STREAM_SOLVER):
+        raise ValueError(f"{package} does not define {STREAM_SOLVER}")
+    solver: Callable[[Source], Tuple[int, ...]] = getattr(
+        module, STREAM_SOLVER
+    )
+    return solver
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    # days import this module, so it keeps its own imports to a minimum
+    from argparse import ArgumentParser
+
+    parser = ArgumentParser(
+        description='Solve a day in one pass over its input, '
+                    'without holding the input in memory'
+    )
+    parser.add_argument('day', metavar='DAY', type=int)
+    parser.add_argument(
+        'path', metavar='PATH', nargs='?', default=STDIN,
+        help=f'input file (default: {STDIN}, stdin)',
+    )
+    args = parser.parse_args(argv)
+    try:
+        solver = load_stream_solver(args.day)
+    except ValueError as e:
+        parser.error(str(e))
+    with open_input(args.path) as f:
+        for answer in solver(f):
+            print(answer)
+
+
+if __name__ == "__main__":
+    main()
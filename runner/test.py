@@ -0,0 +1,464 @@
+import io
+import json
+from pathlib import Path
+import sys
+from typing import Iterator, List
+
+import pytest
+
+from . import (
+    batch, benchmark, cache, instrument, main, memory, serve, stream,
+)
+
+
+def test_main() -> None:
+    main.main(['0', '5'])
+
+
+def test_available_days() -> None:
+    assert main.available_days() == list(range(26))
+
+
+def test_load_day() -> None:
+    day = main.load_day(25)
+    assert day.number == 25
+    assert list(day.solvers) == ['part_1']
+
+
+def test_run_day() -> None:
+    reports = main.run_day(main.load_day(5), trace_memory=True)
+    assert [report.stage for report in reports] == [
+        'parse', 'part_1', 'part_2'
+    ]
+    assert [report.answer for report in reports] == [None, '989', '548']
+    assert all(report.peak_memory is not None for report in reports)
+
+
+def test_run_day_without_memory() -> None:
+    reports = main.run_day(main.load_day(5))
+    assert all(report.peak_memory is None for report in reports)
+
+
+@pytest.mark.parametrize(
+    ['argv', 'trace_memory'],
+    ((['5'], False), (['5', '--memory'], True), (['5', '--no-memory'], False)),
+)
+def test_parse_args_memory(argv: List[str], trace_memory: bool) -> None:
+    assert main.parse_args(argv).trace_memory is trace_memory
+
+
+def test_measure() -> None:
+    result, measurement = main.measure(lambda n: list(range(n)), 10_000)
+    assert result == list(range(10_000))
+    assert measurement.wall_time >= 0
+    assert measurement.cpu_time >= 0
+    assert measurement.peak_memory is not None
+    assert measurement.peak_memory > 10_000
+
+
+def test_format_table() -> None:
+    table = main.format_table(main.run_days([5]))
+    header, rule, *rows = table.splitlines()
+    assert 'wall (s)' in header
+    assert len(rows) == 3
+    assert rows[1].endswith('989')
+
+
+def test_format_json() -> None:
+    reports = main.run_days([0])
+    decoded = json.loads(main.format_json(reports))
+    assert [record['stage'] for record in decoded] == [
+        'parse', 'part_1', 'part_2'
+    ]
+    assert decoded[1]['answer'] == 'hello\n'
+
+
+def test_run_days_parallel() -> None:
+    sequential = main.run_days([0, 2, 5])
+    parallel = main.run_days_parallel([0, 2, 5], jobs=2)
+    assert (
+        [(report.day, report.stage, report.answer) for report in parallel] ==
+        [(report.day, report.stage, report.answer) for report in sequential]
+    )
+
+
+def test_main_parallel() -> None:
+    main.main(['0', '5', '--jobs', '2', '--no-memory'])
+
+
+def test_run_day_cached(tmp_path: Path) -> None:
+    parse_cache = cache.ParseCache(str(tmp_path))
+    first = main.run_day(main.load_day(5), cache=parse_cache)
+    second = main.run_day(main.load_day(5), cache=parse_cache)
+    assert [report.cached for report in first] == [False, False, False]
+    assert [report.cached for report in second] == [True, False, False]
+    assert (
+        [report.answer for report in first] ==
+        [report.answer for report in second]
+    )
+    assert main.format_table(second).splitlines()[2].endswith('(cached)')
+
+
+def test_main_cached(tmp_path: Path) -> None:
+    main.main(['2', '5', '--cache', '--cache-dir', str(tmp_path), '-j', '2'])
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_parse_cache_hit(tmp_path: Path) -> None:
+    calls: List[str] = []
+
+    def parse(raw: str) -> List[str]:
+        calls.append(raw)
+        return raw.split()
+
+    parse_cache = cache.ParseCache(str(tmp_path))
+    assert parse_cache.load_or_parse('day', 'v1', 'a b', parse) == (
+        ['a', 'b'], False
+    )
+    assert parse_cache.load_or_parse('day', 'v1', 'a b', parse) == (
+        ['a', 'b'], True
+    )
+    assert parse_cache.load_or_parse('day', 'v1', 'c', parse) == (
+        ['c'], False
+    )
+    assert calls == ['a b', 'c']
+
+
+def test_parse_cache_drops_stale(tmp_path: Path) -> None:
+    parse_cache = cache.ParseCache(str(tmp_path))
+    parse_cache.load_or_parse('day', 'v1', 'a', str.upper)
+    parse_cache.load_or_parse('other', 'v1', 'a', str.upper)
+    assert parse_cache.load_or_parse('day', 'v2', 'a', str.upper) == (
+        'A', False
+    )
+    assert sorted(path.name.split('-')[:2] for path in tmp_path.iterdir()) == [
+        ['day', 'v2'], ['other', 'v1'],
+    ]
+
+
+def test_parse_cache_evicts(tmp_path: Path) -> None:
+    parse_cache = cache.ParseCache(str(tmp_path), max_bytes=2_500)
+    for n in range(5):
+        parse_cache.load_or_parse('day', 'v1', str(n), lambda raw: raw * 1000)
+    assert len(list(tmp_path.iterdir())) == 2
+    assert parse_cache.load_or_parse('day', 'v1', '4', str)[1]
+    assert not parse_cache.load_or_parse('day', 'v1', '0', str)[1]
+
+
+def test_parse_cache_corrupt_entry(tmp_path: Path) -> None:
+    parse_cache = cache.ParseCache(str(tmp_path))
+    parse_cache.load_or_parse('day', 'v1', 'a', str.upper)
+    [entry] = tmp_path.iterdir()
+    entry.write_bytes(b'not a pickle')
+    assert parse_cache.load_or_parse('day', 'v1', 'a', str.upper) == (
+        'A', False
+    )
+    assert parse_cache.load_or_parse('day', 'v1', 'a', str.upper) == (
+        'A', True
+    )
+
+
+def test_time_call() -> None:
+    calls: List[int] = []
+
+    def call() -> int:
+        calls.append(len(calls))
+        return len(calls)
+
+    result, elapsed = benchmark.time_call(call, min_rounds=3, min_time=0)
+    assert result == len(calls) == 3
+    assert elapsed >= 0
+
+
+def test_baseline_store_round_trip(tmp_path: Path) -> None:
+    path = str(tmp_path / 'benchmarks.json')
+    assert benchmark.BaselineStore.load(path).baselines == {}
+
+    store = benchmark.BaselineStore({'a': 1.0, 'b': 2.0})
+    store.results.update({'a': 4.0, 'b': 3.0, 'c': 5.0})
+    store.save(path)
+    assert benchmark.BaselineStore.load(path).baselines == {
+        'a': 1.0, 'b': 2.0, 'c': 5.0,
+    }
+    store.save(path, update=['b'])
+    assert benchmark.BaselineStore.load(path).baselines == {
+        'a': 1.0, 'b': 3.0, 'c': 5.0,
+    }
+
+
+def test_matches_any() -> None:
+    name = 'day08/bench.py::test_solve_2[100]'
+    assert benchmark.matches_any(name, [name])
+    assert benchmark.matches_any(name, ['day07/*', 'day08/*'])
+    assert not benchmark.matches_any(name, ['day08/bench.py::test_solve_1*'])
+    assert not benchmark.matches_any(name, [])
+
+
+def test_benchmark_records_result() -> None:
+    store = benchmark.BaselineStore({})
+    bench = benchmark.Benchmark('fast', store)
+    assert bench(lambda: 42) == 42
+    assert 'fast' in store.results
+
+
+def test_benchmark_regression() -> None:
+    store = benchmark.BaselineStore({'slow': 1e-9})
+    bench = benchmark.Benchmark(
+        'slow', store, threshold=2.0, min_baseline=0.0
+    )
+    with pytest.raises(benchmark.PerformanceRegression):
+        bench(lambda: sum(range(10_000)))
+
+
+def test_benchmark_min_baseline() -> None:
+    store = benchmark.BaselineStore({'tiny': 1e-9})
+    bench = benchmark.Benchmark('tiny', store, min_baseline=1.0)
+    bench(lambda: sum(range(10_000)))
+
+
+def test_benchmark_no_compare() -> None:
+    store = benchmark.BaselineStore({'slow': 1e-9})
+    bench = benchmark.Benchmark('slow', store, compare=False)
+    bench(lambda: sum(range(10_000)))
+    assert store.results['slow'] > 1e-9
+
+
+def test_iter_lines() -> None:
+    raw_input = ' a \n\nb\r\n'
+    assert list(stream.iter_lines(raw_input)) == ['a', 'b']
+    assert list(stream.iter_lines(io.StringIO(raw_input))) == ['a', 'b']
+
+
+def test_iter_records() -> None:
+    raw_input = '\na\nb\n\n\nc\n'
+    assert list(stream.iter_records(raw_input)) == [['a', 'b'], ['c']]
+    assert list(stream.iter_records(io.StringIO(raw_input + '\n'))) == [
+        ['a', 'b'], ['c'],
+    ]
+
+
+def test_stream_main_from_path() -> None:
+    stream.main(['5', main.load_day(5).input_path])
+
+
+def test_stream_main_from_stdin(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, 'stdin', io.StringIO('1 + 2 * 3\n'))
+    assert stream.open_input().__enter__() is sys.stdin
+    stream.main(['18'])
+
+
+def test_stream_main_unsupported_day() -> None:
+    with pytest.raises(SystemExit):
+        stream.main(['25'])
+
+
+def test_serve() -> None:
+    out = io.StringIO()
+    timings = io.StringIO()
+    serve.serve(['5\n', '\n', '99\n', '2\n'], out, timings)
+    answers, error, answers_2 = out.getvalue().splitlines()
+    assert answers == '989\t548'
+    assert error.startswith('error: ')
+    assert answers_2 == '465\t294'
+    assert len(timings.getvalue().splitlines()) == 3
+
+
+def test_serve_main(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, 'stdin', io.StringIO('0\n'))
+    serve.main([])
+    serve.main(['5', main.load_day(5).input_path, '--timings'])
+    with pytest.raises(SystemExit):
+        serve.main(['--import-times'])
+
+
+def test_import_times() -> None:
+    times = serve.import_times(5)
+    assert 'day05.main' in {name for _, _, name in times}
+    assert serve.format_import_times(times).endswith('total')
+
+
+def test_runner_imports_lazily() -> None:
+    import subprocess
+
+    result = subprocess.run(
+        [
+            sys.executable, '-c',
+            'import sys, runner.main; '
+            'print("concurrent.futures" in sys.modules, '
+            '"argparse" in sys.modules)',
+        ],
+        cwd=main.ROOT_DIR, capture_output=True, text=True, check=True,
+    )
+    assert result.stdout.split() == ['False', 'False']
+
+
+def test_day05_imports_numpy_lazily() -> None:
+    import subprocess
+
+    result = subprocess.run(
+        [
+            sys.executable, '-c',
+            'import sys, day05.main as m; '
+            'print(*m.solve_stream(["BFFFBBFRRR", "BFFFBBFRLR"]), '
+            '"numpy" in sys.modules)',
+        ],
+        cwd=main.ROOT_DIR, capture_output=True, text=True, check=True,
+    )
+    assert result.stdout.split() == ['567', '566', 'False']
+
+
+@pytest.fixture
+def recorder() -> Iterator[instrument.Recorder]:
+    was_enabled = instrument.recorder() is not None
+    instrument.disable()
+    yield instrument.enable()
+    if not was_enabled:
+        instrument.disable()
+
+
+def test_probe_disabled_is_free() -> None:
+    def func(n: int) -> int:
+        return n
+
+    if instrument.recorder() is None:
+        assert instrument.probe('func')(func) is func
+
+
+def test_probe_and_timer(recorder: instrument.Recorder) -> None:
+    @instrument.probe('inner')
+    def inner(n: int) -> int:
+        instrument.count('items', n)
+        return n
+
+    with instrument.timer('outer'):
+        assert inner(2) + inner(3) == 5
+
+    assert recorder.calls == {'outer': 1, 'inner': 2}
+    assert recorder.counters == {'items': 5}
+    assert set(recorder.self_times) == {'outer', 'outer;inner'}
+    assert recorder.timings['outer'] >= recorder.timings['inner']
+    assert all(
+        line.rsplit(' ', 1)[1].isdigit()
+        for line in recorder.folded().splitlines()
+    )
+    assert 'inner' in instrument.format_report(recorder)
+
+
+def test_record_allocations(recorder: instrument.Recorder) -> None:
+    main.measure(lambda n: list(range(n)), 10_000, name='stage')
+    [(site, size)] = recorder.allocations['stage'][:1]
+    assert size > 10_000
+    assert site.startswith(__file__)
+
+
+def test_main_instrumented(
+    recorder: instrument.Recorder,
+    tmp_path: Path,
+) -> None:
+    flamegraph = tmp_path / 'stacks.folded'
+    profile = tmp_path / 'stats.prof'
+    main.main([
+        '8', '--no-memory', '--flamegraph', str(flamegraph),
+        '--profile', str(profile),
+    ])
+    assert 'day08.part_2' in flamegraph.read_text()
+    assert recorder.counters['day08.steps'] > 0
+    assert profile.stat().st_size > 0
+    with pytest.raises(SystemExit):
+        main.main(['8', '--instrument', '-j', '2'])
+
+
+def test_measure_peak_rss() -> None:
+    _, small = main.measure(lambda n: n, 0, trace_memory=False)
+    _, large = main.measure(
+        lambda n: b'x' * n, 64 * memory.MIB, trace_memory=False
+    )
+    assert small.peak_rss is not None and large.peak_rss is not None
+    if memory.reset_peak_rss():
+        assert large.peak_rss - small.peak_rss > 32 * memory.MIB
+
+
+@pytest.mark.parametrize(
+    ['raw_budget', 'expected'],
+    (
+        ('64', (None, 64 * memory.MIB)),
+        ('5=0.5', (5, memory.MIB // 2)),
+    )
+)
+def test_parse_budget(raw_budget: str, expected: object) -> None:
+    assert memory.parse_budget(raw_budget) == expected
+
+
+@pytest.mark.parametrize('raw_budget', ('0', '5=', 'five=1'))
+def test_parse_budget_invalid(raw_budget: str) -> None:
+    with pytest.raises(ValueError):
+        memory.parse_budget(raw_budget)
+
+
+def test_day_budgets() -> None:
+    assert memory.day_budgets([1, 2, 3], ['2=1', '3', '1=2']) == {
+        1: 2 * memory.MIB, 2: memory.MIB, 3: 3 * memory.MIB,
+    }
+    assert memory.day_budgets([1, 2], ['2=1']) == {2: memory.MIB}
+
+
+def test_budget_violations() -> None:
+    reports = main.run_days([5], trace_memory=True)
+    assert main.budget_violations(reports, {5: memory.MIB}) == []
+    [(name, used, budget)] = main.budget_violations(reports, {5: 20_000})
+    assert name == 'day05.parse'
+    assert used > budget == 20_000
+
+
+def test_main_memory_budget() -> None:
+    main.main([
+        '5', '--memory', '--memory-budget', '5=1', '--memory-budget', '0.001'
+    ])
+    with pytest.raises(SystemExit, match='day05.parse'):
+        main.main(['5', '--memory', '--memory-budget', '0.01'])
+    with pytest.raises(SystemExit):
+        main.main(['5', '--memory-budget', '5=-1'])
+
+
+def test_split_stream() -> None:
+    lines = io.StringIO('1\n2\n%%\n3\n%%\n\n')
+    assert list(batch.split_stream(lines)) == [
+        ('-:0', '1\n2\n'), ('-:1', '3\n'),
+    ]
+
+
+def test_iter_inputs(tmp_path: Path) -> None:
+    (tmp_path / 'b.txt').write_text('2\n')
+    (tmp_path / 'a.txt').write_text('1\n')
+    assert list(batch.iter_inputs(str(tmp_path))) == [
+        ('a.txt', '1\n'), ('b.txt', '2\n'),
+    ]
+    stream_path = tmp_path / 'a.txt'
+    stream_path.write_text('1\n--\n2\n')
+    assert [
+        raw_input for _, raw_input
+        in batch.iter_inputs(str(stream_path), separator='--')
+    ] == ['1\n', '2\n']
+
+
+@pytest.mark.parametrize('jobs', (1, 2))
+def test_solve_batch(jobs: int) -> None:
+    with open(main.load_day(5).input_path) as f:
+        raw_input = f.read()
+    inputs = [
+        ('real', raw_input), ('broken', 'not a seat'), ('again', raw_input),
+    ]
+    records = list(batch.solve_batch(5, inputs, jobs))
+    assert [record.name for record in records] == ['real', 'broken', 'again']
+    assert records[0].answers == {'part_1': '989', 'part_2': '548'}
+    assert records[0].error is None
+    assert records[1].error is not None
+    assert records[2].answers == records[0].answers
+
+
+def test_batch_main(tmp_path: Path) -> None:
+    (tmp_path / 'input.txt').write_text('939\n7,13,x,x,59,x,31,19\n')
+    batch.main(['13', str(tmp_path)])
+    (tmp_path / 'broken.txt').write_text('')
+    with pytest.raises(SystemExit):
+        batch.main(['13', str(tmp_path), '-j', '2'])